@@ -0,0 +1,235 @@
+import os
+import re
+import json
+import hashlib
+import shutil
+import time
+import logging
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+# Folder holding downloaded installers, named after their SHA-256
+CACHE_DIR = os.path.join("cache", "artifacts")
+INDEX_FILE = "index.json"
+
+# Size of the cache before the least recently used installers are removed
+DEFAULT_MAX_BYTES = 4 * 1024 ** 3
+
+# Seconds a URL without a pinned hash is trusted to serve the same file; "latest" links change over time
+URL_MAX_AGE = 7 * 24 * 3600
+
+# Downloads running at the same time while prefetching
+DEFAULT_CONNECTIONS = 4
+
+class ArtifactCache:
+    """Content-addressed cache of the installers downloaded by catalog commands.
+
+    Each file is stored once under its SHA-256, whatever URL or command it came from. The index
+    maps URLs to hashes and keeps the last use of each file for LRU eviction. A URL is downloaded
+    again after url_max_age, unless the command pins the file's hash. Files missing from the cache
+    are looked up in an optional mirror folder, under their pinned hash or the file name the command
+    saves them as, so machines without internet access can be provisioned from a shared folder.
+    """
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, mirror=None, url_max_age=URL_MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.url_max_age = url_max_age
+        self.lock = threading.Lock()
+        # One lock per URL, so the same file isn't downloaded twice into the same temporary file
+        self.url_locks = {}
+        os.makedirs(directory, exist_ok=True)
+        self.mirror = mirror
+        self.index = self._load_index()
+
+    def _index_path(self):
+        return os.path.join(self.directory, INDEX_FILE)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error("Error loading artifact index, starting empty: %s", e)
+        return {"blobs": {}, "urls": {}}
+
+    def _save_index(self):
+        temporary_path = self._index_path() + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(self.index, file)
+        os.replace(temporary_path, self._index_path())
+
+    def blob_path(self, sha256):
+        return os.path.join(self.directory, sha256[:2], sha256)
+
+    def _hit(self, sha256):
+        # Called with the lock held
+        if sha256 in self.index["blobs"] and os.path.isfile(self.blob_path(sha256)):
+            self.index["blobs"][sha256]["last_used"] = time.time()
+            self._save_index()
+            return self.blob_path(sha256)
+        return None
+
+    def lookup(self, url, sha256=None):
+        """Returns the cached file for a URL or hash, or None."""
+        with self.lock:
+            if sha256:
+                return self._hit(sha256.lower())
+            known = self.index["urls"].get(url)
+            if known and time.time() - known["fetched"] < self.url_max_age:
+                return self._hit(known["sha256"])
+            return None
+
+    def add(self, path, url=None, move=False):
+        """Stores a file in the cache and returns its hash."""
+        # download imports requests, which is slow, so it's only imported once a file is handled
+        import download
+        sha256 = download.sha256_of_file(path)
+        blob_path = self.blob_path(sha256)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        with self.lock:
+            if not os.path.isfile(blob_path):
+                if move:
+                    os.replace(path, blob_path)
+                else:
+                    shutil.copyfile(path, blob_path)
+            elif move:
+                os.remove(path)
+            self.index["blobs"][sha256] = {"size": os.path.getsize(blob_path), "last_used": time.time()}
+            if url:
+                self.index["urls"][url] = {"sha256": sha256, "fetched": time.time()}
+            self._evict(keep=sha256)
+            self._save_index()
+        return sha256
+
+    def _url_lock(self, url):
+        with self.lock:
+            return self.url_locks.setdefault(url, threading.Lock())
+
+    def _from_mirror(self, url, sha256=None, name=None):
+        # Many URLs end in names like "download" or nothing at all, so the pinned hash and the
+        # name the command saves the file as come before the URL's own name
+        names = [sha256.lower() if sha256 else None, name, url_file_name(url)]
+        for candidate in dict.fromkeys(candidate for candidate in names if candidate):
+            path = os.path.join(self.mirror, candidate)
+            if not os.path.isfile(path):
+                continue
+            import download
+            if sha256 and download.sha256_of_file(path) != sha256.lower():
+                logging.warning("Ignoring %s from the mirror, its checksum doesn't match", path)
+                continue
+            return path
+        return None
+
+    def fetch(self, url, sha256=None, on_progress=None, cancel_event=None, name=None):
+        """Returns the path of the cached file for url, downloading it first if needed.
+
+        name is the file name the command saves the file as, used to find it in the mirror.
+        """
+        with self._url_lock(url):
+            # Checked under the lock, a fetch of the same URL may have just finished
+            path = self.lookup(url, sha256)
+            if path is not None:
+                logging.info("Using cached artifact for %s", url)
+                return path
+            if self.mirror:
+                path = self._from_mirror(url, sha256, name)
+                if path is not None:
+                    logging.info("Using %s from the mirror for %s", path, url)
+                    return path
+            # Named after the URL, so an interrupted download is resumed the next time
+            temporary_path = os.path.join(self.directory, "download-%s.tmp" % hashlib.sha256(url.encode("utf-8")).hexdigest()[:16])
+            import download
+            download.download(url, temporary_path, sha256, on_progress, cancel_event)
+            return self.blob_path(self.add(temporary_path, url, move=True))
+
+    def materialize(self, url, destination, sha256=None, on_progress=None, cancel_event=None):
+        """Puts the file for url at destination, from the cache when possible."""
+        source = self.fetch(url, sha256, on_progress, cancel_event, os.path.basename(destination))
+        folder = os.path.dirname(destination)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # A copy rather than a link, the command is free to overwrite or delete its file
+        shutil.copyfile(source, destination)
+        return destination
+
+    def _evict(self, keep=None):
+        # Called with the lock held
+        blobs = self.index["blobs"]
+        total = sum(blob["size"] for blob in blobs.values())
+        for sha256 in sorted(blobs, key=lambda key: blobs[key]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            try:
+                os.remove(self.blob_path(sha256))
+            except FileNotFoundError:
+                pass
+            total -= blobs.pop(sha256)["size"]
+            for url in [url for url, known in self.index["urls"].items() if known["sha256"] == sha256]:
+                del self.index["urls"][url]
+            logging.info("Evicted artifact %s from the cache", sha256)
+
+def prefetch(items, max_connections=DEFAULT_CONNECTIONS, on_done=None, cancel_event=None):
+    """Downloads the files of several "downloads" items into the cache at the same time.
+
+    Each URL is fetched once, on at most max_connections connections. on_done is called with
+    (item, error) as each download ends, from a worker thread. Returns {url: error} for the
+    downloads that failed; the other files are then served from disk.
+    """
+    unique = {}
+    for item in items:
+        unique.setdefault(item["url"], item)
+    if not unique:
+        return {}
+    cache = get_cache()
+    errors = {}
+
+    def fetch(item):
+        try:
+            cache.fetch(item["url"], item.get("sha256"), cancel_event=cancel_event, name=item_file_name(item))
+            error = None
+        except Exception as e:
+            logging.error("Error prefetching %s: %s", item["url"], e)
+            error = errors[item["url"]] = e
+        if on_done:
+            on_done(item, error)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(int(max_connections), len(unique)))) as pool:
+        list(pool.map(fetch, unique.values()))
+    return errors
+
+def url_file_name(url):
+    return os.path.basename(urllib.parse.urlparse(url).path)
+
+def item_file_name(item):
+    """File name a "downloads" item is saved as, e.g. "7zInstaller.exe" for "%TEMP%\\7zInstaller.exe"."""
+    return os.path.basename(item.get("path", "").replace("\\", "/")) or None
+
+ENVIRONMENT_VARIABLE = re.compile(r"%([^%]+)%")
+
+def expand_path(path):
+    """Expands %VARIABLE% and $VARIABLE in a download destination declared by a command."""
+    path = ENVIRONMENT_VARIABLE.sub(lambda match: os.environ.get(match.group(1), match.group(0)), path)
+    return os.path.expandvars(path)
+
+_cache = None
+_cache_lock = threading.Lock()
+_settings = {"directory": CACHE_DIR, "max_bytes": DEFAULT_MAX_BYTES, "mirror": None}
+
+def configure(max_bytes=DEFAULT_MAX_BYTES, mirror=None, directory=CACHE_DIR):
+    """Changes the cache settings; the cache is reopened on next use."""
+    global _cache
+    with _cache_lock:
+        _settings.update(directory=directory, max_bytes=max_bytes, mirror=mirror)
+        _cache = None
+
+def get_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ArtifactCache(**_settings)
+        return _cache
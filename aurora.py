@@ -1,13 +1,19 @@
 import wx
-import wx.adv
 import subprocess
-import pickle
-import webbrowser
 import ctypes
 import os
 import sys
 import threading
 import logging
+import json
+import locale
+import unicodedata
+import functools
+import catalog
+import resultcache
+import scheduler
+import search
+import languageHandler
 
 # Log configuration
 logging.basicConfig(filename='aurora.log', level=logging.DEBUG, 
@@ -39,15 +45,22 @@ def run_as_admin():
     except Exception as e:
         logging.error("Error occurred while trying to elevate privileges: %s", e)
 
-if not is_admin():
-    run_as_admin()
-    sys.exit()
+def N_(message):
+    """Marks a message for extract_messages.py where it is translated later with _()."""
+    return message
 
-# PowerShell command to enable script execution
-powershell_command = "Set-ExecutionPolicy Unrestricted -Scope CurrentUser -Force"
+def translate_catalog_text(text):
+    """Translates a command name or description, which share the message catalog of the interface."""
+    # An empty message would return the header of the catalog
+    return _(text) if text else text
 
-# Runs PowerShell command
-subprocess.run(["powershell", "-Command", powershell_command], shell=True, check=True)
+def command_sort_key(command):
+    """Sorts commands by their displayed name, the way the interface language orders text."""
+    name = translate_catalog_text(command["name"]).casefold()
+    # Accents only break ties, so "Ábaco" sorts with the a's even where the C locale is in use;
+    # otherwise strxfrm follows the locale languageHandler sets for the chosen language
+    plain = "".join(character for character in unicodedata.normalize("NFD", name) if not unicodedata.combining(character))
+    return locale.strxfrm(plain), locale.strxfrm(name)
 
 class WelcomeDialog(wx.Dialog):
     def __init__(self, parent, id, title):
@@ -56,12 +69,12 @@ class WelcomeDialog(wx.Dialog):
         panel = wx.Panel(self)
 
         # Welcome text in the dialog box
-        welcome_text = wx.StaticText(panel, -1, "Hi, we're glad you want to try our program!")
-        disclaimer_text = wx.StaticText(panel, -1, "Remember that all changes are made by you and we are not responsible for any issues.")
-        restore_text = wx.StaticText(panel, -1, "Before doing anything, create a restore point on your PC to avoid any problems.")
+        welcome_text = wx.StaticText(panel, -1, _("Hi, we're glad you want to try our program!"))
+        disclaimer_text = wx.StaticText(panel, -1, _("Remember that all changes are made by you and we are not responsible for any issues."))
+        restore_text = wx.StaticText(panel, -1, _("Before doing anything, create a restore point on your PC to avoid any problems."))
 
         # "Ok, I want to continue" button in the dialog box
-        ok_button = wx.Button(panel, label="Okay, I want to continue")
+        ok_button = wx.Button(panel, label=_("Okay, I want to continue"))
         ok_button.Bind(wx.EVT_BUTTON, self.on_ok)
 
         # Dialog box layout
@@ -76,77 +89,518 @@ class WelcomeDialog(wx.Dialog):
     def on_ok(self, event):
         self.EndModal(wx.ID_OK)
 
+class CommandListCtrl(wx.ListCtrl):
+    """Virtual report list that reads its rows straight from the command dicts."""
+    COLUMNS = ("name", "desc", "cmd", "type")
+    LABELS = (N_("Name"), N_("Description"), N_("Command"), N_("Type"))
+    # Columns shown in the current language, looked up in the same catalog as the interface
+    TRANSLATED_COLUMNS = search.TRANSLATED_FIELDS
+
+    def __init__(self, parent):
+        super(CommandListCtrl, self).__init__(parent, -1, style=wx.LC_REPORT | wx.LC_VIRTUAL)
+        for column, width in enumerate((150, 250, 300, 100)):
+            self.InsertColumn(column, _(self.LABELS[column]), width=width)
+        self.commands = []
+
+    def set_column_labels(self):
+        for column, label in enumerate(self.LABELS):
+            item = self.GetColumn(column)
+            item.SetText(_(label))
+            self.SetColumn(column, item)
+
+    def set_commands(self, commands):
+        self.commands = commands
+        self.refresh()
+
+    def refresh(self):
+        # Only the row count and the visible rows are updated, whatever the size of the list
+        self.SetItemCount(len(self.commands))
+        self.Refresh()
+
+    def select_only(self, index):
+        item = self.GetFirstSelected()
+        while item >= 0:
+            self.Select(item, False)
+            item = self.GetNextSelected(item)
+        self.Select(index)
+        self.Focus(index)
+
+    def OnGetItemText(self, item, column):
+        text = self.commands[item].get(self.COLUMNS[column], "")
+        if self.COLUMNS[column] in self.TRANSLATED_COLUMNS:
+            return translate_catalog_text(text)
+        return text
+
 class MyFrame(wx.Frame):
     def __init__(self, parent, id, title):
         super(MyFrame, self).__init__(parent, id, title, size=(600, 400))
 
         panel = wx.Panel(self)
 
+        # Widgets labelled with a message, relabelled when the language changes
+        self.translatable = []
+
+        # Search box filtering the command list
+        self.search_label = wx.StaticText(panel, -1, "")
+        self.translated(self.search_label.SetLabel, "Search:")
+        self.search_box = wx.SearchCtrl(panel, -1, name="Search")
+        self.search_box.ShowCancelButton(True)
+        self.search_box.Bind(wx.EVT_TEXT, self.on_search)
+        self.search_box.Bind(wx.EVT_SEARCHCTRL_CANCEL_BTN, self.on_clear_search)
+
         # Command list
-        self.lista_de_comandos = wx.ListCtrl(panel, -1, style=wx.LC_REPORT)
-        self.lista_de_comandos.InsertColumn(0, "Name", width=150)
-        self.lista_de_comandos.InsertColumn(1, "Description", width=250)
-        self.lista_de_comandos.InsertColumn(2, "Command", width=300)
-        self.lista_de_comandos.InsertColumn(3, "Type", width=100)
+        self.lista_de_comandos = CommandListCtrl(panel)
 
         # Create the "Add Commands" menu
         menu_bar = wx.MenuBar()
         file_menu = wx.Menu()
-        add_command_item = file_menu.Append(wx.ID_ANY, "Add Commands", "Add a new command")
-        self.Bind(wx.EVT_MENU, self.on_add_command, add_command_item)
-        menu_bar.Append(file_menu, "Commands")
+        self.append_menu_item(file_menu, "Add Commands", "Add a new command", self.on_add_command)
+        self.append_menu_item(file_menu, "Run Selected", "Run all selected commands in parallel", self.on_run_selected)
+        self.append_menu_item(file_menu, "Cancel Running", "Stop every command that is still running", self.on_cancel_running)
+        self.append_menu_item(file_menu, "Save Selection as Profile", "Store the selected commands, in list order, as a named profile", self.on_save_profile)
+        self.append_menu_item(file_menu, "Run Profile", "Run the commands of a profile in parallel", self.on_run_profile)
+        self.append_menu_item(file_menu, "Export Profile", "Write a profile and its commands to a file for other PCs", self.on_export_profile)
+        self.append_menu_item(file_menu, "Import Profile", "Add a profile exported on another PC", self.on_import_profile)
+        menu_bar.Append(file_menu, "")
+        self.translated(functools.partial(menu_bar.SetMenuLabel, 0), "Commands")
 
         # Create the "Tools" menu and add items
         tools_menu = wx.Menu()
-        open_github_repo_item = tools_menu.Append(wx.ID_ANY, "Open GitHub Repository", "Open the repository on GitHub")
-        download_latest_github_item = tools_menu.Append(wx.ID_ANY, "Download Latest Version", "Download Latest Version from GitHub")
-        create_restore_point_item = tools_menu.Append(wx.ID_ANY, "Create Restore Point", "Create a system restore point")
-        restore_changes_item = tools_menu.Append(wx.ID_ANY, "Restore Changes", "Restore system changes to the last restore point and restart")
-        sort_commands_item = tools_menu.Append(wx.ID_ANY, "Sort Commands", "Sort commands alphabetically")
-        check_updates_item = tools_menu.Append(wx.ID_ANY, "Check Updates", "Check for updates and close Aurora")
-
-        # Bind the EVT_MENU event
-        self.Bind(wx.EVT_MENU, self.open_github_repo, open_github_repo_item)
-        self.Bind(wx.EVT_MENU, self.download_latest_github, download_latest_github_item)
-        self.Bind(wx.EVT_MENU, self.create_system_restore_point, create_restore_point_item)
-        self.Bind(wx.EVT_MENU, self.restore_changes, restore_changes_item)
-        self.Bind(wx.EVT_MENU, self.sort_commands, sort_commands_item)
-        self.Bind(wx.EVT_MENU, self.check_updates, check_updates_item)
+        self.append_menu_item(tools_menu, "Open GitHub Repository", "Open the repository on GitHub", self.open_github_repo)
+        self.append_menu_item(tools_menu, "Download Latest Version", "Download Latest Version from GitHub", self.download_latest_github)
+        self.append_menu_item(tools_menu, "Create Restore Point", "Create a system restore point", self.create_system_restore_point)
+        self.append_menu_item(tools_menu, "Restore Changes", "Restore system changes to the last restore point and restart", self.restore_changes)
+        self.append_menu_item(tools_menu, "Sort Commands", "Sort commands alphabetically", self.sort_commands)
+        self.append_menu_item(tools_menu, "Check Updates", "Check for updates and close Aurora", self.check_updates)
+        self.append_menu_item(tools_menu, "Update Channel", "Choose between stable releases and pre-releases", self.on_set_update_channel)
+        self.append_menu_item(tools_menu, "Concurrency Limit", "Set how many selected commands may run at the same time", self.on_set_concurrency)
+        self.append_menu_item(tools_menu, "PowerShell Hosts", "Set how many PowerShell hosts are kept running for faster commands", self.on_set_shell_pool_size)
+        self.append_menu_item(tools_menu, "Statistics", "Show how long each command takes to run", self.on_show_statistics)
+        self.append_menu_item(tools_menu, "Download Mirror", "Choose a folder of installers used instead of downloading them", self.on_set_download_mirror)
+        self.append_menu_item(tools_menu, "Command Timeout", "Stop commands that run longer than a time limit", self.on_set_command_timeout)
+        self.append_menu_item(tools_menu, "Clean Temporary Files", "Show how much space temporary files and browser caches use, then remove them", self.on_clean_files)
+        self.append_menu_item(tools_menu, "Language", "Choose the language of Aurora and of the command descriptions", self.on_set_language)
+        self.append_menu_item(tools_menu, "Audit Tweaks", "Show which commands are already applied on this PC", self.on_audit)
+        self.skip_applied_item = self.append_menu_item(tools_menu, "Skip Applied Tweaks", "Don't run commands whose changes are already in place",
+                                                       self.on_toggle_skip_applied, wx.ITEM_CHECK)
 
         # Append the "Tools" menu to the menu bar
-        menu_bar.Append(tools_menu, "Tools")
+        menu_bar.Append(tools_menu, "")
+        self.translated(functools.partial(menu_bar.SetMenuLabel, 1), "Tools")
         self.SetMenuBar(menu_bar)
 
+        # Status bar used to report the progress of batch runs
+        self.CreateStatusBar()
+
         # Layout
+        search_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        search_sizer.Add(self.search_label, 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        search_sizer.Add(self.search_box, 1, wx.EXPAND)
         sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(search_sizer, 0, wx.EXPAND | wx.LEFT | wx.RIGHT | wx.TOP, 10)
         sizer.Add(self.lista_de_comandos, 1, wx.EXPAND | wx.ALL, 10)
         panel.SetSizer(sizer)
 
+        # Ctrl+F moves the focus to the search box
+        focus_search_id = wx.NewIdRef()
+        self.Bind(wx.EVT_MENU, lambda event: self.search_box.SetFocus(), id=focus_search_id)
+        self.SetAcceleratorTable(wx.AcceleratorTable([(wx.ACCEL_CTRL, ord("F"), focus_search_id)]))
+
         # Bind for Enter or Space key in the command list
         self.lista_de_comandos.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_execute_command)
 
         # Bind the EVT_CONTEXT_MENU event
         self.lista_de_comandos.Bind(wx.EVT_CONTEXT_MENU, self.on_context_menu)
 
-        # Load commands from the file
-        self.commands = load_commands()
+        # Load commands and settings from the files
+        self.catalog = catalog.Catalog()
+        self.commands = self.catalog.load()
+        self.settings = load_settings()
+        # executor pulls in the shell hosts, downloads, governor and telemetry; it's imported by the
+        # first command run, see get_executor
+        self.executor = None
+        self.skip_applied_item.Check(self.settings.get("skip_applied", True))
+
+        # Cancel events of the commands and batches that are running
+        self.cancel_events = set()
+
+        # Command ids in the order of the last sort by name, so a new language sorts them again
+        self.sorted_ids = None
 
         # Populate the command list
-        for command in self.commands:
-            self.add_command_to_list(command)
+        self.search_index = search.SearchIndex(self.commands, translate=translate_catalog_text)
+        self.lista_de_comandos.set_commands(self.commands)
+
+        # Switching the language relabels this window in place, without a restart
+        languageHandler.registerLanguageChangeHandler(self.on_language_changed)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+
+    def translated(self, setter, message):
+        """Labels a widget with the translation of message and again whenever the language changes."""
+        setter(_(message))
+        self.translatable.append((setter, message))
+
+    def append_menu_item(self, menu, label, help, handler, kind=wx.ITEM_NORMAL):
+        item = menu.Append(wx.ID_ANY, _(label), _(help), kind)
+        self.Bind(wx.EVT_MENU, handler, item)
+        self.translatable.append((item.SetItemLabel, label))
+        self.translatable.append((item.SetHelp, help))
+        return item
+
+    def on_language_changed(self, language):
+        # Only the labels are replaced; the list reads its visible rows again
+        for setter, message in self.translatable:
+            setter(_(message))
+        self.lista_de_comandos.set_column_labels()
+        # Only while the user hasn't added or moved commands since sorting them
+        if self.sorted_ids is not None:
+            ids = [command.get("id") for command in self.commands]
+            present = set(ids)
+            if [key for key in self.sorted_ids if key in present] == ids:
+                self.sort_by_name()
+            else:
+                self.sorted_ids = None
+        self.search_index = search.SearchIndex(self.commands, translate=translate_catalog_text)
+        self.apply_filter()
+        self.search_label.GetParent().Layout()
+        self.SetStatusText("")
+
+    def on_destroy(self, event):
+        if event.GetEventObject() is self:
+            languageHandler.unregisterLanguageChangeHandler(self.on_language_changed)
+        event.Skip()
+
+    def on_set_language(self, event):
+        languages = languageHandler.getAvailableLanguages()
+        codes = [code for code, label in languages]
+        current = self.settings.get("language", "system")
+        dlg = wx.SingleChoiceDialog(self, _("Which language should Aurora use?"), _("Language"), [label for code, label in languages])
+        dlg.SetSelection(codes.index(current) if current in codes else len(codes) - 1)
+        if dlg.ShowModal() == wx.ID_OK:
+            self.settings["language"] = codes[dlg.GetSelection()]
+            save_settings(self.settings)
+            languageHandler.setLanguage(self.settings["language"])
+        dlg.Destroy()
 
-    def on_execute_command(self, event):
+    def on_search(self, event):
+        self.apply_filter()
+
+    def on_clear_search(self, event):
+        self.search_box.SetValue("")
+
+    def apply_filter(self):
+        # The list shows the commands matching the search box, in catalog order
+        self.lista_de_comandos.set_commands(self.search_index.filter(self.commands, self.search_box.GetValue()))
+
+    def get_selected_command(self):
         selected_item = self.lista_de_comandos.GetFirstSelected()
         if selected_item >= 0:
-            cmd = self.lista_de_comandos.GetItemText(selected_item, col=2)
-            type = self.lista_de_comandos.GetItemText(selected_item, col=3)
+            return self.lista_de_comandos.commands[selected_item]
+        return None
+
+    def get_command_position(self, command):
+        for position, item in enumerate(self.commands):
+            if item is command:
+                return position
+        return -1
 
-            # Execute the command in a separate thread
-            threading.Thread(target=self.run_command, args=(cmd, type)).start()
+    def select_command(self, command):
+        for index, item in enumerate(self.lista_de_comandos.commands):
+            if item is command:
+                self.lista_de_comandos.select_only(index)
+                break
+
+    def on_execute_command(self, event):
+        command = self.get_selected_command()
+        if command is not None:
+            # Show the output while the command runs in a separate thread
+            cancel_event = threading.Event()
+            output_dialog = OutputDialog(self, -1, _("Command Result"), None, running=True, cancel_event=cancel_event)
+            output_dialog.Show()
+            threading.Thread(target=self.run_command, args=(command, output_dialog, cancel_event)).start()
+
+    def get_selected_items(self):
+        selected_items = []
+        item = self.lista_de_comandos.GetFirstSelected()
+        while item >= 0:
+            selected_items.append(item)
+            item = self.lista_de_comandos.GetNextSelected(item)
+        return selected_items
+
+    def on_run_selected(self, event):
+        selection = [self.lista_de_comandos.commands[item] for item in self.get_selected_items()]
+        if selection:
+            try:
+                commands = scheduler.resolve(selection, self.commands)
+            except scheduler.SchedulerError as e:
+                wx.MessageBox(str(e), _("Run Selected"), wx.OK | wx.ICON_ERROR)
+                return
+            threading.Thread(target=self.run_batch, args=(commands,), daemon=True).start()
+
+    def get_executor(self):
+        """Returns the executor module, importing it and applying the settings on first use."""
+        if self.executor is None:
+            import executor
+            self.executor = executor
+            self.apply_execution_settings()
+        return self.executor
+
+    def apply_execution_settings(self):
+        if self.executor is None:
+            # Applied by get_executor
+            return
+        import shellhost
+        import artifacts
+        executor = self.executor
+        pool_size = self.settings.get("shell_pool_size", shellhost.DEFAULT_POOL_SIZE)
+        executor.use_warm_shell = pool_size > 0
+        shellhost.set_pool_size(pool_size)
+        executor.result_cache.ttl = self.settings.get("cache_ttl", resultcache.DEFAULT_TTL)
+        max_mb = self.settings.get("artifact_cache_max_mb", artifacts.DEFAULT_MAX_BYTES // (1024 * 1024))
+        artifacts.configure(max_mb * 1024 * 1024, self.settings.get("artifact_mirror"))
+        executor.download_connections = self.settings.get("download_connections", artifacts.DEFAULT_CONNECTIONS)
+        executor.default_timeout = self.settings.get("command_timeout") or None
+
+    def run_batch(self, commands):
+        cancel_event = threading.Event()
+        self.cancel_events.add(cancel_event)
+        try:
+            executor = self.get_executor()
+            batch = executor.BatchExecutor(self.settings.get("max_workers", executor.DEFAULT_MAX_WORKERS), on_update=self.on_job_update,
+                                           on_prefetch=self.on_prefetch, cancel_event=cancel_event,
+                                           skip_applied=self.settings.get("skip_applied", True))
+            result = batch.run(commands, scheduler.dependency_map(commands))
+            wx.CallAfter(self.show_output_dialog, result.summary())
+            if result.failed:
+                wx.CallAfter(self.show_notification, _("%d of %d commands failed") % (len(result.failed), len(result.jobs)), success=False)
+            else:
+                wx.CallAfter(self.show_notification, _("All %d commands executed successfully in %.1fs") % (len(result.jobs), result.elapsed), success=True)
+        except Exception as e:
+            logging.error("Error running batch: %s", e)
+            wx.CallAfter(self.show_notification, _("An unexpected error occurred"), success=False)
+        finally:
+            self.cancel_events.discard(cancel_event)
+
+    def on_cancel_running(self, event):
+        for cancel_event in list(self.cancel_events):
+            cancel_event.set()
+        self.SetStatusText(_("Cancelling %d running commands") % len(self.cancel_events) if self.cancel_events else _("No command is running"))
+
+    def on_job_update(self, job):
+        wx.CallAfter(self.SetStatusText, "%s: %s" % (job.name, job.state))
+
+    def on_prefetch(self, item, error):
+        name = os.path.basename(item["path"].replace("\\", "/"))
+        wx.CallAfter(self.SetStatusText, "%s: %s" % (name, _("download failed") if error else _("downloaded")))
+
+    def on_set_concurrency(self, event):
+        current = self.settings.get("max_workers", self.get_executor().DEFAULT_MAX_WORKERS)
+        value = wx.GetNumberFromUser(_("How many selected commands may run at the same time?"), _("Commands:"), _("Concurrency Limit"), current, 1, 32, self)
+        if value > 0:
+            self.settings["max_workers"] = value
+            save_settings(self.settings)
+
+    def on_set_shell_pool_size(self, event):
+        import shellhost
+        current = self.settings.get("shell_pool_size", shellhost.DEFAULT_POOL_SIZE)
+        value = wx.GetNumberFromUser(_("How many PowerShell hosts should be kept running? Use 0 to start a new PowerShell for every command."), _("Hosts:"), _("PowerShell Hosts"), current, 0, 16, self)
+        if value >= 0:
+            self.settings["shell_pool_size"] = value
+            save_settings(self.settings)
+            self.apply_execution_settings()
+
+    def on_set_download_mirror(self, event):
+        mirror = self.settings.get("artifact_mirror")
+        if mirror and wx.MessageBox(_("Installers are taken from %s. Stop using this folder?") % mirror, _("Download Mirror"), wx.YES_NO | wx.ICON_QUESTION) == wx.YES:
+            self.settings.pop("artifact_mirror")
+        else:
+            dlg = wx.DirDialog(self, _("Choose a folder with installers"), mirror or "")
+            if dlg.ShowModal() != wx.ID_OK:
+                dlg.Destroy()
+                return
+            self.settings["artifact_mirror"] = dlg.GetPath()
+            dlg.Destroy()
+        save_settings(self.settings)
+        self.apply_execution_settings()
+
+    def on_set_command_timeout(self, event):
+        current = (self.settings.get("command_timeout") or 0) // 60
+        value = wx.GetNumberFromUser(_("Stop commands still running after how many minutes? Use 0 for no limit."), _("Minutes:"), _("Command Timeout"), current, 0, 1440, self)
+        if value >= 0:
+            self.settings["command_timeout"] = value * 60
+            save_settings(self.settings)
+            self.apply_execution_settings()
+
+    def on_clean_files(self, event):
+        # Measure first, nothing is removed until the user has seen the sizes
+        threading.Thread(target=self.run_cleaner, args=(True,), daemon=True).start()
+
+    def run_cleaner(self, dry_run):
+        cancel_event = threading.Event()
+        self.cancel_events.add(cancel_event)
+        import cleaner
+        try:
+            roots = cleaner.expand_roots(self.settings.get("cleaner_roots", cleaner.DEFAULT_ROOTS))
+            files_cleaner = cleaner.Cleaner(min_age=self.settings.get("cleaner_min_age_hours", 0) * 3600, dry_run=dry_run,
+                                            on_progress=self.on_clean_progress, cancel_event=cancel_event)
+            reports = files_cleaner.run(roots)
+            if cancel_event.is_set():
+                wx.CallAfter(self.SetStatusText, _("Cleaning cancelled"))
+            elif dry_run:
+                wx.CallAfter(self.confirm_cleaning, reports)
+            else:
+                freed = sum(report.removed_bytes for report in reports)
+                errors = sum(report.errors for report in reports)
+                message = _("Freed %s") % cleaner.format_size(freed)
+                if errors:
+                    message += _(", %d files in use were left in place") % errors
+                wx.CallAfter(self.SetStatusText, message)
+                wx.CallAfter(self.show_notification, message, success=True)
+        except Exception as e:
+            logging.error("Error cleaning files: %s", e)
+            wx.CallAfter(self.show_notification, _("An unexpected error occurred"), success=False)
+        finally:
+            self.cancel_events.discard(cancel_event)
+
+    def on_clean_progress(self, report):
+        import cleaner
+        wx.CallAfter(self.SetStatusText, _("%s: %d files, %s") % (report.root, report.files, cleaner.format_size(report.bytes)))
+
+    def confirm_cleaning(self, reports):
+        import cleaner
+        files = sum(report.files for report in reports)
+        if not files:
+            wx.MessageBox(_("There are no temporary files to remove."), _("Clean Temporary Files"), wx.OK | wx.ICON_INFORMATION)
+            return
+        lines = [_("%s: %d files, %s") % (report.root, report.files, cleaner.format_size(report.bytes)) for report in reports if report.files]
+        lines.append("")
+        lines.append(_("Remove %d files, %s?") % (files, cleaner.format_size(sum(report.bytes for report in reports))))
+        if wx.MessageBox("\n".join(lines), _("Clean Temporary Files"), wx.YES_NO | wx.ICON_QUESTION) == wx.YES:
+            threading.Thread(target=self.run_cleaner, args=(False,), daemon=True).start()
+
+    def on_show_statistics(self, event):
+        import telemetry
+        try:
+            statistics = telemetry.get_store().statistics()
+        except Exception as e:
+            logging.error("Error reading statistics: %s", e)
+            wx.MessageBox(_("Could not read the statistics:\n") + str(e), _("Statistics"), wx.OK | wx.ICON_ERROR)
+            return
+        dlg = StatisticsDialog(self, -1, _("Statistics"), statistics)
+        dlg.ShowModal()
+        dlg.Destroy()
+
+    def on_toggle_skip_applied(self, event):
+        self.settings["skip_applied"] = event.IsChecked()
+        save_settings(self.settings)
+
+    def on_audit(self, event):
+        self.SetStatusText(_("Reading the state of the commands"))
+        threading.Thread(target=self.run_audit, daemon=True).start()
+
+    def run_audit(self):
+        cancel_event = threading.Event()
+        self.cancel_events.add(cancel_event)
+        try:
+            # All checks are read in one PowerShell pass, nothing is changed
+            audits = self.get_executor().probe_commands(self.commands, cancel_event)
+            wx.CallAfter(self.SetStatusText, "")
+            wx.CallAfter(self.show_audit, audits)
+        except Exception as e:
+            logging.error("Error auditing commands: %s", e)
+            wx.CallAfter(self.show_notification, _("An unexpected error occurred"), success=False)
+        finally:
+            self.cancel_events.discard(cancel_event)
+
+    def show_audit(self, audits):
+        if not audits:
+            wx.MessageBox(_("No command can tell whether it is applied."), _("Audit Tweaks"), wx.OK | wx.ICON_INFORMATION)
+            return
+        dlg = AuditDialog(self, -1, _("Audit Tweaks"), audits)
+        dlg.ShowModal()
+        dlg.Destroy()
+
+    def choose_profile(self, title):
+        stored = self.catalog.load_profiles()
+        if not stored:
+            wx.MessageBox(_("There are no profiles yet. Select commands and use Save Selection as Profile."), title, wx.OK | wx.ICON_INFORMATION)
+            return None
+        dlg = wx.SingleChoiceDialog(self, _("Choose a profile"), title, [profile["name"] for profile in stored])
+        profile = stored[dlg.GetSelection()] if dlg.ShowModal() == wx.ID_OK else None
+        dlg.Destroy()
+        return profile
+
+    def on_save_profile(self, event):
+        import profiles
+        selection = [self.lista_de_comandos.commands[item] for item in self.get_selected_items()]
+        if not selection:
+            wx.MessageBox(_("Select the commands of the profile first."), _("Save Selection as Profile"), wx.OK | wx.ICON_INFORMATION)
+            return
+        dlg = wx.TextEntryDialog(self, _("Profile name:"), _("Save Selection as Profile"))
+        name = dlg.GetValue().strip() if dlg.ShowModal() == wx.ID_OK else ""
+        dlg.Destroy()
+        if not name:
+            return
+        if self.catalog.find_profile(name) is not None and wx.MessageBox(_("Replace the profile %s?") % name, _("Save Selection as Profile"), wx.YES_NO | wx.ICON_QUESTION) != wx.YES:
+            return
+        self.save_change(self.catalog.save_profile, profiles.create(name, selection))
+        self.SetStatusText(_("Profile %s saved with %d commands") % (name, len(selection)))
+
+    def on_run_profile(self, event):
+        import profiles
+        profile = self.choose_profile(_("Run Profile"))
+        if profile is None:
+            return
+        try:
+            commands = scheduler.resolve(profiles.resolve(profile, self.commands), self.commands)
+        except (profiles.ProfileError, scheduler.SchedulerError) as e:
+            wx.MessageBox(str(e), _("Run Profile"), wx.OK | wx.ICON_ERROR)
+            return
+        threading.Thread(target=self.run_batch, args=(commands,), daemon=True).start()
+
+    def on_export_profile(self, event):
+        import profiles
+        profile = self.choose_profile(_("Export Profile"))
+        if profile is None:
+            return
+        dlg = wx.FileDialog(self, _("Export Profile"), defaultFile="%s.json" % profile["name"], wildcard=_("Aurora profiles (*.json)|*.json"),
+                            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT)
+        if dlg.ShowModal() == wx.ID_OK:
+            try:
+                profiles.export(profile, self.commands, dlg.GetPath())
+                self.SetStatusText(_("Profile %s exported to %s") % (profile["name"], dlg.GetPath()))
+            except (profiles.ProfileError, OSError) as e:
+                wx.MessageBox(str(e), _("Export Profile"), wx.OK | wx.ICON_ERROR)
+        dlg.Destroy()
+
+    def on_import_profile(self, event):
+        import profiles
+        dlg = wx.FileDialog(self, _("Import Profile"), wildcard=_("Aurora profiles (*.json)|*.json"), style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+        path = dlg.GetPath() if dlg.ShowModal() == wx.ID_OK else None
+        dlg.Destroy()
+        if path is None:
+            return
+        try:
+            profile, embedded = profiles.read_file(path)
+        except (profiles.ProfileError, OSError) as e:
+            wx.MessageBox(str(e), _("Import Profile"), wx.OK | wx.ICON_ERROR)
+            return
+        if self.catalog.find_profile(profile["name"]) is not None and wx.MessageBox(_("Replace the profile %s?") % profile["name"], _("Import Profile"), wx.YES_NO | wx.ICON_QUESTION) != wx.YES:
+            return
+        # Commands this PC doesn't have are added at the end of the list
+        added = profiles.missing_commands(embedded, self.commands)
+        for command in added:
+            command = dict(command)
+            self.commands.append(command)
+            self.save_change(self.catalog.add, command)
+            self.search_index.add(command)
+        self.save_change(self.catalog.save_profile, profile)
+        self.apply_filter()
+        self.SetStatusText(_("Profile %s imported, %d commands added") % (profile["name"], len(added)))
 
     def on_add_command(self, event):
         # Open the dialog to add commands
-        dlg = AddCommandDialog(self, -1, "Add Commands")
+        dlg = AddCommandDialog(self, -1, _("Add Commands"))
         result = dlg.ShowModal()
         if result == wx.ID_OK:
             name = dlg.name_text.GetValue()
@@ -156,94 +610,112 @@ class MyFrame(wx.Frame):
 
             # Add the command to the list
             command = {"name": name, "desc": desc, "cmd": cmd, "type": type}
+            if dlg.cacheable_check.GetValue():
+                command["cacheable"] = True
+            if dlg.get_resources():
+                command["resources"] = dlg.get_resources()
             self.commands.append(command)
-            self.add_command_to_list(command)
-            # Save the commands to the file
-            save_commands(self.commands)
+            # Save the command to the catalog, which gives it the id used by the search index
+            self.save_change(self.catalog.add, command)
+            self.search_index.add(command)
+            self.apply_filter()
 
         dlg.Destroy()
 
-    def add_command_to_list(self, command):
-        index = self.lista_de_comandos.InsertItem(self.lista_de_comandos.GetItemCount(), command["name"])
-        self.lista_de_comandos.SetItem(index, 1, command["desc"])
-        self.lista_de_comandos.SetItem(index, 2, command["cmd"])
-        self.lista_de_comandos.SetItem(index, 3, command["type"])
+    def save_change(self, change, *args):
+        try:
+            change(*args)
+        except Exception as e:
+            logging.error("Error saving commands: %s", e)
 
     def show_output_dialog(self, output):
         try:
-            output_dialog = OutputDialog(self, -1, "Command Result", output)
+            output_dialog = OutputDialog(self, -1, _("Command Result"), output)
             output_dialog.ShowModal()
         except Exception as e:
             logging.error("Error showing output dialog: %s", e)
 
     def show_notification(self, message, success=True):
         try:
-            notification_title = "Success" if success else "Error"
+            import wx.adv
+            notification_title = _("Success") if success else _("Error")
             notification = wx.adv.NotificationMessage(title=notification_title, message=message, parent=None)
             notification.Show()
         except Exception as e:
             logging.error("Error showing notification: %s", e)
 
-    def run_command(self, command, type):
+    def run_command(self, command, output_dialog, cancel_event=None):
+        import streaming
+        if cancel_event is not None:
+            self.cancel_events.add(cancel_event)
         try:
-            if "CMD" in type.upper():
-                result = subprocess.run(["cmd", "/c", command], shell=True, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            elif "POWERSHELL" in type.upper():
-                result = subprocess.run(["powershell", "-Command", command], shell=True, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            else:
-                logging.error("Unsupported command type: %s", type)
+            executor = self.get_executor()
+            if executor.build_command_args(command["cmd"], command["type"]) is None:
+                logging.error("Unsupported command type: %s", command["type"])
+                wx.CallAfter(output_dialog.finish, _("Unsupported command type: %s") % command["type"])
                 return
 
-            if result.returncode == 0:
-                wx.CallAfter(self.show_output_dialog, result.stdout)
-                wx.CallAfter(self.show_notification, "Command executed successfully", success=True)
+            returncode, output = executor.execute_entry(command, on_output=lambda chunk: wx.CallAfter(output_dialog.append_output, chunk), cancel_event=cancel_event)
+            wx.CallAfter(output_dialog.finish, None if returncode == 0 else _("The command finished with exit code %d") % returncode)
+            if returncode == 0:
+                wx.CallAfter(self.show_notification, _("Command executed successfully"), success=True)
             else:
-                wx.CallAfter(self.show_output_dialog, result.stderr)
-                wx.CallAfter(self.show_notification, "Error executing command", success=False)
+                wx.CallAfter(self.show_notification, _("Error executing command"), success=False)
 
-        except subprocess.CalledProcessError as e:
-            wx.CallAfter(self.show_output_dialog, e.stderr)
-            wx.CallAfter(self.show_notification, "Error executing command", success=False)
+        except streaming.CommandCancelled as e:
+            logging.info("Command %s stopped: %s", command["name"], e)
+            wx.CallAfter(output_dialog.finish, str(e))
+            wx.CallAfter(self.show_notification, "%s: %s" % (command["name"], e), success=False)
         except Exception as e:
             logging.error("Error executing command: %s", e)
-            wx.CallAfter(self.show_output_dialog, "An unexpected error occurred")
-            wx.CallAfter(self.show_notification, "An unexpected error occurred", success=False)
+            wx.CallAfter(output_dialog.finish, _("An unexpected error occurred"))
+            wx.CallAfter(self.show_notification, _("An unexpected error occurred"), success=False)
+        finally:
+            self.cancel_events.discard(cancel_event)
 
     def open_github_repo(self, event):
         github_url = "https://github.com/azurejoga/Aurora-Windows-Optimizer"
+        import webbrowser
         webbrowser.open(github_url)
 
     def download_latest_github(self, event):
         download_url = "https://github.com/azurejoga/Aurora-Windows-Optimizer/releases"
+        import webbrowser
         webbrowser.open(download_url)
 
     def create_system_restore_point(self, event):
-        description = wx.GetTextFromUser("Enter a description for the restore point:", "Create Restore Point")
+        description = wx.GetTextFromUser(_("Enter a description for the restore point:"), _("Create Restore Point"))
         if description:
+            # A restore point changes what the cached queries, such as the latest restore point, return
+            if self.executor is not None:
+                self.executor.result_cache.clear()
             create_system_restore_point(description)
 
     def sort_commands(self, event):
-        self.lista_de_comandos.DeleteAllItems()
-        self.commands.sort(key=lambda x: x["name"])
-        for command in self.commands:
-            self.add_command_to_list(command)
+        self.sort_by_name()
+        self.apply_filter()
+
+    def sort_by_name(self):
+        self.commands.sort(key=command_sort_key)
+        self.sorted_ids = [command.get("id") for command in self.commands]
+        self.save_change(self.catalog.reorder, self.commands)
 
     def create_context_menu(self):
         menu = wx.Menu()
 
-        edit_item = wx.MenuItem(menu, wx.ID_ANY, "Edit")
+        edit_item = wx.MenuItem(menu, wx.ID_ANY, _("Edit"))
         self.Bind(wx.EVT_MENU, self.on_edit_command, edit_item)
         menu.Append(edit_item)
 
-        remove_item = wx.MenuItem(menu, wx.ID_ANY, "Remove Command")
+        remove_item = wx.MenuItem(menu, wx.ID_ANY, _("Remove Command"))
         self.Bind(wx.EVT_MENU, self.on_remove_command, remove_item)
         menu.Append(remove_item)
 
-        move_to_top_item = wx.MenuItem(menu, wx.ID_ANY, "Move to Top")
+        move_to_top_item = wx.MenuItem(menu, wx.ID_ANY, _("Move to Top"))
         self.Bind(wx.EVT_MENU, self.move_command_to_top, move_to_top_item)
         menu.Append(move_to_top_item)
 
-        move_to_bottom_item = wx.MenuItem(menu, wx.ID_ANY, "Move to Bottom")
+        move_to_bottom_item = wx.MenuItem(menu, wx.ID_ANY, _("Move to Bottom"))
         self.Bind(wx.EVT_MENU, self.move_command_to_bottom, move_to_bottom_item)
         menu.Append(move_to_bottom_item)
 
@@ -259,16 +731,19 @@ class MyFrame(wx.Frame):
     def on_edit_command(self, event):
         selected_item = self.lista_de_comandos.GetFirstSelected()
         if selected_item >= 0:
-            name = self.lista_de_comandos.GetItemText(selected_item, col=0)
-            desc = self.lista_de_comandos.GetItemText(selected_item, col=1)
-            cmd = self.lista_de_comandos.GetItemText(selected_item, col=2)
-            type = self.lista_de_comandos.GetItemText(selected_item, col=3)
+            command = self.lista_de_comandos.commands[selected_item]
+            name = command["name"]
+            desc = command["desc"]
+            cmd = command["cmd"]
+            type = command["type"]
 
-            dlg = AddCommandDialog(self, -1, "Edit Command")
+            dlg = AddCommandDialog(self, -1, _("Edit Command"))
             dlg.name_text.SetValue(name)
             dlg.desc_text.SetValue(desc)
             dlg.cmd_text.SetValue(cmd)
             dlg.type_combo.SetValue(type)
+            dlg.cacheable_check.SetValue(command.get("cacheable", False))
+            dlg.set_resources(command.get("resources"))
 
             result = dlg.ShowModal()
             if result == wx.ID_OK:
@@ -277,90 +752,119 @@ class MyFrame(wx.Frame):
                 updated_cmd = dlg.cmd_text.GetValue()
                 updated_type = dlg.type_combo.GetValue()
 
-                self.lista_de_comandos.SetItem(selected_item, 0, updated_name)
-                self.lista_de_comandos.SetItem(selected_item, 1, updated_desc)
-                self.lista_de_comandos.SetItem(selected_item, 2, updated_cmd)
-                self.lista_de_comandos.SetItem(selected_item, 3, updated_type)
-
-                self.commands[selected_item] = {"name": updated_name, "desc": updated_desc, "cmd": updated_cmd, "type": updated_type}
-                save_commands(self.commands)
+                # Keep optional fields such as requires/conflicts
+                command.update({"name": updated_name, "desc": updated_desc, "cmd": updated_cmd, "type": updated_type})
+                if dlg.cacheable_check.GetValue():
+                    command["cacheable"] = True
+                else:
+                    command.pop("cacheable", None)
+                if dlg.get_resources():
+                    command["resources"] = dlg.get_resources()
+                else:
+                    command.pop("resources", None)
+                self.save_change(self.catalog.update, command)
+                self.search_index.update(command)
+                self.apply_filter()
 
             dlg.Destroy()
 
     def on_remove_command(self, event):
-        selected_item = self.lista_de_comandos.GetFirstSelected()
-        if selected_item >= 0:
-            del self.commands[selected_item]
-            self.lista_de_comandos.DeleteItem(selected_item)
-            save_commands(self.commands)
+        command = self.get_selected_command()
+        if command is not None:
+            self.commands.pop(self.get_command_position(command))
+            self.save_change(self.catalog.remove, command)
+            self.search_index.remove(command)
+            self.apply_filter()
 
     def check_updates(self, event):
         script_dir = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(__file__))
         update_exe_path_update = os.path.join(script_dir, "update", "update.exe")
         update_exe_path_same_folder = os.path.join(script_dir, "update.exe")
 
+        # The updater runs on its own, Aurora stays responsive meanwhile
         if os.path.exists(update_exe_path_update):
-            subprocess.run([update_exe_path_update], shell=True)
+            subprocess.Popen([update_exe_path_update], shell=True)
         elif os.path.exists(update_exe_path_same_folder):
-            subprocess.run([update_exe_path_same_folder], shell=True)
+            subprocess.Popen([update_exe_path_same_folder], shell=True)
         else:
             logging.error("update.exe not found.")
 
+    def on_set_update_channel(self, event):
+        # Read by update.exe from the same settings file
+        channels = ["stable", "prerelease"]
+        dlg = wx.SingleChoiceDialog(self, _("Which releases should Check Updates offer?"), _("Update Channel"), [_("Stable releases"), _("Pre-releases and stable releases")])
+        dlg.SetSelection(channels.index(self.settings.get("update_channel", "stable")) if self.settings.get("update_channel") in channels else 0)
+        if dlg.ShowModal() == wx.ID_OK:
+            self.settings["update_channel"] = channels[dlg.GetSelection()]
+            save_settings(self.settings)
+        dlg.Destroy()
+
     def restore_changes(self, event):
+        # Reading the restore points takes a while, the window stays responsive meanwhile
+        threading.Thread(target=self.find_restore_point, daemon=True).start()
+
+    def find_restore_point(self):
         try:
             find_restore_point_command = "Get-ComputerRestorePoint | Sort-Object -Property CreationTime -Descending | Select-Object -First 1 | Format-List -Property CreationTime, Description, SequenceNumber"
-            result = subprocess.run(["powershell", "-Command", find_restore_point_command], shell=True, capture_output=True, text=True)
+            # Read-only query, asking again within a few seconds reuses the result
+            returncode, output = self.get_executor().execute_entry({"name": "Find restore point", "cmd": find_restore_point_command, "type": "Powershell", "cacheable": True}, record=False)
+            wx.CallAfter(self.confirm_restoration, returncode, output)
+        except Exception as e:
+            logging.error("Error finding restore point: %s", e)
+            wx.CallAfter(wx.MessageBox, _("Unexpected error:\n%s") % e, _("Restoration Error"), wx.OK | wx.ICON_ERROR)
 
-            if result.returncode == 0:
-                restore_point_info = result.stdout.strip()
+    def confirm_restoration(self, returncode, output):
+        if returncode == 0:
+            restore_point_info = output.strip()
 
-                if restore_point_info:
-                    restore_point_data = {line.split(':', 1)[0].strip(): line.split(':', 1)[1].strip() for line in restore_point_info.split('\n')}
+            if restore_point_info:
+                restore_point_data = {line.split(':', 1)[0].strip(): line.split(':', 1)[1].strip() for line in restore_point_info.split('\n') if ':' in line}
 
-                    dlg = wx.MessageDialog(None, f"Do you want to restore the system to the latest restore point?\n\n{restore_point_info}", "Restore Changes", wx.YES_NO | wx.ICON_QUESTION)
-                    result = dlg.ShowModal()
-                    dlg.Destroy()
+                dlg = wx.MessageDialog(None, _("Do you want to restore the system to the latest restore point?\n\n%s") % restore_point_info, _("Restore Changes"), wx.YES_NO | wx.ICON_QUESTION)
+                result = dlg.ShowModal()
+                dlg.Destroy()
 
-                    if result == wx.ID_YES:
-                        threading.Thread(target=self.perform_restoration, args=(restore_point_data,), daemon=True).start()
-                else:
-                    wx.MessageBox("Could not find a restore point. Create a restore point before attempting to restore changes.", "Restoration Error", wx.OK | wx.ICON_ERROR)
+                if result == wx.ID_YES:
+                    threading.Thread(target=self.perform_restoration, args=(restore_point_data,), daemon=True).start()
             else:
-                wx.MessageBox(f"Error finding or restoring restore point:\n{result.stderr}", "Restoration Error", wx.OK | wx.ICON_ERROR)
-
-        except subprocess.CalledProcessError as e:
-            wx.MessageBox(f"Error executing PowerShell command:\n{e.stderr}", "Restoration Error", wx.OK | wx.ICON_ERROR)
-        except Exception as e:
-            wx.MessageBox(f"Unexpected error:\n{e}", "Restoration Error", wx.OK | wx.ICON_ERROR)
+                wx.MessageBox(_("Could not find a restore point. Create a restore point before attempting to restore changes."), _("Restoration Error"), wx.OK | wx.ICON_ERROR)
+        else:
+            wx.MessageBox(_("Error finding or restoring restore point:\n%s") % output, _("Restoration Error"), wx.OK | wx.ICON_ERROR)
 
     def perform_restoration(self, restore_point_data):
         try:
             sequence_number = restore_point_data.get("SequenceNumber")
             restore_command = f"Restore-Computer -RestorePoint {sequence_number} -Confirm:$false"
-            subprocess.run(["powershell", "-Command", restore_command], shell=True, check=True)
+            executor = self.get_executor()
+            executor.result_cache.clear()
+            returncode, output = executor.execute_command(restore_command, "Powershell")
+            if returncode != 0:
+                wx.CallAfter(wx.MessageBox, _("Error restoring changes:\n%s") % output, _("Restoration Error"), wx.OK | wx.ICON_ERROR)
+                return
 
-            wx.CallAfter(wx.MessageBox, f"Changes successfully restored to '{restore_point_data.get('Description')}' ({restore_point_data.get('CreationTime')})! The computer will be restarted.", "Restoration Completed", wx.OK | wx.ICON_INFORMATION)
-            subprocess.run(["powershell", "Restart-Computer"])
-        except subprocess.CalledProcessError as e:
-            wx.CallAfter(wx.MessageBox, f"Error restoring changes:\n{e.stderr}", "Restoration Error", wx.OK | wx.ICON_ERROR)
+            wx.CallAfter(wx.MessageBox, _("Changes successfully restored to '%s' (%s)! The computer will be restarted.") % (restore_point_data.get('Description'), restore_point_data.get('CreationTime')), _("Restoration Completed"), wx.OK | wx.ICON_INFORMATION)
+            executor.execute_command("Restart-Computer", "Powershell")
+        except Exception as e:
+            logging.error("Error restoring changes: %s", e)
+            wx.CallAfter(wx.MessageBox, _("Error restoring changes:\n%s") % e, _("Restoration Error"), wx.OK | wx.ICON_ERROR)
 
     def move_command_to_top(self, event):
-        selected_item = self.lista_de_comandos.GetFirstSelected()
-        if selected_item > 0:
-            self.commands.insert(0, self.commands.pop(selected_item))
-            self.lista_de_comandos.DeleteAllItems()
-            for command in self.commands:
-                self.add_command_to_list(command)
-            self.lista_de_comandos.Select(0)
+        command = self.get_selected_command()
+        position = self.get_command_position(command) if command is not None else -1
+        if position > 0:
+            self.commands.insert(0, self.commands.pop(position))
+            self.save_change(self.catalog.move_to_top, command)
+            self.apply_filter()
+            self.select_command(command)
 
     def move_command_to_bottom(self, event):
-        selected_item = self.lista_de_comandos.GetFirstSelected()
-        if selected_item >= 0 and selected_item < len(self.commands) - 1:
-            self.commands.append(self.commands.pop(selected_item))
-            self.lista_de_comandos.DeleteAllItems()
-            for command in self.commands:
-                self.add_command_to_list(command)
-            self.lista_de_comandos.Select(len(self.commands) - 1)
+        command = self.get_selected_command()
+        position = self.get_command_position(command) if command is not None else -1
+        if position >= 0 and position < len(self.commands) - 1:
+            self.commands.append(self.commands.pop(position))
+            self.save_change(self.catalog.move_to_bottom, command)
+            self.apply_filter()
+            self.select_command(command)
 
 class AddCommandDialog(wx.Dialog):
     def __init__(self, parent, id, title):
@@ -369,23 +873,33 @@ class AddCommandDialog(wx.Dialog):
         panel = wx.Panel(self)
 
         # Add elements for entering name, description, command, and command type
-        name_label = wx.StaticText(panel, -1, "Name:")
+        name_label = wx.StaticText(panel, -1, _("Name:"))
         self.name_text = wx.TextCtrl(panel, -1, "")
 
-        desc_label = wx.StaticText(panel, -1, "Description:")
+        desc_label = wx.StaticText(panel, -1, _("Description:"))
         self.desc_text = wx.TextCtrl(panel, -1, "")
 
-        cmd_label = wx.StaticText(panel, -1, "Command:")
+        cmd_label = wx.StaticText(panel, -1, _("Command:"))
         self.cmd_text = wx.TextCtrl(panel, -1, "", style=wx.TE_MULTILINE)
 
-        type_label = wx.StaticText(panel, -1, "Command type:")
+        type_label = wx.StaticText(panel, -1, _("Command type:"))
         self.type_combo = wx.ComboBox(panel, -1, choices=["CMD", "Powershell"], style=wx.CB_READONLY)
 
+        self.cacheable_check = wx.CheckBox(panel, -1, _("Read-only command, reuse its result for a short time"))
+
+        # Priority and limits the command runs with, see governor.PROFILES
+        import governor
+        resources_label = wx.StaticText(panel, -1, _("Resource profile:"))
+        self.profiles = sorted(governor.PROFILES)
+        self.resources_choice = wx.Choice(panel, -1, choices=[_("Normal")] + self.profiles)
+        self.resources_choice.SetSelection(0)
+        self.custom_resources = None
+
         # "Ok" and "Cancel" buttons
-        ok_button = wx.Button(panel, label="Ok")
+        ok_button = wx.Button(panel, label=_("Ok"))
         ok_button.Bind(wx.EVT_BUTTON, self.on_ok)
 
-        cancel_button = wx.Button(panel, label="Cancel")
+        cancel_button = wx.Button(panel, label=_("Cancel"))
         cancel_button.Bind(wx.EVT_BUTTON, self.on_cancel)
 
         # Layout of the dialog box
@@ -398,11 +912,29 @@ class AddCommandDialog(wx.Dialog):
         sizer.Add(self.cmd_text, 0, wx.EXPAND | wx.ALL, 10)
         sizer.Add(type_label, 0, wx.ALL, 10)
         sizer.Add(self.type_combo, 0, wx.EXPAND | wx.ALL, 10)
+        sizer.Add(self.cacheable_check, 0, wx.ALL, 10)
+        sizer.Add(resources_label, 0, wx.ALL, 10)
+        sizer.Add(self.resources_choice, 0, wx.EXPAND | wx.ALL, 10)
         sizer.Add(ok_button, 0, wx.CENTER | wx.ALL, 10)
         sizer.Add(cancel_button, 0, wx.CENTER | wx.ALL, 10)
 
         panel.SetSizer(sizer)
 
+    def set_resources(self, resources):
+        if isinstance(resources, dict):
+            # Limits written by hand in the catalog are kept unless another profile is chosen
+            self.custom_resources = resources
+            self.resources_choice.SetSelection(self.resources_choice.Append(_("Custom")))
+        elif resources in self.profiles:
+            self.resources_choice.SetSelection(self.profiles.index(resources) + 1)
+
+    def get_resources(self):
+        # Normal first, then the profiles, then Custom when the command has its own limits
+        selection = self.resources_choice.GetSelection()
+        if selection > len(self.profiles):
+            return self.custom_resources
+        return self.profiles[selection - 1] if selection > 0 else None
+
     def on_ok(self, event):
         self.EndModal(wx.ID_OK)
 
@@ -410,21 +942,135 @@ class AddCommandDialog(wx.Dialog):
         self.EndModal(wx.ID_CANCEL)
 
 class OutputDialog(wx.Dialog):
-    def __init__(self, parent, id, title, output):
+    # Characters kept in the output box, older output is removed as new output arrives
+    MAX_OUTPUT_CHARS = 500000
+
+    def __init__(self, parent, id, title, output, running=False, cancel_event=None):
         super(OutputDialog, self).__init__(parent, id, title, size=(400, 300))
 
         panel = wx.Panel(self)
 
-        if output:
-            output_text = wx.TextCtrl(panel, -1, value=output.strip(), style=wx.TE_MULTILINE | wx.TE_READONLY | wx.HSCROLL | wx.VSCROLL)
+        if running:
+            value = ""
+            self.SetTitle(title + _(" (running)"))
+        elif output:
+            value = output.strip()
         else:
-            output_text = wx.TextCtrl(panel, -1, value='The command was executed successfully!', style=wx.TE_MULTILINE | wx.TE_READONLY | wx.HSCROLL | wx.VSCROLL)
+            value = _('The command was executed successfully!')
+        self.title = title
+        self.output_text = wx.TextCtrl(panel, -1, value=value, style=wx.TE_MULTILINE | wx.TE_READONLY | wx.HSCROLL | wx.VSCROLL)
 
-        close_button = wx.Button(panel, label="Close")
+        close_button = wx.Button(panel, label=_("Close"))
         close_button.Bind(wx.EVT_BUTTON, self.on_close)
 
+        # Stops the running command and everything it started
+        self.cancel_event = cancel_event
+        self.cancel_button = wx.Button(panel, label=_("Cancel"))
+        self.cancel_button.Bind(wx.EVT_BUTTON, self.on_cancel)
+        self.cancel_button.Show(running and cancel_event is not None)
+
+        buttons = wx.BoxSizer(wx.HORIZONTAL)
+        buttons.Add(self.cancel_button, 0, wx.ALL, 5)
+        buttons.Add(close_button, 0, wx.ALL, 5)
+
         sizer = wx.BoxSizer(wx.VERTICAL)
-        sizer.Add(output_text, 1, wx.EXPAND | wx.ALL, 10)
+        sizer.Add(self.output_text, 1, wx.EXPAND | wx.ALL, 10)
+        sizer.Add(buttons, 0, wx.CENTER | wx.ALL, 5)
+
+        panel.SetSizer(sizer)
+
+    def append_output(self, text):
+        # The dialog may have been closed while the command was still running
+        if not self or not self.output_text:
+            return
+        self.output_text.AppendText(text)
+        excess = self.output_text.GetLastPosition() - self.MAX_OUTPUT_CHARS
+        if excess > 0:
+            self.output_text.Remove(0, excess)
+
+    def finish(self, message=None):
+        if not self or not self.output_text:
+            return
+        self.SetTitle(self.title)
+        self.cancel_button.Hide()
+        self.cancel_button.GetParent().Layout()
+        if message:
+            self.append_output("\n" + message)
+        elif self.output_text.IsEmpty():
+            self.output_text.SetValue(_('The command was executed successfully!'))
+
+    def on_cancel(self, event):
+        self.cancel_event.set()
+        self.cancel_button.Disable()
+        self.SetTitle(self.title + _(" (cancelling)"))
+
+    def on_close(self, event):
+        if self.IsModal():
+            self.EndModal(wx.ID_OK)
+        else:
+            self.Destroy()
+
+class StatisticsDialog(wx.Dialog):
+    def __init__(self, parent, id, title, statistics):
+        super(StatisticsDialog, self).__init__(parent, id, title, size=(700, 400))
+
+        panel = wx.Panel(self)
+
+        # One row per command, slowest first
+        statistics_list = wx.ListCtrl(panel, -1, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        statistics_list.InsertColumn(0, _("Name"), width=250)
+        statistics_list.InsertColumn(1, _("Runs"), width=60)
+        statistics_list.InsertColumn(2, _("Failures"), width=70)
+        statistics_list.InsertColumn(3, _("p50 (s)"), width=80)
+        statistics_list.InsertColumn(4, _("p95 (s)"), width=80)
+        statistics_list.InsertColumn(5, _("Peak memory (MB)"), width=120)
+        for entry in sorted(statistics, key=lambda x: x["p95"], reverse=True):
+            index = statistics_list.InsertItem(statistics_list.GetItemCount(), entry["name"])
+            statistics_list.SetItem(index, 1, str(entry["runs"]))
+            statistics_list.SetItem(index, 2, str(entry["failures"]))
+            statistics_list.SetItem(index, 3, "%.2f" % entry["p50"])
+            statistics_list.SetItem(index, 4, "%.2f" % entry["p95"])
+            statistics_list.SetItem(index, 5, "%.1f" % (entry["peak_rss"] / 1048576.0) if entry["peak_rss"] is not None else _("Not measured"))
+
+        close_button = wx.Button(panel, label=_("Close"))
+        close_button.Bind(wx.EVT_BUTTON, self.on_close)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(statistics_list, 1, wx.EXPAND | wx.ALL, 10)
+        sizer.Add(close_button, 0, wx.CENTER | wx.ALL, 10)
+
+        panel.SetSizer(sizer)
+
+    def on_close(self, event):
+        self.EndModal(wx.ID_OK)
+
+class AuditDialog(wx.Dialog):
+    # Labels of probes.Audit.state
+    STATES = {True: N_("Applied"), False: N_("Not applied"), None: N_("Unknown")}
+
+    def __init__(self, parent, id, title, audits):
+        super(AuditDialog, self).__init__(parent, id, title, size=(700, 400))
+
+        panel = wx.Panel(self)
+
+        # One row per command with a check, in list order
+        audit_list = wx.ListCtrl(panel, -1, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        audit_list.InsertColumn(0, _("Name"), width=300)
+        audit_list.InsertColumn(1, _("State"), width=100)
+        audit_list.InsertColumn(2, _("Current value"), width=250)
+        for audit in audits:
+            index = audit_list.InsertItem(audit_list.GetItemCount(), translate_catalog_text(audit.command["name"]))
+            audit_list.SetItem(index, 1, _(self.STATES[audit.state]))
+            audit_list.SetItem(index, 2, ", ".join("-" if value is None else json.dumps(value) for value in audit.values))
+
+        applied = len([audit for audit in audits if audit.state])
+        summary = wx.StaticText(panel, -1, _("%d of %d commands are applied") % (applied, len(audits)))
+        close_button = wx.Button(panel, label=_("Close"))
+        close_button.Bind(wx.EVT_BUTTON, self.on_close)
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(summary, 0, wx.LEFT | wx.RIGHT | wx.TOP, 10)
+        sizer.Add(audit_list, 1, wx.EXPAND | wx.ALL, 10)
         sizer.Add(close_button, 0, wx.CENTER | wx.ALL, 10)
 
         panel.SetSizer(sizer)
@@ -432,45 +1078,52 @@ class OutputDialog(wx.Dialog):
     def on_close(self, event):
         self.EndModal(wx.ID_OK)
 
-def save_commands(commands):
+def save_settings(settings):
     try:
-        with open("commands", "wb") as file:
-            pickle.dump(commands, file)
+        with open("settings.json", "w") as file:
+            json.dump(settings, file, indent=4)
     except Exception as e:
-        logging.error("Error saving commands: %s", e)
+        logging.error("Error saving settings: %s", e)
 
-def load_commands():
+def load_settings():
     try:
-        with open("commands", "rb") as file:
-            return pickle.load(file)
+        with open("settings.json", "r") as file:
+            return json.load(file)
     except FileNotFoundError:
-        return []
+        return {}
     except Exception as e:
-        logging.error("Error loading commands: %s", e)
-        return []
+        logging.error("Error loading settings: %s", e)
+        return {}
 
 def create_system_restore_point(description):
     try:
         ctypes.windll.shell32.ShellExecuteW(None, "runas", "powershell.exe", "Checkpoint-Computer -Description '{}'".format(description), "", 1)
-        wx.MessageBox("Restore point created successfully!", "Restore Point", wx.OK | wx.ICON_INFORMATION)
+        wx.MessageBox(_("Restore point created successfully!"), _("Restore Point"), wx.OK | wx.ICON_INFORMATION)
     except Exception as e:
-        wx.MessageBox("Error creating restore point:\n" + str(e), "Restore Point Error", wx.OK | wx.ICON_ERROR)
+        wx.MessageBox(_("Error creating restore point:\n") + str(e), _("Restore Point Error"), wx.OK | wx.ICON_ERROR)
 
-def show_welcome_dialog():
-    if not os.path.exists("welcome_indicator"):
-        app = wx.App()
-        dlg = WelcomeDialog(None, -1, "Welcome to Aurora")
-        result = dlg.ShowModal()
-        dlg.Destroy()
-        app.MainLoop()
+def show_welcome_dialog(parent):
+    dlg = WelcomeDialog(parent, -1, _("Welcome to Aurora"))
+    dlg.ShowModal()
+    dlg.Destroy()
+    open("welcome_indicator", "w").close()
 
-        open("welcome_indicator", "w").close()
+def create_main_window(show_welcome=True):
+    # Installs _() before any window is built; the language can be changed later from the Tools menu
+    languageHandler.setLanguage(load_settings().get("language", "system"))
+    frame = MyFrame(None, -1, "Aurora Windows Optimizer™")
+    frame.Show()
+    # Shown once the main window is on screen, in the same App
+    if show_welcome and not os.path.exists("welcome_indicator"):
+        wx.CallAfter(show_welcome_dialog, frame)
+    return frame
 
 def main():
-    show_welcome_dialog()
+    if not is_admin():
+        run_as_admin()
+        sys.exit()
     app = wx.App(False)
-    frame = MyFrame(None, -1, "Aurora Windows Optimizer™")
-    frame.Show()
+    create_main_window()
     app.MainLoop()
 
 if __name__ == "__main__":
@@ -0,0 +1,277 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import signal
+import catalog
+import executor
+import scheduler
+import cleaner
+import profiles
+
+# Log next to Aurora rather than in the current folder, e.g. System32 for a scheduled task;
+# stdout is kept for the JSON results
+LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "aurora.log")
+
+def describe(index, command):
+    return {"index": index, "name": command["name"], "desc": command.get("desc", ""),
+            "type": command["type"], "tags": command.get("tags", [])}
+
+def select(commands, selectors, tags):
+    """Returns the catalog entries picked by index, name or tag, in catalog order.
+
+    Raises SchedulerError for a selector that matches nothing.
+    """
+    picked = set()
+    for selector in selectors:
+        if selector.isdigit():
+            index = int(selector)
+            if index >= len(commands):
+                raise scheduler.SchedulerError("No command at index %d, the catalog has %d commands" % (index, len(commands)))
+            picked.add(index)
+            continue
+        matches = [index for index, command in enumerate(commands) if command["name"].strip().lower() == selector.strip().lower()]
+        if not matches:
+            raise scheduler.SchedulerError("No command named '%s'" % selector)
+        picked.update(matches)
+    for tag in tags:
+        matches = [index for index, command in enumerate(commands) if has_tag(command, [tag])]
+        if not matches:
+            raise scheduler.SchedulerError("No command tagged '%s'" % tag)
+        picked.update(matches)
+    return [commands[index] for index in sorted(picked)]
+
+def has_tag(command, tags):
+    return bool({tag.lower() for tag in tags} & {tag.lower() for tag in command.get("tags", [])})
+
+def list_commands(args):
+    commands = catalog.load_commands(args.catalog, read_only=True)
+    print_json([describe(index, command) for index, command in enumerate(commands) if not args.tag or has_tag(command, args.tag)])
+    return 0
+
+def run_commands(args):
+    commands = catalog.load_commands(args.catalog)
+    try:
+        selection = select(commands, args.selectors, args.tag)
+        if not selection:
+            raise scheduler.SchedulerError("Nothing selected, give command names, indexes or --tag")
+        plan = scheduler.resolve(selection, commands)
+    except scheduler.SchedulerError as e:
+        print_json({"error": str(e)})
+        return 2
+
+    if args.dry_run:
+        print_json({"plan": [command["name"] for command in plan]})
+        return 0
+
+    result = run_plan(args, plan, args.jobs)
+    print_json({"results": [job.to_dict() for job in result.jobs], "elapsed": round(result.elapsed, 3),
+                "succeeded": len(result.jobs) - len(result.failed), "failed": len(result.failed)})
+    return 1 if result.failed else 0
+
+def run_plan(args, plan, jobs):
+    def on_update(job):
+        if not args.quiet:
+            print("%s: %s" % (job.name, job.state), file=sys.stderr, flush=True)
+
+    executor.use_warm_shell = not args.no_warm_shell
+    executor.default_timeout = args.timeout
+    batch = executor.BatchExecutor(jobs, on_update=on_update, skip_applied=not args.force)
+    # Ctrl+C stops the running commands with their children and still prints the results
+    previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: batch.cancel())
+    try:
+        return batch.run(plan, scheduler.dependency_map(plan))
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+def select_ordered(commands, selectors, tags):
+    """Like select, but keeps the order of the selectors, then the tagged commands in catalog order."""
+    selection = []
+    for selected in [select(commands, [selector], []) for selector in selectors] + [select(commands, [], tags)]:
+        selection.extend(command for command in selected if all(command is not other for other in selection))
+    return selection
+
+def apply_profile(args):
+    catalog_commands = catalog.load_commands(args.catalog)
+    try:
+        if os.path.isfile(args.profile):
+            profile, embedded = profiles.read_file(args.profile)
+        else:
+            profile, embedded = find_stored_profile(args.catalog, args.profile), []
+        # The commands of an exported file win, so every PC runs the same ones
+        commands = embedded + catalog_commands
+        plan = scheduler.resolve(profiles.resolve(profile, commands), commands)
+    except (profiles.ProfileError, scheduler.SchedulerError) as e:
+        print_json({"error": str(e)})
+        return 2
+
+    if args.dry_run:
+        print_json({"profile": profile["name"], "plan": [command["name"] for command in plan]})
+        return 0
+
+    started = time.time()
+    result = run_plan(args, plan, args.jobs or profile.get("jobs") or executor.DEFAULT_MAX_WORKERS)
+    report = profiles.build_report(profile, result, started)
+    try:
+        report["report"] = profiles.write_report(report, args.report_dir)
+    except OSError as e:
+        logging.error("Error writing report to %s: %s", args.report_dir, e)
+        report["report_error"] = str(e)
+    print_json(report)
+    return 1 if result.failed else 0
+
+def find_stored_profile(path, name):
+    store = catalog.Catalog(path)
+    try:
+        profile = store.find_profile(name)
+    finally:
+        store.close()
+    if profile is None:
+        raise profiles.ProfileError("No profile named '%s' and no such file" % name)
+    return profile
+
+def manage_profiles(args):
+    store = catalog.Catalog(args.catalog)
+    try:
+        if args.profile_action == "list":
+            print_json([{"name": profile["name"], "desc": profile.get("desc", ""), "entries": [entry["name"] for entry in profile["entries"]]}
+                        for profile in store.load_profiles()])
+        elif args.profile_action == "create":
+            selection = select_ordered(store.load(), args.selectors, args.tag)
+            profile = profiles.create(args.name, selection, args.desc)
+            if args.jobs:
+                profile["jobs"] = args.jobs
+            store.save_profile(profiles.validate(profile))
+            print_json(profile)
+        elif args.profile_action == "export":
+            profile = store.find_profile(args.name)
+            if profile is None:
+                raise profiles.ProfileError("No profile named '%s'" % args.name)
+            profiles.export(profile, store.load(), args.file)
+            print_json({"profile": profile["name"], "file": args.file})
+        elif args.profile_action == "import":
+            profile, embedded = profiles.read_file(args.file)
+            if store.find_profile(profile["name"]) is not None and not args.replace:
+                raise profiles.ProfileError("A profile named '%s' exists, use --replace" % profile["name"])
+            added = profiles.missing_commands(embedded, store.load())
+            for command in added:
+                store.add(dict(command))
+            store.save_profile(profile)
+            print_json({"profile": profile["name"], "added_commands": [command["name"] for command in added]})
+        elif args.profile_action == "remove":
+            store.remove_profile(args.name)
+            print_json({"removed": args.name})
+    except (profiles.ProfileError, scheduler.SchedulerError, OSError) as e:
+        print_json({"error": str(e)})
+        return 2
+    finally:
+        store.close()
+    return 0
+
+def audit_commands(args):
+    commands = catalog.load_commands(args.catalog, read_only=True)
+    indexes = {id(command): index for index, command in enumerate(commands)}
+    executor.use_warm_shell = not args.no_warm_shell
+    audits = executor.probe_commands([command for command in commands if not args.tag or has_tag(command, args.tag)])
+    print_json([dict(audit.to_dict(), index=indexes[id(audit.command)]) for audit in audits])
+    return 0
+
+def clean_files(args):
+    roots = cleaner.expand_roots(args.roots or cleaner.DEFAULT_ROOTS)
+
+    def on_progress(report):
+        if not args.quiet:
+            print("%s: %d files, %s" % (report.root, report.files, cleaner.format_size(report.bytes)), file=sys.stderr, flush=True)
+
+    files_cleaner = cleaner.Cleaner(min_age=args.min_age_days * 86400, include=args.include, exclude=args.exclude,
+                                    dry_run=not args.delete, max_workers=args.jobs, on_progress=on_progress)
+    reports = files_cleaner.run(roots)
+    print_json({"dry_run": not args.delete, "roots": [report.to_dict() for report in reports],
+                "files": sum(report.files for report in reports), "bytes": sum(report.bytes for report in reports),
+                "removed_bytes": sum(report.removed_bytes for report in reports), "errors": sum(report.errors for report in reports)})
+    return 0
+
+def print_json(data):
+    json.dump(data, sys.stdout, indent=4, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="aurora_cli", description="Runs Aurora catalog commands without the GUI and prints JSON results.")
+    parser.add_argument("--catalog", default=catalog.CATALOG_FILE, help="catalog database (default: %(default)s)")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+
+    list_parser = subparsers.add_parser("list", help="print the catalog")
+    list_parser.add_argument("--tag", action="append", default=[], help="only commands with this tag")
+    list_parser.set_defaults(handler=list_commands)
+
+    run_parser = subparsers.add_parser("run", help="run commands by index, name or tag")
+    run_parser.add_argument("selectors", nargs="*", help="command indexes (see list) or names")
+    run_parser.add_argument("--tag", action="append", default=[], help="also run every command with this tag")
+    run_parser.add_argument("--jobs", type=int, default=executor.DEFAULT_MAX_WORKERS, help="commands run at the same time (default: %(default)s)")
+    run_parser.add_argument("--timeout", type=float, help="seconds after which a command is stopped, unless it sets its own timeout")
+    run_parser.add_argument("--dry-run", action="store_true", help="print the plan, with required commands, without running it")
+    run_parser.add_argument("--no-warm-shell", action="store_true", help="start a new PowerShell for every command")
+    run_parser.add_argument("--force", action="store_true", help="also run the commands whose check says they are already applied")
+    run_parser.add_argument("--quiet", action="store_true", help="don't report progress on stderr")
+    run_parser.set_defaults(handler=run_commands)
+
+    audit_parser = subparsers.add_parser("audit", help="tell which commands with a check are already applied, without running them")
+    audit_parser.add_argument("--tag", action="append", default=[], help="only commands with this tag")
+    audit_parser.add_argument("--no-warm-shell", action="store_true", help="read the state in a new PowerShell")
+    audit_parser.set_defaults(handler=audit_commands)
+
+    profile_parser = subparsers.add_parser("profile", help="create, export and import named profiles")
+    profile_subparsers = profile_parser.add_subparsers(dest="profile_action", required=True)
+    profile_subparsers.add_parser("list", help="print the stored profiles")
+    create_parser = profile_subparsers.add_parser("create", help="store the given commands, in this order, as a profile")
+    create_parser.add_argument("name", help="profile name; an existing profile with this name is replaced")
+    create_parser.add_argument("selectors", nargs="*", help="command indexes (see list) or names")
+    create_parser.add_argument("--tag", action="append", default=[], help="also add every command with this tag")
+    create_parser.add_argument("--desc", default="", help="description of the profile")
+    create_parser.add_argument("--jobs", type=int, help="commands run at the same time when the profile is applied")
+    export_parser = profile_subparsers.add_parser("export", help="write a profile and its commands to a file")
+    export_parser.add_argument("name")
+    export_parser.add_argument("file")
+    import_parser = profile_subparsers.add_parser("import", help="store the profile of a file, adding the commands this PC doesn't have")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--replace", action="store_true", help="replace a stored profile with the same name")
+    remove_parser = profile_subparsers.add_parser("remove", help="delete a stored profile")
+    remove_parser.add_argument("name")
+    profile_parser.set_defaults(handler=manage_profiles)
+
+    apply_parser = subparsers.add_parser("apply", help="run a stored or exported profile unattended and write a report for this PC")
+    apply_parser.add_argument("profile", help="name of a stored profile, or an exported profile file")
+    apply_parser.add_argument("--report-dir", default=profiles.REPORTS_DIR, help="folder the report is written to, e.g. a network share (default: %(default)s)")
+    apply_parser.add_argument("--jobs", type=int, help="commands run at the same time (default: the profile's, else %d)" % executor.DEFAULT_MAX_WORKERS)
+    apply_parser.add_argument("--timeout", type=float, help="seconds after which a command is stopped, unless it sets its own timeout")
+    apply_parser.add_argument("--dry-run", action="store_true", help="print the plan without running it")
+    apply_parser.add_argument("--no-warm-shell", action="store_true", help="start a new PowerShell for every command")
+    apply_parser.add_argument("--force", action="store_true", help="also run the commands whose check says they are already applied")
+    apply_parser.add_argument("--quiet", action="store_true", help="don't report progress on stderr")
+    apply_parser.set_defaults(handler=apply_profile)
+
+    clean_parser = subparsers.add_parser("clean", help="measure, or with --delete remove, temporary files")
+    clean_parser.add_argument("roots", nargs="*", help="folders to clean (default: temporary folders and browser caches)")
+    clean_parser.add_argument("--delete", action="store_true", help="remove the files, without it only their size is reported")
+    clean_parser.add_argument("--min-age-days", type=float, default=0, help="only files not changed for this many days")
+    clean_parser.add_argument("--include", action="append", default=[], help="only file names matching this pattern, e.g. *.tmp")
+    clean_parser.add_argument("--exclude", action="append", default=[], help="skip file names matching this pattern")
+    clean_parser.add_argument("--jobs", type=int, default=cleaner.DEFAULT_WORKERS, help="folders walked at the same time (default: %(default)s)")
+    clean_parser.add_argument("--quiet", action="store_true", help="don't report progress on stderr")
+    clean_parser.set_defaults(handler=clean_files)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(filename=LOG_FILE, level=logging.DEBUG,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        return args.handler(args)
+    except catalog.CatalogError as e:
+        print_json({"error": str(e)})
+        return 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+# Runs in a new interpreter: imports Aurora, opens the main window and reports when it was first shown
+PROBE = r"""
+import sys, json, time
+started = time.time()
+import wx
+import aurora
+imported = time.time()
+app = wx.App(False)
+# Without the first-run welcome dialog, whose modal loop would hold report back until it is closed
+frame = aurora.create_main_window(show_welcome=False)
+
+def report():
+    print(json.dumps({"started": started, "imported": imported, "shown": time.time(), "modules": len(sys.modules)}), flush=True)
+    app.ExitMainLoop()
+
+# Runs once the events queued while showing the window are handled
+wx.CallAfter(report)
+app.MainLoop()
+"""
+
+def measure():
+    launched = time.time()
+    process = subprocess.run([sys.executable, "-c", PROBE], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip() or "the probe exited with %d" % process.returncode)
+    times = json.loads(process.stdout.strip().splitlines()[-1])
+    return {"interpreter": times["started"] - launched, "imports": times["imported"] - times["started"],
+            "first_window": times["shown"] - launched, "modules": times["modules"]}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the time from launching Aurora to its first window.")
+    parser.add_argument("--runs", type=int, default=5, help="number of launches (default: %(default)s)")
+    args = parser.parse_args()
+
+    results = [measure() for _ in range(args.runs)]
+    for key in ("interpreter", "imports", "first_window"):
+        values = [result[key] * 1000 for result in results]
+        print("%-13s median %7.1f ms  min %7.1f ms  max %7.1f ms" % (key, statistics.median(values), min(values), max(values)))
+    print("modules loaded: %d" % results[-1]["modules"])
+
+if __name__ == "__main__":
+    main()
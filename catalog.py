@@ -0,0 +1,319 @@
+import os
+import sqlite3
+import pickle
+import json
+import threading
+import logging
+import hashlib
+import pathlib
+import taskmanifest
+from contextlib import contextmanager
+
+# File holding the command catalog, and the pickle file used by older versions
+CATALOG_FILE = "commands.db"
+LEGACY_FILE = "commands"
+
+SCHEMA_VERSION = 1
+
+# Keys of the shipped commands that the GUI doesn't edit, refreshed whenever the shipped file changes
+SHIPPED_KEYS = ("requires", "conflicts", "locks", "downloads", "timeout", "tags", "check")
+
+# Keys the user can edit; they follow the shipped file only while the user hasn't changed them
+EDITABLE_KEYS = ("desc", "cmd", "type", "resources", "cacheable")
+
+class Catalog:
+    """Command catalog stored in SQLite, one row per command.
+
+    Every change is a single-row transaction, so adding, editing, removing or moving one command
+    doesn't rewrite the whole catalog and an interrupted write can't corrupt the other commands.
+    Commands are plain dicts; the catalog adds an "id" key that identifies the row.
+    The same database keeps the named profiles of profiles.py, one row per profile.
+    With read_only an existing database is opened as it is, without any migration or merge.
+    """
+    def __init__(self, path=CATALOG_FILE, legacy_path=LEGACY_FILE, tasks_path=taskmanifest.TASKS_FILE, read_only=False):
+        self.path = path
+        self.lock = threading.Lock()
+        if read_only:
+            self.connection = sqlite3.connect("%s?mode=ro" % pathlib.Path(os.path.abspath(path)).as_uri(), uri=True,
+                                              check_same_thread=False, isolation_level=None)
+            return
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.create_schema()
+        if legacy_path:
+            # Only once, a catalog the user emptied stays empty
+            if self._get_meta("migrated_from") is None and self.count() == 0:
+                self.migrate_pickle(legacy_path)
+            self.merge_shipped(legacy_path)
+        if tasks_path:
+            self.import_tasks(tasks_path)
+
+    def create_schema(self):
+        with self.transaction() as cursor:
+            cursor.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            cursor.execute("CREATE TABLE IF NOT EXISTS commands (id INTEGER PRIMARY KEY AUTOINCREMENT, position REAL NOT NULL, name TEXT NOT NULL, data TEXT NOT NULL)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS commands_name ON commands (name)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS commands_position ON commands (position)")
+            cursor.execute("CREATE TABLE IF NOT EXISTS profiles (name TEXT PRIMARY KEY, data TEXT NOT NULL)")
+            row = cursor.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                cursor.execute("INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            elif int(row[0]) > SCHEMA_VERSION:
+                raise RuntimeError("The command catalog was created by a newer version of Aurora")
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
+    def migrate_pickle(self, legacy_path):
+        try:
+            with open(legacy_path, "rb") as file:
+                commands = pickle.load(file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.error("Error reading legacy commands file %s: %s", legacy_path, e)
+            return
+        with self.transaction() as cursor:
+            for position, command in enumerate(commands):
+                self._insert(cursor, command, float(position))
+            cursor.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)", (legacy_path,))
+        logging.info("Migrated %d commands from %s to %s", len(commands), legacy_path, self.path)
+
+    def _get_meta(self, key):
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def merge_shipped(self, legacy_path):
+        """Brings changes of the shipped commands file into a catalog migrated from an older one.
+
+        Runs whenever the file's digest changes, e.g. after an update. Shipped commands are
+        recognized by their "builtin" id, or by name for rows migrated before they had one.
+        SHIPPED_KEYS are taken from the file; EDITABLE_KEYS only where the row still has the
+        previously shipped value. Commands new in the file are added at the end, the ones the
+        user removed stay removed. Commands dropped from the file are removed too, unless the
+        user edited them.
+        """
+        try:
+            with open(legacy_path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return
+        digest = hashlib.sha256(data).hexdigest()
+        if self._get_meta("shipped_digest") == digest:
+            return
+        try:
+            shipped = [command for command in pickle.loads(data) if command.get("builtin")]
+        except Exception as e:
+            logging.error("Error reading shipped commands file %s: %s", legacy_path, e)
+            return
+        previous = json.loads(self._get_meta("shipped_commands") or "{}")
+        commands = self.load()
+        builtins = {command["builtin"]: command for command in commands if command.get("builtin")}
+        names = {}
+        for command in commands:
+            if not command.get("builtin"):
+                names.setdefault(command["name"], command)
+        added = updated = removed = 0
+        with self.transaction() as cursor:
+            position = cursor.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM commands").fetchone()[0]
+            for entry in shipped:
+                command = builtins.get(entry["builtin"]) or names.pop(entry["name"], None)
+                if command is None:
+                    # Without an earlier snapshot there's no telling new commands from removed ones
+                    if previous and entry["builtin"] not in previous:
+                        self._insert(cursor, dict(entry), position + added)
+                        added += 1
+                    continue
+                old = previous.get(entry["builtin"])
+                merged = dict(command, builtin=entry["builtin"])
+                for key in SHIPPED_KEYS:
+                    if key in entry:
+                        merged[key] = entry[key]
+                    else:
+                        merged.pop(key, None)
+                for key in EDITABLE_KEYS:
+                    if old is not None and command.get(key) == old.get(key):
+                        if key in entry:
+                            merged[key] = entry[key]
+                        else:
+                            merged.pop(key, None)
+                if merged != command:
+                    data = {key: value for key, value in merged.items() if key != "id"}
+                    cursor.execute("UPDATE commands SET data = ? WHERE id = ?", (json.dumps(data), command["id"]))
+                    updated += 1
+            shipped_ids = {entry["builtin"] for entry in shipped}
+            for builtin, old in previous.items():
+                command = builtins.get(builtin)
+                if builtin in shipped_ids or command is None:
+                    continue
+                if all(command.get(key) == old.get(key) for key in EDITABLE_KEYS):
+                    cursor.execute("DELETE FROM commands WHERE id = ?", (command["id"],))
+                    removed += 1
+            cursor.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('shipped_digest', ?)", (digest,))
+            cursor.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('shipped_commands', ?)",
+                           (json.dumps({entry["builtin"]: entry for entry in shipped}),))
+        logging.info("Merged shipped commands from %s: %d added, %d updated, %d removed", legacy_path, added, updated, removed)
+
+    def import_tasks(self, tasks_path):
+        """Adds the tasks of a manifest (see taskmanifest) that the catalog doesn't have yet.
+
+        Runs once per manifest revision. Tasks are recognized by their "task" id; the ids imported
+        before are kept, so a task the user removed stays removed in later revisions. A task named
+        like an existing command is skipped, since commands are looked up by name. Tasks already in
+        the catalog only get the manifest's taskmanifest.MANAGED_KEYS, which the GUI doesn't edit.
+        """
+        try:
+            revision, entries = taskmanifest.load_entries(tasks_path)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logging.error("Error reading task manifest %s: %s", tasks_path, e)
+            return
+        known = self._get_meta("tasks_revision")
+        if known is not None and int(known) >= revision:
+            return
+        imported = set(json.loads(self._get_meta("imported_tasks") or "[]"))
+        commands = self.load()
+        tasks = {command["task"]: command for command in commands if command.get("task")}
+        names = {command["name"] for command in commands}
+        added = 0
+        with self.transaction() as cursor:
+            position = cursor.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM commands").fetchone()[0]
+            for entry in entries:
+                if entry["task"] in tasks:
+                    command = tasks[entry["task"]]
+                    for key in taskmanifest.MANAGED_KEYS:
+                        if key in entry:
+                            command[key] = entry[key]
+                        else:
+                            command.pop(key, None)
+                    data = {key: value for key, value in command.items() if key != "id"}
+                    cursor.execute("UPDATE commands SET data = ? WHERE id = ?", (json.dumps(data), command["id"]))
+                    continue
+                if entry["task"] in imported:
+                    continue
+                if entry["name"] in names:
+                    logging.info("Task %s not imported, a command named '%s' exists", entry["task"], entry["name"])
+                    continue
+                self._insert(cursor, entry, position + added)
+                imported.add(entry["task"])
+                added += 1
+            cursor.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('tasks_revision', ?)", (str(revision),))
+            cursor.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('imported_tasks', ?)", (json.dumps(sorted(imported | set(tasks))),))
+        logging.info("Imported %d tasks from %s, revision %d", added, tasks_path, revision)
+
+    def _insert(self, cursor, command, position):
+        data = {key: value for key, value in command.items() if key != "id"}
+        cursor.execute("INSERT INTO commands (position, name, data) VALUES (?, ?, ?)", (position, command["name"], json.dumps(data)))
+        command["id"] = cursor.lastrowid
+
+    def count(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM commands").fetchone()[0]
+
+    def load(self):
+        """Returns all commands in list order."""
+        with self.lock:
+            rows = self.connection.execute("SELECT id, data FROM commands ORDER BY position, id").fetchall()
+        commands = []
+        for id, data in rows:
+            command = json.loads(data)
+            command["id"] = id
+            commands.append(command)
+        return commands
+
+    def find(self, name):
+        """Returns the first command with the given name, or None."""
+        with self.lock:
+            row = self.connection.execute("SELECT id, data FROM commands WHERE name = ? ORDER BY position LIMIT 1", (name,)).fetchone()
+        if row is None:
+            return None
+        command = json.loads(row[1])
+        command["id"] = row[0]
+        return command
+
+    def add(self, command):
+        """Appends a command at the end of the list and sets its id."""
+        with self.transaction() as cursor:
+            position = cursor.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM commands").fetchone()[0]
+            self._insert(cursor, command, position)
+        return command
+
+    def update(self, command):
+        data = {key: value for key, value in command.items() if key != "id"}
+        with self.transaction() as cursor:
+            cursor.execute("UPDATE commands SET name = ?, data = ? WHERE id = ?", (command["name"], json.dumps(data), command["id"]))
+
+    def remove(self, command):
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM commands WHERE id = ?", (command["id"],))
+
+    def move_to_top(self, command):
+        with self.transaction() as cursor:
+            cursor.execute("UPDATE commands SET position = (SELECT COALESCE(MIN(position), 0) - 1 FROM commands) WHERE id = ?", (command["id"],))
+
+    def move_to_bottom(self, command):
+        with self.transaction() as cursor:
+            cursor.execute("UPDATE commands SET position = (SELECT COALESCE(MAX(position), 0) + 1 FROM commands) WHERE id = ?", (command["id"],))
+
+    def reorder(self, commands):
+        """Stores the order of the given list, e.g. after sorting."""
+        with self.transaction() as cursor:
+            cursor.executemany("UPDATE commands SET position = ? WHERE id = ?", [(float(position), command["id"]) for position, command in enumerate(commands)])
+
+    def load_profiles(self):
+        """Returns all profiles sorted by name."""
+        with self.lock:
+            rows = self.connection.execute("SELECT data FROM profiles ORDER BY name COLLATE NOCASE").fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def find_profile(self, name):
+        """Returns the profile with the given name, or None."""
+        with self.lock:
+            row = self.connection.execute("SELECT data FROM profiles WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def save_profile(self, profile):
+        """Stores a profile, replacing the one with the same name."""
+        with self.transaction() as cursor:
+            cursor.execute("INSERT OR REPLACE INTO profiles (name, data) VALUES (?, ?)", (profile["name"], json.dumps(profile)))
+
+    def remove_profile(self, name):
+        with self.transaction() as cursor:
+            cursor.execute("DELETE FROM profiles WHERE name = ?", (name,))
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class CatalogError(Exception):
+    """Raised when the catalog can't be read."""
+
+def load_commands(path=CATALOG_FILE, read_only=False):
+    """Returns the commands of the catalog at path; raises CatalogError when it can't be read.
+
+    With read_only nothing is written: an existing catalog is read as it is, and without one the
+    commands are those a new catalog would start with.
+    """
+    try:
+        if read_only and not os.path.exists(path):
+            catalog = Catalog(":memory:")
+        else:
+            catalog = Catalog(path, read_only=read_only)
+        try:
+            return catalog.load()
+        finally:
+            catalog.close()
+    except Exception as e:
+        logging.error("Error loading commands: %s", e)
+        raise CatalogError("Could not load the command catalog %s: %s" % (path, e))
@@ -0,0 +1,168 @@
+import os
+import stat
+import glob
+import time
+import fnmatch
+import logging
+import artifacts
+from concurrent.futures import ThreadPoolExecutor
+
+# Folders emptied by the built-in cleaner; the same ones as the "clear folders" entry plus browser caches
+DEFAULT_ROOTS = [
+    "%SystemRoot%\\Prefetch",
+    "%TEMP%",
+    "%SystemRoot%\\Temp",
+    "%USERPROFILE%\\AppData\\Local\\Temp",
+    "%LOCALAPPDATA%\\Microsoft\\Edge\\User Data\\Default\\Cache",
+    "%LOCALAPPDATA%\\Google\\Chrome\\User Data\\Default\\Cache",
+    "%APPDATA%\\Mozilla\\Firefox\\Profiles\\*\\cache2",
+]
+
+# Roots walked at the same time
+DEFAULT_WORKERS = 4
+
+# Files handled between two progress reports of a root
+PROGRESS_EVERY = 500
+
+class RootReport:
+    """What was found, and removed, under one root."""
+    def __init__(self, root):
+        self.root = root
+        self.files = 0
+        self.bytes = 0
+        self.removed_files = 0
+        self.removed_bytes = 0
+        self.errors = 0
+        self.finished = False
+
+    def to_dict(self):
+        return {"root": self.root, "files": self.files, "bytes": self.bytes, "removed_files": self.removed_files,
+                "removed_bytes": self.removed_bytes, "errors": self.errors}
+
+def expand_roots(roots):
+    """Expands variables and wildcards in root paths, dropping missing and repeated folders."""
+    expanded = []
+    seen = set()
+    for root in roots:
+        for path in sorted(glob.glob(artifacts.expand_path(root))) if "*" in root else [artifacts.expand_path(root)]:
+            key = os.path.normcase(os.path.realpath(path))
+            if os.path.isdir(path) and key not in seen:
+                seen.add(key)
+                expanded.append(path)
+    return expanded
+
+class Cleaner:
+    """Finds and removes files under a set of folders, walking each folder in its own thread.
+
+    Only files older than min_age seconds are taken. include and exclude are lists of file name
+    patterns such as "*.tmp". With dry_run nothing is removed and the reports tell how much
+    would be freed. Files that can't be removed, such as files in use, are counted as errors
+    and left in place; folders this run emptied are removed, the roots themselves are kept.
+    Junctions and other directory links are never followed nor removed.
+    on_progress is called with a RootReport from the worker threads while a root is walked.
+    """
+    def __init__(self, min_age=0, include=None, exclude=None, dry_run=True, max_workers=DEFAULT_WORKERS,
+                 on_progress=None, cancel_event=None, clock=time.time):
+        self.min_age = min_age
+        self.include = include or []
+        self.exclude = exclude or []
+        self.dry_run = dry_run
+        self.max_workers = max(1, int(max_workers))
+        self.on_progress = on_progress
+        self.cancel_event = cancel_event
+        self.clock = clock
+
+    def matches(self, name, mtime, now):
+        if self.min_age and now - mtime < self.min_age:
+            return False
+        if self.include and not any(fnmatch.fnmatch(name, pattern) for pattern in self.include):
+            return False
+        return not any(fnmatch.fnmatch(name, pattern) for pattern in self.exclude)
+
+    def run(self, roots):
+        """Cleans the given folders and returns a RootReport for each, in the same order."""
+        reports = [RootReport(root) for root in roots]
+        if reports:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(reports))) as pool:
+                list(pool.map(self._clean_root, reports))
+        return reports
+
+    def _report(self, report):
+        if self.on_progress:
+            try:
+                self.on_progress(report)
+            except Exception as e:
+                logging.error("Error reporting cleaning progress: %s", e)
+
+    def _cancelled(self):
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def _clean_root(self, report):
+        now = self.clock()
+        folders = []
+        # Entries found in each folder, entries of it removed by this run, and the parent of each subfolder
+        found = {}
+        removed = {}
+        parents = {}
+        stack = [report.root]
+        while stack and not self._cancelled():
+            folder = stack.pop()
+            folders.append(folder)
+            removed[folder] = 0
+            try:
+                entries = list(os.scandir(folder))
+            except OSError as e:
+                logging.info("Can't read %s: %s", folder, e)
+                report.errors += 1
+                continue
+            found[folder] = len(entries)
+            for entry in entries:
+                try:
+                    info = entry.stat(follow_symlinks=False)
+                    # A junction is a directory to is_dir even without following links; it's left alone
+                    if getattr(info, "st_file_attributes", 0) & getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0x400) and entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        parents[entry.path] = folder
+                        stack.append(entry.path)
+                        continue
+                except OSError:
+                    report.errors += 1
+                    continue
+                # Other links are removed as files, never followed
+                if not self.matches(entry.name, info.st_mtime, now):
+                    continue
+                report.files += 1
+                report.bytes += info.st_size
+                if not self.dry_run:
+                    try:
+                        os.remove(entry.path)
+                        report.removed_files += 1
+                        report.removed_bytes += info.st_size
+                        removed[folder] += 1
+                    except OSError:
+                        report.errors += 1
+                if report.files % PROGRESS_EVERY == 0:
+                    self._report(report)
+        if not self.dry_run:
+            # Deepest folders first, so a parent knows whether all its subfolders went away.
+            # Only folders whose every entry this run removed are taken, not ones that were already empty.
+            for folder in reversed(folders[1:]):
+                if not found.get(folder) or removed[folder] != found[folder]:
+                    continue
+                try:
+                    os.rmdir(folder)
+                    removed[parents[folder]] += 1
+                except OSError:
+                    pass
+        report.finished = True
+        logging.info("Cleaned %s: %d files, %d bytes, %d errors%s", report.root, report.files, report.bytes, report.errors,
+                      " (dry run)" if self.dry_run else "")
+        self._report(report)
+        return report
+
+def format_size(size):
+    for unit in ("bytes", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return ("%d %s" if unit == "bytes" else "%.1f %s") % (size, unit)
+        size /= 1024.0
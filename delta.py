@@ -0,0 +1,168 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import logging
+import requests
+import download
+
+# Release asset describing every shipped file with its hash
+MANIFEST_NAME = "manifest.json"
+
+# Folder, inside the installation folder, where changed files are downloaded before they are applied
+STAGING_DIR = ".update-staging"
+
+# Suffix of the previous copy of a replaced file, removed on the next update
+BACKUP_SUFFIX = ".old"
+
+class UpdateError(Exception):
+    pass
+
+def build_manifest(directory, version, paths=None):
+    """Returns the manifest of the given files (relative paths, default: every file in directory).
+
+    Files in sub folders are published as assets named after their path with "__" between the parts,
+    since release assets can't contain slashes.
+    """
+    if paths is None:
+        paths = []
+        for current, folders, files in os.walk(directory):
+            for name in files:
+                paths.append(os.path.relpath(os.path.join(current, name), directory))
+    files = {}
+    for path in sorted(paths):
+        full_path = os.path.join(directory, path)
+        relative = path.replace(os.sep, "/")
+        files[relative] = {"sha256": download.sha256_of_file(full_path), "size": os.path.getsize(full_path), "asset": relative.replace("/", "__")}
+    return {"version": version, "files": files}
+
+def fetch_manifest(release, session=None, timeout=download.DEFAULT_TIMEOUT):
+    """Returns the manifest published with a release, or None for releases without one.
+
+    The manifest decides which files are replaced, so it is checked against the SHA-256 the release
+    publishes for it; UpdateError is raised when there is none or it doesn't match.
+    """
+    asset = download.find_asset(release, MANIFEST_NAME)
+    if asset is None:
+        return None
+    session = session or requests.Session()
+    sha256 = download.release_asset_sha256(release, MANIFEST_NAME, session, timeout)
+    if sha256 is None:
+        raise UpdateError("The release does not publish a checksum for %s" % MANIFEST_NAME)
+    response = session.get(asset["browser_download_url"], timeout=timeout)
+    if response.status_code != 200:
+        raise UpdateError("Could not download the update manifest, HTTP status %d" % response.status_code)
+    if hashlib.sha256(response.content).hexdigest() != sha256.lower():
+        raise UpdateError("The checksum of %s does not match the release" % MANIFEST_NAME)
+    return json.loads(response.content.decode("utf-8"))
+
+def local_file(root, path):
+    """Returns where a manifest path goes under root.
+
+    Raises UpdateError for absolute paths, ".." parts and anything else that would end up outside root.
+    """
+    parts = path.split("/")
+    if not path or os.path.isabs(path) or "\\" in path or ":" in path or any(part in ("", ".", "..") for part in parts):
+        raise UpdateError("Invalid path in the update manifest: %s" % path)
+    local_path = os.path.join(root, *parts)
+    real_root = os.path.realpath(root)
+    if os.path.commonpath([real_root, os.path.realpath(local_path)]) != real_root:
+        raise UpdateError("Invalid path in the update manifest: %s" % path)
+    return local_path
+
+def asset_name(path, info):
+    """Returns the release asset holding a manifest path, which is also its name in the staging folder."""
+    name = info.get("asset", path.replace("/", "__"))
+    if not name or name in (".", "..") or "/" in name or "\\" in name or ":" in name:
+        raise UpdateError("Invalid asset name in the update manifest: %s" % name)
+    return name
+
+def changed_files(manifest, root):
+    """Returns the manifest paths whose local copy is missing or different.
+
+    Raises UpdateError if a path of the manifest is not inside root.
+    """
+    changed = []
+    for path, info in manifest["files"].items():
+        local_path = local_file(root, path)
+        asset_name(path, info)
+        # Comparing sizes first avoids hashing big files that obviously changed
+        if not os.path.isfile(local_path) or os.path.getsize(local_path) != info["size"]:
+            changed.append(path)
+        elif download.sha256_of_file(local_path) != info["sha256"].lower():
+            changed.append(path)
+    return changed
+
+def cleanup_backups(root):
+    """Removes the copies left by a previous update; a file still in use is left for next time."""
+    for current, folders, files in os.walk(root):
+        if STAGING_DIR in folders:
+            folders.remove(STAGING_DIR)
+        for name in files:
+            if name.endswith(BACKUP_SUFFIX):
+                try:
+                    os.remove(os.path.join(current, name))
+                except OSError:
+                    pass
+
+def apply_update(manifest, release, root, paths, on_progress=None, cancel_event=None):
+    """Downloads the given manifest paths into a staging folder, then swaps them in.
+
+    Nothing is replaced until every file is downloaded and verified. Files are then moved into place
+    one by one, keeping the previous copy with a .old suffix; if a move fails, the files already
+    replaced are restored, so the installation is either fully updated or left as it was.
+    on_progress receives (downloaded bytes, total bytes) over all files.
+    """
+    staging = os.path.join(root, STAGING_DIR)
+    os.makedirs(staging, exist_ok=True)
+    total = sum(manifest["files"][path]["size"] for path in paths)
+    completed = 0
+    staged = []
+    for path in paths:
+        info = manifest["files"][path]
+        local_file(root, path)
+        name = asset_name(path, info)
+        asset = download.find_asset(release, name)
+        if asset is None:
+            raise UpdateError("The release does not contain %s" % path)
+        staged_path = os.path.join(staging, name)
+        progress = (lambda done, size, base=completed: on_progress(base + done, total)) if on_progress else None
+        download.download(asset["browser_download_url"], staged_path, info["sha256"], progress, cancel_event)
+        completed += info["size"]
+        staged.append((path, staged_path))
+
+    replaced = []
+    try:
+        for path, staged_path in staged:
+            local_path = local_file(root, path)
+            os.makedirs(os.path.dirname(local_path) or root, exist_ok=True)
+            backup_path = local_path + BACKUP_SUFFIX
+            if os.path.exists(local_path):
+                # A running executable can't be overwritten on Windows, but it can be renamed
+                if os.path.exists(backup_path):
+                    os.remove(backup_path)
+                os.replace(local_path, backup_path)
+            replaced.append((local_path, backup_path))
+            os.replace(staged_path, local_path)
+    except OSError as e:
+        logging.error("Error applying update, restoring previous files: %s", e)
+        for local_path, backup_path in reversed(replaced):
+            try:
+                if os.path.exists(backup_path):
+                    os.replace(backup_path, local_path)
+                elif os.path.exists(local_path):
+                    os.remove(local_path)
+            except OSError as restore_error:
+                logging.error("Error restoring %s: %s", local_path, restore_error)
+        raise UpdateError("Could not apply the update: %s" % e)
+    shutil.rmtree(staging, ignore_errors=True)
+    logging.info("Updated %d files to %s", len(staged), manifest.get("version"))
+    return [path for path, staged_path in staged]
+
+if __name__ == "__main__":
+    # Writes the manifest to publish with a release: python delta.py <release folder> <tag>
+    if len(sys.argv) != 3:
+        print("usage: python delta.py <release folder> <tag>")
+        sys.exit(1)
+    json.dump(build_manifest(sys.argv[1], sys.argv[2]), sys.stdout, indent=4)
@@ -0,0 +1,192 @@
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+import requests
+
+# Bytes read from the network and written to disk at a time
+CHUNK_SIZE = 64 * 1024
+
+# Seconds to wait for the connection and between two chunks
+DEFAULT_TIMEOUT = (10, 60)
+
+# Times an interrupted download is resumed before giving up
+DEFAULT_RETRIES = 3
+
+class DownloadError(Exception):
+    pass
+
+class DownloadCancelled(DownloadError):
+    pass
+
+def sha256_of_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def download(url, destination, sha256=None, on_progress=None, cancel_event=None, session=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES):
+    """Downloads url to destination, writing chunks straight to disk.
+
+    The data is written to destination + ".part" first, with the server's ETag or Last-Modified
+    kept next to it. If that file already exists, for example after a dropped connection, the
+    download continues from where it stopped with an HTTP Range request, sent with If-Range so a
+    file that changed on the server since is downloaded again from the start. When sha256 is
+    given the file is checked before it is moved to destination.
+    on_progress is called with (downloaded bytes, total bytes or None) from the calling thread.
+    """
+    session = session or requests.Session()
+    part_path = destination + ".part"
+    attempt = 0
+    while True:
+        try:
+            _download_part(url, part_path, on_progress, cancel_event, session, timeout)
+            break
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            attempt += 1
+            if attempt > retries:
+                raise DownloadError("Download of %s failed: %s" % (url, e))
+            logging.warning("Download of %s interrupted (%s), resuming, attempt %d of %d", url, e, attempt, retries)
+
+    if sha256:
+        actual = sha256_of_file(part_path)
+        if actual.lower() != sha256.lower():
+            _discard_part(part_path)
+            raise DownloadError("Checksum mismatch for %s: expected %s, got %s" % (url, sha256, actual))
+    os.replace(part_path, destination)
+    _remove(_validator_path(part_path))
+    logging.info("Downloaded %s to %s", url, destination)
+    return destination
+
+def _validator_path(part_path):
+    return part_path + ".json"
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _discard_part(part_path):
+    _remove(part_path)
+    _remove(_validator_path(part_path))
+
+def _read_validator(part_path):
+    try:
+        with open(_validator_path(part_path), "r", encoding="utf-8") as file:
+            validator = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return validator if isinstance(validator, dict) and validator.get("if_range") else None
+
+def _write_validator(part_path, response, total):
+    # Weak ETags can't be used with If-Range; without a validator the part is never resumed
+    etag = response.headers.get("ETag")
+    if_range = etag if etag and not etag.startswith("W/") else response.headers.get("Last-Modified")
+    with open(_validator_path(part_path), "w", encoding="utf-8") as file:
+        json.dump({"if_range": if_range, "length": total}, file)
+
+def _content_range(response):
+    """Returns (first byte, total size) of a Content-Range header, None for parts it doesn't give."""
+    match = re.match(r"bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)", response.headers.get("Content-Range", ""))
+    if not match:
+        return None, None
+    return (int(match.group(1)) if match.group(1) else None), (int(match.group(2)) if match.group(2) != "*" else None)
+
+def _download_part(url, part_path, on_progress, cancel_event, session, timeout):
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    validator = _read_validator(part_path) if offset else None
+    headers = {}
+    if offset and validator:
+        headers = {"Range": "bytes=%d-" % offset, "If-Range": validator["if_range"]}
+    else:
+        # A part without validator may be from an older version of the file
+        offset = 0
+    with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        start, size = _content_range(response)
+        if response.status_code == 416 and offset:
+            if size == offset and size == validator.get("length"):
+                # The previous attempt already got the whole file
+                return
+            logging.info("Partial download of %s doesn't match the file on the server, starting over", url)
+            _discard_part(part_path)
+            return _download_part(url, part_path, on_progress, cancel_event, session, timeout)
+        if response.status_code == 206 and offset:
+            if start != offset or (validator.get("length") is not None and size != validator["length"]):
+                logging.info("Partial download of %s doesn't match the file on the server, starting over", url)
+                _discard_part(part_path)
+                return _download_part(url, part_path, on_progress, cancel_event, session, timeout)
+            mode = "ab"
+            total = size
+        elif response.status_code == 200:
+            # The server ignored the range, or the file changed since the part was written: start over
+            offset = 0
+            mode = "wb"
+            length = response.headers.get("Content-Length")
+            total = int(length) if length is not None else None
+            _write_validator(part_path, response, total)
+        else:
+            raise DownloadError("Download of %s failed with HTTP status %d" % (url, response.status_code))
+
+        downloaded = offset
+        if on_progress:
+            on_progress(downloaded, total)
+        with open(part_path, mode) as file:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise DownloadCancelled("Download of %s cancelled" % url)
+                file.write(chunk)
+                downloaded += len(chunk)
+                if on_progress:
+                    on_progress(downloaded, total)
+        if total is not None and downloaded < total:
+            raise requests.exceptions.ChunkedEncodingError("Connection closed after %d of %d bytes" % (downloaded, total))
+
+def find_asset(release, name):
+    for asset in release.get("assets", []):
+        if asset.get("name") == name:
+            return asset
+    return None
+
+def release_asset_sha256(release, name, session=None, timeout=DEFAULT_TIMEOUT):
+    """Returns the SHA-256 of a release asset from the release metadata, or None if it isn't published.
+
+    GitHub reports a "digest" for each asset; older releases can ship a "<name>.sha256" asset instead.
+    """
+    asset = find_asset(release, name)
+    if asset and str(asset.get("digest", "")).startswith("sha256:"):
+        return asset["digest"].split(":", 1)[1]
+    checksum_asset = find_asset(release, name + ".sha256")
+    if checksum_asset:
+        session = session or requests.Session()
+        response = session.get(checksum_asset["browser_download_url"], timeout=timeout)
+        if response.status_code == 200 and response.text.strip():
+            return response.text.split()[0]
+    return None
+
+class DownloadThread(threading.Thread):
+    """Runs download() in the background; on_done is called with (destination, error) when it ends."""
+    def __init__(self, url, destination, sha256=None, on_progress=None, on_done=None):
+        super(DownloadThread, self).__init__(daemon=True)
+        self.url = url
+        self.destination = destination
+        self.sha256 = sha256
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            download(self.url, self.destination, self.sha256, self.on_progress, self.cancel_event)
+            error = None
+        except Exception as e:
+            logging.error("Error downloading %s: %s", self.url, e)
+            error = e
+        if self.on_done:
+            self.on_done(self.destination, error)
@@ -0,0 +1,381 @@
+import threading
+import logging
+import time
+import functools
+import streaming
+import shellhost
+import resultcache
+import telemetry
+import artifacts
+import governor
+import probes
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Default number of catalog entries that may run at the same time
+DEFAULT_MAX_WORKERS = 4
+
+# Per-command states reported while a batch runs
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+CANCELLED = "cancelled"
+APPLIED = "applied"
+
+# PowerShell entries run in the warm hosts of shellhost instead of a new powershell process
+use_warm_shell = True
+
+# PowerShell command run once, before the first PowerShell entry, to allow scripts
+powershell_setup = "Set-ExecutionPolicy Unrestricted -Scope CurrentUser -Force"
+_setup_lock = threading.Lock()
+_setup_done = False
+
+# Seconds after which an entry is stopped, None for no limit; an entry's own "timeout" wins
+default_timeout = None
+
+# Installers downloaded at the same time before the entries of a batch run
+download_connections = artifacts.DEFAULT_CONNECTIONS
+
+# Lock held by entries with "downloads", so installers run one at a time
+INSTALLER_LOCK = "installer"
+
+# Seconds the state probes of a batch may take
+PROBE_TIMEOUT = 120
+
+# Results of entries marked "cacheable", cleared whenever any other entry runs
+result_cache = resultcache.ResultCache()
+
+def build_command_args(command, type):
+    """Returns the argument list used to launch a catalog command, or None for unsupported types."""
+    if "CMD" in type.upper():
+        return ["cmd", "/c", command]
+    elif "POWERSHELL" in type.upper():
+        return ["powershell", "-Command", command]
+    return None
+
+def ensure_powershell_setup():
+    """Runs powershell_setup the first time a PowerShell entry is about to run.
+
+    Entries started meanwhile wait for it, so they all see its effect. A failure is logged
+    and not retried.
+    """
+    global _setup_done
+    if _setup_done or not powershell_setup:
+        return
+    with _setup_lock:
+        if _setup_done:
+            return
+        try:
+            if use_warm_shell and shellhost.enabled():
+                returncode, output = shellhost.run_powershell(powershell_setup)
+            else:
+                returncode, output = streaming.stream_process(build_command_args(powershell_setup, "Powershell"), shell=True)
+            if returncode != 0:
+                logging.error("Error running PowerShell setup: %s", output)
+        except Exception as e:
+            logging.error("Error running PowerShell setup: %s", e)
+        _setup_done = True
+
+def runs_in_warm_host(command, type, profile=None):
+    """Tells whether execute_command runs a command in a pooled PowerShell host instead of its own process."""
+    # Scripts that call exit or read input get a process of their own, see shellhost.needs_own_process
+    return use_warm_shell and shellhost.enabled() and "POWERSHELL" in type.upper() and profile is None and not shellhost.needs_own_process(command)
+
+def execute_command(command, type, on_output=None, on_start=None, cancel_event=None, timeout=None, resources=None):
+    """Runs a single catalog command and returns (returncode, output).
+
+    on_output receives the output in batches while the command is still running.
+    Setting cancel_event, or running longer than timeout seconds, kills the command and its
+    children and raises streaming.CommandCancelled.
+    resources is a governor profile name or dict; such a command gets its own process instead
+    of a warm host, so its limits don't stick to the host.
+    """
+    args = build_command_args(command, type)
+    if args is None:
+        raise ValueError("Unsupported command type: %s" % type)
+    if "POWERSHELL" in type.upper():
+        ensure_powershell_setup()
+    profile = governor.resolve(resources)
+    if runs_in_warm_host(command, type, profile):
+        return shellhost.run_powershell(command, on_output=on_output, on_start=on_start, cancel_event=cancel_event, timeout=timeout)
+
+    def started(pid):
+        governor.apply(pid, profile)
+        if on_start:
+            on_start(pid)
+
+    return streaming.stream_process(args, on_output, on_start=started, cancel_event=cancel_event, timeout=timeout, shell=True,
+                                    **governor.popen_kwargs(profile))
+
+def prepare_downloads(command, on_output=None, cancel_event=None):
+    """Puts the files listed in a command's "downloads" where the command expects them.
+
+    Each item is {"url", "path", optional "sha256"}; the files are downloaded in parallel into
+    the artifact cache, so an installer is only downloaded once. Returns an error message, or None.
+    """
+    downloads = command.get("downloads", [])
+    errors = artifacts.prefetch(downloads, download_connections, cancel_event=cancel_event)
+    if cancel_event is not None and cancel_event.is_set():
+        raise streaming.CommandCancelled("Cancelled")
+    if errors:
+        return "".join("Could not download %s: %s\n" % (url, error) for url, error in errors.items())
+    for item in downloads:
+        destination = artifacts.expand_path(item["path"])
+        try:
+            artifacts.get_cache().materialize(item["url"], destination, item.get("sha256"), cancel_event=cancel_event)
+        except Exception as e:
+            logging.error("Error preparing %s for %s: %s", item["url"], command.get("name"), e)
+            return "Could not download %s: %s\n" % (item["url"], e)
+        if on_output:
+            on_output("Prepared %s\n" % destination)
+    return None
+
+def execute_recorded(command, on_output=None, cancel_event=None, record=True):
+    """Runs a catalog command dict and writes its execution record to the telemetry store.
+
+    With record False, e.g. for queries Aurora runs itself, nothing is written.
+    """
+    output_bytes = [0]
+    sampler = telemetry.RssSampler()
+
+    def count_output(chunk):
+        output_bytes[0] += len(chunk.encode("utf-8", "replace"))
+        if on_output:
+            on_output(chunk)
+
+    started = time.time()
+    returncode = None
+    try:
+        error = prepare_downloads(command, count_output, cancel_event)
+        if error is not None:
+            returncode = 1
+            return returncode, error
+        # A pooled host is shared by every command run in it, so only the processes the command starts are measured
+        if runs_in_warm_host(command["cmd"], command["type"], governor.resolve(command.get("resources"))):
+            on_start = functools.partial(sampler.start, children_only=True)
+        else:
+            on_start = sampler.start
+        returncode, output = execute_command(command["cmd"], command["type"], count_output, on_start=on_start,
+                                             cancel_event=cancel_event, timeout=command.get("timeout", default_timeout),
+                                             resources=command.get("resources"))
+        return returncode, output
+    finally:
+        peak_rss = sampler.stop()
+        if record:
+            telemetry.record(command, started, time.time(), returncode, output_bytes[0], peak_rss)
+
+def execute_entry(command, on_output=None, cancel_event=None, record=True):
+    """Runs a catalog command dict and returns (returncode, output).
+
+    Entries marked "cacheable" are read-only; a fresh result of the same command is served from
+    result_cache. Any other entry may change the system, so it clears the cache.
+    """
+    if not command.get("cacheable"):
+        result_cache.clear()
+        try:
+            return execute_recorded(command, on_output, cancel_event, record)
+        finally:
+            result_cache.clear()
+
+    result = result_cache.get(command["cmd"], command["type"])
+    if result is not None:
+        logging.info("Using cached result of %s", command.get("name", command["cmd"]))
+        if on_output and result[1]:
+            on_output(result[1])
+        return result
+    generation = result_cache.generation
+    result = execute_recorded(command, on_output, cancel_event, record)
+    if result[0] == 0:
+        result_cache.put(command["cmd"], command["type"], result, generation)
+    return result
+
+def probe_commands(commands, cancel_event=None):
+    """Reads the state of every entry with a "check" in one PowerShell pass, see probes.audit."""
+    def run(script):
+        return execute_command(script, "Powershell", cancel_event=cancel_event, timeout=PROBE_TIMEOUT)
+    return probes.audit(commands, run)
+
+class CommandJob:
+    """Tracks one catalog entry inside a batch."""
+    def __init__(self, command):
+        self.command = command
+        self.name = command["name"]
+        self.state = QUEUED
+        self.returncode = None
+        self.output = ""
+        self.started = None
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def to_dict(self):
+        return {"name": self.name, "state": self.state, "returncode": self.returncode,
+                "elapsed": round(self.elapsed, 3), "output": self.output}
+
+class BatchResult:
+    def __init__(self, jobs, elapsed):
+        self.jobs = jobs
+        self.elapsed = elapsed
+
+    @property
+    def failed(self):
+        return [job for job in self.jobs if job.state in (FAILED, SKIPPED, CANCELLED)]
+
+    def summary(self):
+        lines = ["%s: %s (%.1fs)" % (job.name, job.state, job.elapsed) for job in self.jobs]
+        lines.append("")
+        lines.append("%d of %d commands succeeded, total time %.1fs" % (len(self.jobs) - len(self.failed), len(self.jobs), self.elapsed))
+        return "\n".join(lines)
+
+def command_locks(command):
+    """Returns the locks an entry holds while it runs: its "locks", plus INSTALLER_LOCK when it has downloads."""
+    locks = set(command.get("locks", []))
+    if command.get("downloads"):
+        locks.add(INSTALLER_LOCK)
+    return locks
+
+class BatchExecutor:
+    """Runs several catalog entries on a bounded pool of worker threads.
+
+    on_update is called with a CommandJob every time its state changes, from the worker thread.
+    Installers declared in "downloads" are all fetched in parallel before anything runs, then the
+    entries that use them run one at a time in selection order, since installers don't run well
+    side by side. Entries naming the same lock in "locks" are kept apart the same way.
+    on_prefetch is called with (item, error) as each of those downloads ends.
+    runner is called as runner(command, cancel_event); cancel() stops the running entries and
+    skips the ones that haven't started.
+    With skip_applied, the entries with a "check" are probed together before the batch starts and
+    the ones already in their target state end as APPLIED without running; prober is called as
+    prober(commands, cancel_event) and returns probes.Audit objects.
+    """
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, runner=execute_entry, on_update=None, on_prefetch=None, cancel_event=None,
+                 skip_applied=False, prober=probe_commands):
+        self.max_workers = max(1, int(max_workers))
+        self.runner = runner
+        self.skip_applied = skip_applied
+        self.prober = prober
+        self.on_update = on_update
+        self.on_prefetch = on_prefetch
+        self.cancel_event = cancel_event or threading.Event()
+        self.lock = threading.Lock()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _set_state(self, job, state):
+        with self.lock:
+            job.state = state
+        if self.on_update:
+            try:
+                self.on_update(job)
+            except Exception as e:
+                logging.error("Error reporting state of %s: %s", job.name, e)
+
+    def _run_job(self, job):
+        job.started = time.monotonic()
+        self._set_state(job, RUNNING)
+        try:
+            job.returncode, job.output = self.runner(job.command, cancel_event=self.cancel_event)
+            state = DONE if job.returncode == 0 else FAILED
+        except streaming.CommandCancelled as e:
+            job.output = e.output if not e.output or e.output.endswith("\n") else e.output + "\n"
+            job.output += str(e)
+            state = FAILED if isinstance(e, streaming.CommandTimedOut) else CANCELLED
+        except Exception as e:
+            logging.error("Error executing command %s: %s", job.name, e)
+            job.output = str(e)
+            state = FAILED
+        job.finished = time.monotonic()
+        logging.info("Command %s %s in %.2fs", job.name, state, job.elapsed)
+        self._set_state(job, state)
+        return job
+
+    def run(self, commands, dependencies=None):
+        """Runs the given command dicts and blocks until all of them are finished.
+
+        dependencies maps a command name to the names it has to wait for (see scheduler.dependency_map).
+        Commands whose requirements failed are skipped, everything else runs as soon as a worker is free.
+        """
+        jobs = [CommandJob(command) for command in commands]
+        dependencies = dependencies or {}
+        waiting = {job.name: set(dependencies.get(job.name, ())) for job in jobs}
+        pending = list(jobs)
+        start = time.monotonic()
+        if self.skip_applied:
+            self._skip_applied(pending, waiting)
+        # A failed download is reported again by the entry that needs it
+        artifacts.prefetch([item for job in pending for item in job.command.get("downloads", [])], download_connections, self.on_prefetch, self.cancel_event)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running = {}
+            try:
+                self._dispatch(pool, pending, running, waiting)
+            except BaseException:
+                # Leaving the pool waits for the running entries, make sure they stop, e.g. on Ctrl+C
+                self.cancel()
+                raise
+        elapsed = time.monotonic() - start
+        logging.info("Batch of %d commands finished in %.2fs", len(jobs), elapsed)
+        return BatchResult(jobs, elapsed)
+
+    def _skip_applied(self, pending, waiting):
+        try:
+            audits = self.prober([job.command for job in pending], self.cancel_event)
+        except Exception as e:
+            # Not knowing the state only means everything runs
+            logging.error("Error probing command state: %s", e)
+            return
+        applied = {id(audit.command) for audit in audits if audit.state}
+        for job in list(pending):
+            if id(job.command) not in applied:
+                continue
+            pending.remove(job)
+            job.returncode = 0
+            job.output = "Already applied, not run"
+            self._set_state(job, APPLIED)
+            for names in waiting.values():
+                names.discard(job.name)
+
+    def _dispatch(self, pool, pending, running, waiting):
+        while pending or running:
+            if self.cancel_event.is_set():
+                for job in pending:
+                    self._set_state(job, CANCELLED)
+                pending.clear()
+            held = set()
+            for job in running.values():
+                held |= command_locks(job.command)
+            for job in list(pending):
+                if waiting[job.name]:
+                    continue
+                locks = command_locks(job.command)
+                if locks & held:
+                    continue
+                held |= locks
+                pending.remove(job)
+                running[pool.submit(self._run_job, job)] = job
+            if not running:
+                # Whatever is left waits on something that will never finish
+                for job in pending:
+                    self._set_state(job, SKIPPED)
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                job = running.pop(future)
+                if job.state == DONE:
+                    for names in waiting.values():
+                        names.discard(job.name)
+                else:
+                    self._skip_dependents(job.name, pending, waiting)
+
+    def _skip_dependents(self, name, pending, waiting):
+        for job in list(pending):
+            if name in waiting[job.name]:
+                pending.remove(job)
+                job.output = "Skipped because '%s' did not succeed" % name
+                self._set_state(job, SKIPPED)
+                self._skip_dependents(job.name, pending, waiting)
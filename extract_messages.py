@@ -0,0 +1,79 @@
+import os
+import ast
+import sys
+import time
+import argparse
+import catalog
+import languageHandler
+import search
+
+# Modules whose messages are shown in the interface
+SOURCES = ["aurora.py", "languageHandler.py"]
+
+# Calls taking messages, with the positions of the message arguments; methods are matched by name
+KEYWORDS = {"_": (0,), "N_": (0,), "translated": (1,), "append_menu_item": (1, 2)}
+
+def source_messages(path):
+    """Returns (message, line) for the literal messages passed to the KEYWORDS calls of a module."""
+    with open(path, "r", encoding="utf-8") as file:
+        tree = ast.parse(file.read(), path)
+    messages = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = node.func.id if isinstance(node.func, ast.Name) else getattr(node.func, "attr", None)
+        for position in KEYWORDS.get(name, ()):
+            if position < len(node.args) and isinstance(node.args[position], ast.Constant) and isinstance(node.args[position].value, str):
+                messages.append((node.args[position].value, node.lineno))
+    return sorted(messages, key=lambda message: message[1])
+
+def catalog_messages(path):
+    """Returns the names and descriptions of the catalog commands, translated like the interface."""
+    messages = []
+    for index, command in enumerate(catalog.load_commands(path, read_only=True)):
+        for field in search.TRANSLATED_FIELDS:
+            if command.get(field):
+                messages.append((command[field], index))
+    return messages
+
+def quote(text):
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"').replace("\t", "\\t").replace("\r", "\\r")
+    if "\n" not in escaped:
+        return '"%s"' % escaped
+    lines = escaped.split("\n")
+    return '""\n' + "\n".join('"%s\\n"' % line for line in lines[:-1]) + ("\n\"%s\"" % lines[-1] if lines[-1] else "")
+
+def build_template(entries):
+    """Builds a .pot file from (message, reference) pairs, one entry per message with all its references."""
+    references = {}
+    for message, reference in entries:
+        references.setdefault(message, []).append(reference)
+    header = ['msgid ""', 'msgstr ""',
+              '"Project-Id-Version: Aurora\\n"',
+              '"POT-Creation-Date: %s\\n"' % time.strftime("%Y-%m-%d %H:%M%z"),
+              '"Content-Type: text/plain; charset=UTF-8\\n"',
+              '"Content-Transfer-Encoding: 8bit\\n"']
+    blocks = ["\n".join(header)]
+    for message, refs in references.items():
+        blocks.append("#: %s\nmsgid %s\nmsgstr \"\"" % (" ".join(refs), quote(message)))
+    return "\n\n".join(blocks) + "\n"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Writes the message template shared by the interface and the command catalog.")
+    parser.add_argument("--catalog", default=catalog.CATALOG_FILE, help="catalog database (default: %(default)s)")
+    parser.add_argument("--output", default=os.path.join(languageHandler.LOCALE_DIR, "aurora.pot"), help="template written (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    entries = []
+    for path in SOURCES:
+        entries.extend((message, "%s:%d" % (path, line)) for message, line in source_messages(path))
+    entries.extend((message, "%s:%d" % (os.path.basename(args.catalog), index)) for message, index in catalog_messages(args.catalog))
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as file:
+        file.write(build_template(entries))
+    print("%d messages written to %s" % (len({message for message, reference in entries}), args.output))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+import os
+import logging
+import subprocess
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Resource profiles a catalog entry can name in "resources" instead of listing the limits
+PROFILES = {
+    "background": {"priority": "below_normal", "io_priority": "low"},
+    "idle": {"priority": "idle", "io_priority": "very_low"},
+}
+
+# Priority name: (Windows priority class, POSIX nice value)
+PRIORITIES = {
+    "idle": (0x00000040, 19),
+    "below_normal": (0x00004000, 10),
+    "normal": (0x00000020, 0),
+    "above_normal": (0x00008000, -5),
+    "high": (0x00000080, -10),
+}
+
+# I/O priority name: (Windows level used by psutil, Linux ionice class, Linux ionice level)
+IO_PRIORITIES = {
+    "very_low": (0, 3, 0),
+    "low": (1, 2, 7),
+    "normal": (2, 2, 4),
+    "high": (3, 2, 0),
+}
+
+def resolve(resources):
+    """Returns the resource profile of a catalog entry as a dict, or None when it has none.
+
+    resources is a profile name from PROFILES or a dict with any of "priority", "affinity"
+    (list of CPU numbers), "memory_mb" and "io_priority". Raises ValueError for unknown values.
+    """
+    if not resources:
+        return None
+    if isinstance(resources, str):
+        if resources not in PROFILES:
+            raise ValueError("Unknown resource profile: %s" % resources)
+        resources = PROFILES[resources]
+    if resources.get("priority") and resources["priority"] not in PRIORITIES:
+        raise ValueError("Unknown priority: %s" % resources["priority"])
+    if resources.get("io_priority") and resources["io_priority"] not in IO_PRIORITIES:
+        raise ValueError("Unknown I/O priority: %s" % resources["io_priority"])
+    return dict(resources)
+
+def popen_kwargs(profile):
+    """Popen arguments applying the parts of a profile that have to be set when the process starts.
+
+    Only the Windows priority class; everything else is set by apply, from this process, since
+    preexec_fn isn't safe while the batch's worker threads are running.
+    """
+    if not profile or os.name != "nt":
+        return {}
+    priority = profile.get("priority")
+    return {"creationflags": PRIORITIES[priority][0]} if priority else {}
+
+def _limit_process(pid, profile):
+    # Limits that can't be set are skipped rather than failing the command,
+    # e.g. a higher priority without root
+    if profile.get("priority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, pid, PRIORITIES[profile["priority"]][1])
+        except OSError:
+            pass
+    if profile.get("affinity") and hasattr(os, "sched_setaffinity"):
+        try:
+            available = os.sched_getaffinity(pid)
+            os.sched_setaffinity(pid, set(profile["affinity"]) & available or available)
+        except OSError:
+            pass
+    if profile.get("memory_mb") and resource is not None and hasattr(resource, "prlimit"):
+        limit = int(profile["memory_mb"]) * 1024 * 1024
+        try:
+            resource.prlimit(pid, resource.RLIMIT_AS, (limit, limit))
+        except (OSError, ValueError):
+            pass
+
+def apply(pid, profile):
+    """Applies the parts of a profile that are set on a running process.
+
+    On Windows the process is put in a Job object limiting the memory, CPUs and priority of
+    its whole tree; the I/O priority needs psutil. On Linux the nice value, affinity and
+    address space limit are set with setpriority, sched_setaffinity and prlimit, and the I/O
+    priority with psutil or the ionice tool. Processes the command started in the meantime
+    keep their defaults.
+    """
+    if not profile:
+        return
+    try:
+        if os.name == "nt" and (profile.get("memory_mb") or profile.get("affinity") or profile.get("priority")):
+            _assign_job(pid, profile)
+        elif os.name != "nt":
+            _limit_process(pid, profile)
+        if profile.get("io_priority"):
+            _set_io_priority(pid, profile["io_priority"])
+    except Exception as e:
+        logging.error("Error applying resource limits to %d: %s", pid, e)
+
+def _set_io_priority(pid, name):
+    windows_level, linux_class, linux_level = IO_PRIORITIES[name]
+    if psutil is not None:
+        process = psutil.Process(pid)
+        if os.name == "nt":
+            process.ionice(windows_level)
+        else:
+            process.ionice(linux_class, linux_level if linux_class == 2 else None)
+    elif os.name != "nt":
+        command = ["ionice", "-c", str(linux_class), "-p", str(pid)]
+        if linux_class == 2:
+            command[3:3] = ["-n", str(linux_level)]
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        logging.info("Install psutil to set the I/O priority of commands")
+
+def _assign_job(pid, profile):
+    import ctypes
+    from ctypes import wintypes
+
+    class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [("PerProcessUserTimeLimit", ctypes.c_int64), ("PerJobUserTimeLimit", ctypes.c_int64),
+                    ("LimitFlags", wintypes.DWORD), ("MinimumWorkingSetSize", ctypes.c_size_t),
+                    ("MaximumWorkingSetSize", ctypes.c_size_t), ("ActiveProcessLimit", wintypes.DWORD),
+                    ("Affinity", ctypes.c_size_t), ("PriorityClass", wintypes.DWORD), ("SchedulingClass", wintypes.DWORD)]
+
+    class IO_COUNTERS(ctypes.Structure):
+        _fields_ = [(name, ctypes.c_uint64) for name in ("ReadOperationCount", "WriteOperationCount", "OtherOperationCount",
+                                                         "ReadTransferCount", "WriteTransferCount", "OtherTransferCount")]
+
+    class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+        _fields_ = [("BasicLimitInformation", JOBOBJECT_BASIC_LIMIT_INFORMATION), ("IoInfo", IO_COUNTERS),
+                    ("ProcessMemoryLimit", ctypes.c_size_t), ("JobMemoryLimit", ctypes.c_size_t),
+                    ("PeakProcessMemoryUsed", ctypes.c_size_t), ("PeakJobMemoryUsed", ctypes.c_size_t)]
+
+    JOB_OBJECT_LIMIT_AFFINITY = 0x10
+    JOB_OBJECT_LIMIT_PRIORITY_CLASS = 0x20
+    JOB_OBJECT_LIMIT_JOB_MEMORY = 0x200
+    JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS = 9
+    PROCESS_SET_QUOTA = 0x0100
+    PROCESS_TERMINATE = 0x0001
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+
+    info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    limits = info.BasicLimitInformation
+    if profile.get("memory_mb"):
+        limits.LimitFlags |= JOB_OBJECT_LIMIT_JOB_MEMORY
+        info.JobMemoryLimit = int(profile["memory_mb"]) * 1024 * 1024
+    if profile.get("affinity"):
+        limits.LimitFlags |= JOB_OBJECT_LIMIT_AFFINITY
+        limits.Affinity = sum(1 << cpu for cpu in set(profile["affinity"]))
+    if profile.get("priority"):
+        limits.LimitFlags |= JOB_OBJECT_LIMIT_PRIORITY_CLASS
+        limits.PriorityClass = PRIORITIES[profile["priority"]][0]
+
+    job = kernel32.CreateJobObjectW(None, None)
+    if not job:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        if not kernel32.SetInformationJobObject(wintypes.HANDLE(job), JOB_OBJECT_EXTENDED_LIMIT_INFORMATION_CLASS,
+                                                ctypes.byref(info), ctypes.sizeof(info)):
+            raise ctypes.WinError(ctypes.get_last_error())
+        process = kernel32.OpenProcess(PROCESS_SET_QUOTA | PROCESS_TERMINATE, False, pid)
+        if not process:
+            raise ctypes.WinError(ctypes.get_last_error())
+        try:
+            if not kernel32.AssignProcessToJobObject(wintypes.HANDLE(job), wintypes.HANDLE(process)):
+                raise ctypes.WinError(ctypes.get_last_error())
+        finally:
+            kernel32.CloseHandle(wintypes.HANDLE(process))
+    finally:
+        # The job and its limits stay in place as long as a process belongs to it
+        kernel32.CloseHandle(wintypes.HANDLE(job))
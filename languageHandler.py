@@ -8,10 +8,46 @@ import ctypes
 import locale
 import gettext
 import platform
+import json
+import logging
 #a few Windows locale constants
 LOCALE_SLANGUAGE=0x2
 LOCALE_SLANGDISPLAYNAME=0x6f
-curLang="es"
+curLang="en"
+#Folder with a <language>/LC_MESSAGES/aurora.mo catalog per language
+LOCALE_DIR="locales"
+#File caching the list of languages and their display names, rebuilt when the locale folder changes
+INDEX_FILE="locale_index.json"
+INDEX_VERSION=2
+#Language index and translations already loaded in this process
+_localeIndex=None
+_translations={}
+#Functions called with the new language after every setLanguage
+_languageChangeHandlers=[]
+#Native names used where Windows can't be asked for them
+LANGUAGE_NAMES={"en": "English",
+                "ar": "\u0627\u0644\u0639\u0631\u0628\u064a\u0629",
+                "ca": "Catal\u00e0",
+                "de": "Deutsch",
+                "es": "Espa\u00f1ol",
+                "fi": "Suomi",
+                "fr": "Fran\u00e7ais",
+                "gl": "Galego",
+                "eu": "Euskara",
+                "hu": "Magyar",
+                "hr": "Hrvatski",
+                "it": "Italiano",
+                "ja": "\u65e5\u672c\u8a9e",
+                "pl": "Polski",
+                "pt": "Portugu\u00eas",
+                "ru": "\u0420\u0443\u0441\u0441\u043a\u0438\u0439",
+                "tr": "T\u00fcrk\u00e7e",
+                "sr": "\u0421\u0440\u043f\u0441\u043a\u0438",
+                }
+
+def _windll():
+    """Returns ctypes.windll, or None when not running on Windows."""
+    return getattr(ctypes, "windll", None)
 def localeNameToWindowsLCID(localeName):
     """Retreave the Windows locale identifier (LCID) for the given locale name
     @param localeName: a string of 2letterLanguage_2letterCountry or or just 2letterLanguage
@@ -19,8 +55,9 @@ def localeNameToWindowsLCID(localeName):
     @returns: a Windows LCID
     @rtype: integer
     """ 
-    #Windows Vista is able to convert locale names to LCIDs
-    func_LocaleNameToLCID=getattr(ctypes.windll.kernel32,'LocaleNameToLCID',None)
+    #Windows Vista is able to convert locale names to LCIDs, elsewhere Python's table is used
+    windll=_windll()
+    func_LocaleNameToLCID=getattr(windll.kernel32,'LocaleNameToLCID',None) if windll else None
     if func_LocaleNameToLCID is not None:
         localeName=localeName.replace('_','-')
         LCID=func_LocaleNameToLCID(str(localeName),0)
@@ -38,7 +75,13 @@ def localeNameToWindowsLCID(localeName):
 def getLanguageDescription(language):
     """Finds out the description (localized full name) of a given local name"""
     desc=None
-    if platform.system() == "Windows":
+    if _windll() is None:
+        #Without Windows, use the native name of the language, followed by the country code
+        parts=language.split('_')
+        desc=LANGUAGE_NAMES.get(parts[0])
+        if desc and len(parts)>1:
+            desc="%s (%s)"%(desc,parts[1])
+    elif platform.system() == "Windows":
         LCID=localeNameToWindowsLCID(language)
         if LCID!=0:
             buf=ctypes.create_unicode_buffer(1024)
@@ -50,29 +93,99 @@ def getLanguageDescription(language):
                 res=ctypes.windll.kernel32.GetLocaleInfoW(LCID,LOCALE_SLANGUAGE,buf,1024)
             desc=buf.value
     return desc
-def getAvailableLanguages():
-    """generates a list of locale names, plus their full localized language and country names.
-    @rtype: list of tuples
+def _localeDirMtime():
+    try:
+        return os.stat(LOCALE_DIR).st_mtime
+    except OSError:
+        return None
+
+def _buildLocaleIndex(mtime):
+    """Lists the locales found in the locale dir with their display names.
+    @rtype: dict
     """
-    #Make a list of all the locales found in NVDA's locale dir
-    l=[x for x in os.listdir('locales') if os.path.isfile(os.path.join('locales', x, 'LC_MESSAGES', 'aurora.mo'))]
-    #Make sure that pt (portuguese) is in the list as it may not have any locale files, but is default
-    if 'pt' not in l:
-        l.append('pt')
-        l.sort()
+    #Make a list of all the locales found in the locale dir
+    l=[]
+    if mtime is not None:
+        l=[x for x in os.listdir(LOCALE_DIR) if os.path.isfile(os.path.join(LOCALE_DIR, x, 'LC_MESSAGES', 'aurora.mo'))]
+    #Make sure that en (english) is in the list as it has no locale files, the messages in the source are english
+    if 'en' not in l:
+        l.append('en')
+    l.sort()
     #For each locale, ask Windows for its human readable display name
-    d=[]
+    languages=[]
     for i in l:
         desc=getLanguageDescription(i)
-        label="%s, %s"%(desc,i) if desc else i
-        d.append(label)
+        languages.append([i, "%s, %s"%(desc,i) if desc else i])
+    return {"version": INDEX_VERSION, "localeDir": os.path.abspath(LOCALE_DIR), "mtime": mtime, "system": platform.system(), "languages": languages}
+
+def getLocaleIndex():
+    """Returns the locale index, from memory, from INDEX_FILE or freshly built.
+    Adding or removing a locale changes the mtime of the locale dir, which rebuilds the index.
+    @rtype: dict
+    """
+    global _localeIndex
+    mtime=_localeDirMtime()
+    key=(os.path.abspath(LOCALE_DIR), mtime, platform.system())
+    if _localeIndex is not None and (_localeIndex["localeDir"], _localeIndex["mtime"], _localeIndex["system"])==key:
+        return _localeIndex
+    try:
+        with open(INDEX_FILE, "r", encoding="utf-8") as f:
+            index=json.load(f)
+        if index.get("version")==INDEX_VERSION and (index["localeDir"], index["mtime"], index["system"])==key:
+            _localeIndex=index
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+    index=_buildLocaleIndex(mtime)
+    try:
+        tmpPath=INDEX_FILE+".tmp"
+        with open(tmpPath, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmpPath, INDEX_FILE)
+    except OSError as e:
+        logging.error("Error saving the locale index: %s", e)
+    _localeIndex=index
+    return index
+
+def getAvailableLanguages():
+    """generates a list of locale names, plus their full localized language and country names.
+    @rtype: list of tuples
+    """
+    index=getLocaleIndex()
+    l=[code for code, label in index["languages"]]
+    d=[label for code, label in index["languages"]]
     #include a 'user default, windows' language, which just represents the default language for this user account
     l.append("system")
     # Translators: the label for the Windows default NVDA interface language.
-    d.append(_("idioma do sistema"))
+    d.append(getattr(builtins, "_", str)("System language"))
     #return a zipped up version of both the lists (a list with tuples of locale,label)
     return list(zip(l,d))
 
+def getTranslation(lang):
+    """Returns the translations of a language, reading its catalog the first time it is needed.
+    Raises IOError when the language has no catalog.
+    """
+    path=gettext.find('aurora', localedir=LOCALE_DIR, languages=[lang])
+    if path is None:
+        raise IOError("No translation catalog for %s" % lang)
+    mtime=os.stat(path).st_mtime
+    cached=_translations.get(lang)
+    if cached is None or cached[0]!=(path, mtime):
+        with open(path, "rb") as f:
+            cached=_translations[lang]=((path, mtime), gettext.GNUTranslations(f))
+    return cached[1]
+
+def getSystemLanguage():
+    """Returns the locale name of the user's interface language."""
+    windll=_windll()
+    if windll is not None:
+        return locale.windows_locale.get(windll.kernel32.GetUserDefaultUILanguage(), "en")
+    for variable in ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG"):
+        value=os.environ.get(variable)
+        if value and value not in ("C", "POSIX"):
+            return normalizeLanguage(value.split(':')[0].split('.')[0]) or "en"
+    return "en"
+
 def makePgettext(translations):
     """Obtaina  pgettext function for use with a gettext translations instance.
     pgettext is used to support message contexts,
@@ -97,36 +210,55 @@ def setLanguage(lang):
     global curLang
     try:
         if lang=="system":
-            if system == "Windows":
-                windowsLCID=ctypes.windll.kernel32.GetUserDefaultUILanguage()
-                localeName=locale.windows_locale[windowsLCID]
-            trans=gettext.translation('aurora', localedir='locales', languages=[localeName])
+            localeName=getSystemLanguage()
+            trans=getTranslation(localeName)
             curLang=localeName
         else:
-            trans=gettext.translation('aurora', localedir='locales', languages=[lang])
+            trans=getTranslation(lang)
             curLang=lang
             localeChanged=False
-            if system == "Windows":
-                locale.setlocale(locale.LC_ALL, langToWindowsLocale(lang))
-                localeChanged=True
-            else:
-                locale.setlocale(locale.LC_ALL, lang)
+            try:
+                if system == "Windows":
+                    locale.setlocale(locale.LC_ALL, langToWindowsLocale(lang))
+                else:
+                    locale.setlocale(locale.LC_ALL, lang)
                 localeChanged=True
+            except locale.Error:
+                pass
             if not localeChanged and '_' in lang:
                 try:
                     locale.setlocale(locale.LC_ALL, lang.split('_')[0])
                 except:
                     pass
-            if system == "Windows":
+            if _windll() is not None:
                 LCID=localeNameToWindowsLCID(lang)
                 ctypes.windll.kernel32.SetThreadLocale(LCID)
     except IOError:
+        #The messages in the source are English, so no catalog means English
         trans=gettext.translation('aurora', fallback=True)
-        curLang="pt"
+        curLang="en"
     if sys.version[0] == "3":
         trans.install()
     else:
         trans.install(unicode=True)
+    for handler in list(_languageChangeHandlers):
+        try:
+            handler(curLang)
+        except Exception as e:
+            logging.error("Error in language change handler %r: %s", handler, e)
+
+def registerLanguageChangeHandler(handler):
+    """Calls handler with the new language name every time the language is set, after the translations are installed.
+    Used to relabel windows that are already open instead of restarting.
+    @param handler: function taking the language name
+    """
+    if handler not in _languageChangeHandlers:
+        _languageChangeHandlers.append(handler)
+
+def unregisterLanguageChangeHandler(handler):
+    """Stops calling a handler added with registerLanguageChangeHandler."""
+    if handler in _languageChangeHandlers:
+        _languageChangeHandlers.remove(handler)
 
 def getLanguage():
     return curLang
@@ -165,4 +297,5 @@ def langToWindowsLocale(lang):
                  "tr": "trk",
                  "sr": "eng",
                  }
-    return languages[lang]
\ No newline at end of file
+    #Dialects use the locale of their language, unknown languages fall back to the locale name itself
+    return languages.get(lang) or languages.get(lang.split('_')[0]) or lang
@@ -18,10 +18,12 @@ foreach ($version in $versions.Keys) {
     $url = $versions[$version]
 
     try {
-        # Download
+        # Download, unless Aurora already prefetched the installer
         $installerPath = "$env:TEMP\dotnet_${version}_installer.exe"
-        Invoke-WebRequest -Uri $url -OutFile $installerPath -ErrorAction Stop
-        Write-Host "Downloading .NET Framework $version..."
+        if (-not (Test-Path $installerPath)) {
+            Write-Host "Downloading .NET Framework $version..."
+            Invoke-WebRequest -Uri $url -OutFile $installerPath -ErrorAction Stop
+        }
 
         # Instalação
         Start-Process -FilePath $installerPath -ArgumentList '/install', '/quiet' -Wait
@@ -0,0 +1,143 @@
+import json
+import logging
+
+# Kinds of state a catalog entry's "check" can look at
+KINDS = ("registry", "service", "feature", "firewall")
+
+# Prefix of the output lines carrying the probe results
+MARKER = "AURORA-PROBE"
+
+# Registry hive abbreviations, PowerShell's Registry:: paths need the full names
+HIVES = {"HKLM": "HKEY_LOCAL_MACHINE", "HKCU": "HKEY_CURRENT_USER", "HKCR": "HKEY_CLASSES_ROOT",
+         "HKU": "HKEY_USERS", "HKCC": "HKEY_CURRENT_CONFIG"}
+
+# Service start types as written by sc.exe, with the names Get-Service reports
+START_TYPES = {"auto": "automatic", "demand": "manual"}
+
+def command_probes(command):
+    """Returns the probes of a catalog entry's "check", a probe dict or a list of them.
+
+    A probe is one of:
+    {"kind": "registry", "path": "HKLM\\...", "name": "AllowTelemetry", "value": 0}
+    {"kind": "service", "name": "DiagTrack", "start": "disabled"}
+    {"kind": "feature", "name": "DirectPlay", "state": "enabled"}
+    {"kind": "firewall", "enabled": false}, optionally with "profile": "Domain", "Private" or "Public"
+    Raises ValueError for an unknown kind.
+    """
+    check = command.get("check")
+    if not check:
+        return []
+    probes = check if isinstance(check, list) else [check]
+    for probe in probes:
+        if probe.get("kind") not in KINDS:
+            raise ValueError("Unknown check kind in '%s': %s" % (command.get("name"), probe.get("kind")))
+    return probes
+
+def quote(text):
+    return "'%s'" % str(text).replace("'", "''")
+
+def registry_path(path):
+    hive, _, rest = path.replace("/", "\\").partition("\\")
+    hive = HIVES.get(hive.rstrip(":").upper(), hive.rstrip(":"))
+    return "Registry::%s\\%s" % (hive, rest.strip("\\"))
+
+def probe_expression(probe):
+    """PowerShell expression reading the current state a probe compares."""
+    kind = probe["kind"]
+    if kind == "registry":
+        return "(Get-ItemProperty -LiteralPath %s -Name %s).%s" % (quote(registry_path(probe["path"])), quote(probe["name"]), quote(probe["name"]))
+    if kind == "service":
+        return "[string](Get-Service -Name %s).StartType" % quote(probe["name"])
+    if kind == "feature":
+        return "[string](Get-WindowsOptionalFeature -Online -FeatureName %s).State" % quote(probe["name"])
+    profile = " -Name %s" % quote(probe["profile"]) if probe.get("profile") else ""
+    return "@(Get-NetFirewallProfile%s | ForEach-Object { [string]$_.Enabled })" % profile
+
+def build_script(probes):
+    """Builds one PowerShell script reading every probe; each result is printed as MARKER, index and JSON."""
+    lines = ["$ErrorActionPreference = 'Stop'"]
+    for index, probe in enumerate(probes):
+        # A missing key, service or feature reads as null instead of failing the whole pass
+        lines.append("'%s %d ' + (ConvertTo-Json -Compress -InputObject $(try { %s } catch { $null }))" % (MARKER, index, probe_expression(probe)))
+    return "\n".join(lines)
+
+def parse_output(output, count):
+    """Returns the values read by build_script, None for the probes that printed nothing."""
+    values = [None] * count
+    for line in output.splitlines():
+        if not line.startswith(MARKER + " "):
+            continue
+        index, _, value = line[len(MARKER) + 1:].partition(" ")
+        if not value.strip():
+            continue
+        try:
+            values[int(index)] = json.loads(value)
+        except (ValueError, IndexError):
+            logging.error("Unexpected probe output: %s", line)
+    return values
+
+def _same(expected, observed):
+    if isinstance(expected, list) or isinstance(observed, list):
+        return isinstance(expected, list) and isinstance(observed, list) and [str(x) for x in expected] == [str(x) for x in observed]
+    return str(expected).lower() == str(observed).lower()
+
+def matches(probe, observed):
+    """Tells whether an observed value is the probe's target state, None when it couldn't be read."""
+    if observed is None:
+        return None
+    kind = probe["kind"]
+    if kind == "registry":
+        return _same(probe["value"], observed)
+    if kind == "service":
+        start = probe["start"].lower()
+        return START_TYPES.get(start, start) == str(observed).lower()
+    if kind == "feature":
+        # "Disabled" also covers DisabledWithPayloadRemoved
+        return str(observed).lower().startswith(probe["state"].lower())
+    values = observed if isinstance(observed, list) else [observed]
+    return bool(values) and all(str(value).lower() == str(bool(probe["enabled"])).lower() for value in values)
+
+def entry_state(results):
+    """Combines the matches of an entry's probes: True when all are applied, False when one isn't, else None."""
+    if any(result is False for result in results):
+        return False
+    if results and all(results):
+        return True
+    return None
+
+class Audit:
+    """Applied state of one catalog entry: state is True, False, or None when it couldn't be told."""
+    def __init__(self, command, probes, values):
+        self.command = command
+        self.probes = probes
+        self.values = values
+        self.results = [matches(probe, value) for probe, value in zip(probes, values)]
+        self.state = entry_state(self.results)
+
+    def to_dict(self):
+        return {"name": self.command["name"], "applied": self.state,
+                "probes": [dict(probe, observed=value) for probe, value in zip(self.probes, self.values)]}
+
+def audit(commands, run):
+    """Reads the state of every entry with a "check" in a single pass.
+
+    run(script) runs a PowerShell script and returns (returncode, output). Returns an Audit for
+    each entry with a check, in the order of commands; entries with an invalid check are logged
+    and left out.
+    """
+    entries = []
+    probes = []
+    for command in commands:
+        try:
+            command_checks = command_probes(command)
+        except ValueError as e:
+            logging.error("%s", e)
+            continue
+        if command_checks:
+            entries.append((command, len(probes), command_checks))
+            probes.extend(command_checks)
+    if not probes:
+        return []
+    returncode, output = run(build_script(probes))
+    values = parse_output(output, len(probes))
+    return [Audit(command, command_checks, values[start:start + len(command_checks)]) for command, start, command_checks in entries]
@@ -0,0 +1,142 @@
+import os
+import re
+import json
+import time
+import getpass
+import platform
+import scheduler
+
+# Format of exported profile files and of run reports
+FORMAT = 1
+
+# Directory the run reports are written to by default
+REPORTS_DIR = "reports"
+
+# Keys of a profile entry that change how its command runs; "force" runs it even when its check says it is applied
+PARAMETER_KEYS = ("timeout", "resources", "force")
+
+class ProfileError(Exception):
+    """Raised for a profile that can't be used."""
+
+def make_entry(command, **parameters):
+    """Returns the profile entry pointing to a catalog command, by task id for optimizer tasks and by name otherwise."""
+    entry = {"name": command["name"]}
+    if command.get("task"):
+        entry["task"] = command["task"]
+    entry.update({key: value for key, value in parameters.items() if key in PARAMETER_KEYS})
+    return entry
+
+def create(name, commands, desc=""):
+    """Returns a profile running the given commands in the given order."""
+    if not name.strip():
+        raise ProfileError("A profile needs a name")
+    return {"name": name.strip(), "desc": desc, "entries": [make_entry(command) for command in commands]}
+
+def validate(profile):
+    if not isinstance(profile, dict) or not profile.get("name"):
+        raise ProfileError("A profile has no name")
+    entries = profile.get("entries")
+    if not isinstance(entries, list) or not entries:
+        raise ProfileError("Profile '%s' has no entries" % profile["name"])
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("name"):
+            raise ProfileError("An entry of profile '%s' has no name" % profile["name"])
+    return profile
+
+def find_entry_command(entry, commands):
+    """Returns the command an entry points to: the one with its task id, else the first with its name, or None."""
+    if entry.get("task"):
+        for command in commands:
+            if command.get("task") == entry["task"]:
+                return command
+    return scheduler.find_command(commands, entry["name"])
+
+def entry_command(entry, command):
+    """Returns a copy of command with the entry's parameters applied.
+
+    The catalog "id" is kept, so telemetry records the run under its command; export strips it.
+    """
+    command = dict(command)
+    for key in ("timeout", "resources"):
+        if key in entry:
+            command[key] = entry[key]
+    if entry.get("force"):
+        command.pop("check", None)
+    return command
+
+def resolve(profile, commands):
+    """Returns the commands of a profile in profile order, with their parameters applied.
+
+    Raises ProfileError naming every entry missing from commands.
+    """
+    validate(profile)
+    selection = []
+    missing = []
+    for entry in profile["entries"]:
+        command = find_entry_command(entry, commands)
+        if command is None:
+            missing.append(entry["name"])
+        else:
+            selection.append(entry_command(entry, command))
+    if missing:
+        raise ProfileError("Profile '%s' uses commands that are not in the command list: %s" % (profile["name"], ", ".join(missing)))
+    return selection
+
+def export(profile, commands, path):
+    """Writes a profile to a file together with the commands it runs, including required ones.
+
+    The file is enough to apply the profile on a PC whose command list doesn't have them.
+    """
+    # Fails for entries missing from commands
+    resolve(profile, commands)
+    selection = [find_entry_command(entry, commands) for entry in profile["entries"]]
+    try:
+        plan = scheduler.resolve(selection, commands)
+    except scheduler.SchedulerError as e:
+        raise ProfileError(str(e))
+    data = {"format": FORMAT, "profile": profile,
+            "commands": [{key: value for key, value in command.items() if key != "id"} for command in plan]}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=4, ensure_ascii=False)
+
+def read_file(path):
+    """Reads an exported profile and returns (profile, commands).
+
+    Raises FileNotFoundError when there is no file and ProfileError when it can't be used.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            data = json.load(file)
+        except ValueError as e:
+            raise ProfileError("%s is not valid JSON: %s" % (path, e))
+    if not isinstance(data, dict) or data.get("format") != FORMAT:
+        raise ProfileError("%s is not a profile file this version can read" % path)
+    commands = data.get("commands", [])
+    for command in commands:
+        if not all(command.get(key) for key in ("name", "cmd", "type")):
+            raise ProfileError("A command of %s has no name, cmd or type" % path)
+    return validate(data.get("profile")), commands
+
+def missing_commands(commands, catalog_commands):
+    """Returns the commands of an exported profile that the command list doesn't have yet."""
+    return [command for command in commands if find_entry_command(make_entry(command), catalog_commands) is None]
+
+def build_report(profile, result, started):
+    """Returns the report of a profile run on this PC: where and when it ran, and every command's result."""
+    jobs = [job.to_dict() for job in result.jobs]
+    return {"format": FORMAT, "profile": profile["name"], "machine": platform.node(), "user": getpass.getuser(),
+            "system": platform.platform(), "started": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(started)),
+            "elapsed": round(result.elapsed, 3), "succeeded": len(result.jobs) - len(result.failed), "failed": len(result.failed),
+            "results": jobs}
+
+def write_report(report, directory=REPORTS_DIR):
+    """Writes a report as <machine>-<profile>-<time>.json in directory and returns its path.
+
+    Several PCs can share the directory, e.g. a network folder, without overwriting each other's reports.
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = "%s-%s-%s.json" % (report["machine"] or "unknown", report["profile"], time.strftime("%Y%m%d-%H%M%S"))
+    path = os.path.join(directory, re.sub(r'[<>:"/\\|?*\s]+', "_", name))
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4, ensure_ascii=False)
+    return path
@@ -0,0 +1,224 @@
+import os
+import re
+import json
+import time
+import logging
+import threading
+import requests
+from functools import total_ordering
+
+API_URL = "https://api.github.com/repos/azurejoga/Aurora-Windows-Optimizer"
+
+# File keeping the last answers of the releases API with their ETag/Last-Modified headers
+CACHE_FILE = "release_cache.json"
+
+# Seconds during which a cached answer is used without asking GitHub again
+MIN_CHECK_INTERVAL = 3600
+
+# Seconds to wait for the connection and for the answer
+DEFAULT_TIMEOUT = (5, 15)
+
+# Update channels; the prerelease channel also offers stable releases when they are newer
+STABLE = "stable"
+PRERELEASE = "prerelease"
+CHANNELS = (STABLE, PRERELEASE)
+
+class ReleaseError(Exception):
+    pass
+
+VERSION_PATTERN = re.compile(r"(\d+(?:\.\d+)*)(?:[-_.]?([a-zA-Z]+)\.?(\d*))?")
+
+@total_ordering
+class Version:
+    """Version parsed from a release tag such as "aurora18", "aurora18.1" or "v19.0-beta2".
+
+    Versions compare by their numbers, so aurora10 is newer than aurora9, and a pre-release
+    such as 19.0-beta is older than 19.0.
+    """
+    def __init__(self, tag):
+        self.tag = tag
+        match = VERSION_PATTERN.search(tag or "")
+        if match is None:
+            raise ValueError("Not a version tag: %r" % tag)
+        numbers = [int(part) for part in match.group(1).split(".")]
+        # 18 and 18.0 are the same version
+        while len(numbers) > 1 and numbers[-1] == 0:
+            numbers.pop()
+        self.numbers = tuple(numbers)
+        self.label = (match.group(2) or "").lower()
+        self.label_number = int(match.group(3) or 0)
+
+    @property
+    def is_prerelease(self):
+        return bool(self.label)
+
+    def _key(self):
+        # A final release sorts after all the pre-releases of the same numbers
+        return (self.numbers, 0 if self.label else 1, self.label, self.label_number)
+
+    def __eq__(self, other):
+        return isinstance(other, Version) and self._key() == other._key()
+
+    def __lt__(self, other):
+        return self._key() < other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return "Version(%r)" % self.tag
+
+def parse_version(tag, default="aurora0"):
+    """Returns the Version of a tag, or the default version when the tag has no version number."""
+    try:
+        return Version(tag)
+    except ValueError:
+        return Version(default)
+
+class ReleaseIndex:
+    """Releases grouped by channel and sorted by version, newest first."""
+    def __init__(self, releases):
+        self.by_tag = {}
+        self.channels = {channel: [] for channel in CHANNELS}
+        for release in releases:
+            if release.get("draft"):
+                continue
+            try:
+                version = Version(release.get("tag_name"))
+            except ValueError:
+                logging.info("Ignoring release without a version tag: %s", release.get("tag_name"))
+                continue
+            self.by_tag[release["tag_name"]] = (version, release)
+            prerelease = release.get("prerelease") or version.is_prerelease
+            if not prerelease:
+                self.channels[STABLE].append((version, release))
+            self.channels[PRERELEASE].append((version, release))
+        for entries in self.channels.values():
+            entries.sort(key=lambda entry: entry[0], reverse=True)
+
+    def latest(self, channel=STABLE):
+        """Returns the newest release of a channel, or None."""
+        entries = self.channels.get(channel, self.channels[STABLE])
+        return entries[0][1] if entries else None
+
+    def update_for(self, current_tag, channel=STABLE):
+        """Returns the release to update to from current_tag, or None when there is nothing newer."""
+        release = self.latest(channel)
+        if release is None:
+            return None
+        if parse_version(current_tag) < Version(release["tag_name"]):
+            return release
+        return None
+
+class ReleaseClient:
+    """Client for the GitHub releases API that caches answers on disk.
+
+    A cached answer younger than min_interval is returned without a request. Older answers are
+    revalidated with If-None-Match/If-Modified-Since, so an unchanged release costs a 304.
+    When GitHub reports that the rate limit is used up, no request is made until it resets
+    and the cached answer is returned instead.
+    """
+    def __init__(self, api_url=API_URL, cache_path=CACHE_FILE, min_interval=MIN_CHECK_INTERVAL, session=None, timeout=DEFAULT_TIMEOUT, clock=time.time):
+        self.api_url = api_url.rstrip("/")
+        self.cache_path = cache_path
+        self.min_interval = min_interval
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.cache = self._load_cache()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r") as file:
+                cache = json.load(file)
+            if cache.get("api_url") == self.api_url:
+                return cache
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.error("Error loading release cache: %s", e)
+        return {"api_url": self.api_url, "entries": {}, "rate_limited_until": 0}
+
+    def _save_cache(self):
+        try:
+            temporary_path = self.cache_path + ".tmp"
+            with open(temporary_path, "w") as file:
+                json.dump(self.cache, file)
+            os.replace(temporary_path, self.cache_path)
+        except Exception as e:
+            logging.error("Error saving release cache: %s", e)
+
+    def get(self, path, force=False):
+        """Returns the decoded JSON answer for an API path such as "/releases/latest"."""
+        with self.lock:
+            now = self.clock()
+            entry = self.cache["entries"].get(path)
+            if entry and not force and now - entry["checked"] < self.min_interval:
+                return entry["data"]
+            if now < self.cache.get("rate_limited_until", 0):
+                if entry:
+                    logging.info("GitHub rate limit reached, using cached %s", path)
+                    return entry["data"]
+                raise ReleaseError("GitHub rate limit reached, try again after %s" % time.ctime(self.cache["rate_limited_until"]))
+
+            headers = {"Accept": "application/vnd.github+json"}
+            if entry and entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry and entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            try:
+                response = self.session.get(self.api_url + path, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                if entry:
+                    logging.warning("Could not reach GitHub (%s), using cached %s", e, path)
+                    return entry["data"]
+                raise ReleaseError("Could not reach GitHub: %s" % e)
+
+            if self._rate_limited(response, now):
+                self._save_cache()
+                if entry:
+                    return entry["data"]
+                raise ReleaseError("GitHub rate limit reached, try again after %s" % time.ctime(self.cache["rate_limited_until"]))
+            if response.status_code == 304 and entry:
+                entry["checked"] = now
+            elif response.status_code == 200:
+                entry = self.cache["entries"][path] = {"checked": now, "etag": response.headers.get("ETag"),
+                                                       "last_modified": response.headers.get("Last-Modified"), "data": response.json()}
+            else:
+                raise ReleaseError("GitHub answered %s with HTTP status %d" % (path, response.status_code))
+            self._save_cache()
+            return entry["data"]
+
+    def _rate_limited(self, response, now):
+        if response.status_code not in (403, 429):
+            return False
+        retry_after = response.headers.get("Retry-After")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if retry_after is not None:
+            self.cache["rate_limited_until"] = now + int(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0" and reset is not None:
+            self.cache["rate_limited_until"] = int(reset)
+        else:
+            return False
+        logging.warning("GitHub rate limit reached until %s", time.ctime(self.cache["rate_limited_until"]))
+        return True
+
+    def latest_release(self, force=False):
+        return self.get("/releases/latest", force)
+
+    def release_index(self, force=False):
+        """Returns a ReleaseIndex of the most recent releases, from one cached request."""
+        return ReleaseIndex(self.get("/releases?per_page=100", force))
+
+def check_in_background(client, on_done, force=False):
+    """Fetches the release index in a thread; on_done is called with (index, error) from that thread."""
+    def run():
+        try:
+            on_done(client.release_index(force), None)
+        except Exception as e:
+            logging.error("Error checking for updates: %s", e)
+            on_done(None, e)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,54 @@
+import threading
+import time
+from collections import OrderedDict
+
+# Seconds a cached result stays fresh
+DEFAULT_TTL = 60
+
+# Results kept before the least recently used one is dropped
+DEFAULT_MAX_ENTRIES = 64
+
+class ResultCache:
+    """LRU cache of (returncode, output) results keyed by command text and type, with a time to live.
+
+    Every clear starts a new generation. A result is stored with the generation its run started in
+    and dropped if the cache was cleared meanwhile, since a command that changed the system may
+    have run at the same time.
+    """
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def get(self, command, type):
+        """Returns the cached result, or None when there is no fresh one."""
+        key = (command, type.upper())
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            stored, result = entry
+            if self.clock() - stored > self.ttl:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return result
+
+    def put(self, command, type, result, generation=None):
+        """Stores a result; with the generation read when its run started, a result older than the last clear is dropped."""
+        key = (command, type.upper())
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.entries[key] = (self.clock(), result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
@@ -0,0 +1,62 @@
+import logging
+
+class SchedulerError(Exception):
+    """Raised when a selection of commands cannot be scheduled."""
+
+def find_command(commands, name):
+    for command in commands:
+        if command["name"] == name:
+            return command
+    return None
+
+def find_conflicts(commands):
+    """Returns the (name, name) pairs of the given commands that must not run together."""
+    names = {command["name"] for command in commands}
+    conflicts = []
+    for command in commands:
+        for other in command.get("conflicts", []):
+            pair = tuple(sorted((command["name"], other)))
+            if other in names and pair not in conflicts:
+                conflicts.append(pair)
+    return conflicts
+
+def resolve(selection, catalog):
+    """Orders the selected commands so every command comes after the ones it requires.
+
+    Required commands that were not selected are taken from the catalog and added to the plan.
+    Raises SchedulerError for unknown requirements, dependency cycles and conflicting commands.
+    """
+    ordered = []
+    visiting = set()
+    visited = set()
+
+    def visit(command, path):
+        name = command["name"]
+        if name in visited:
+            return
+        if name in visiting:
+            raise SchedulerError("Dependency cycle: %s" % " -> ".join(path + [name]))
+        visiting.add(name)
+        for required_name in command.get("requires", []):
+            required = find_command(selection, required_name) or find_command(catalog, required_name)
+            if required is None:
+                raise SchedulerError("'%s' requires '%s', which is not in the command list" % (name, required_name))
+            if find_command(selection, required_name) is None:
+                logging.info("Adding '%s' to the plan, required by '%s'", required_name, name)
+            visit(required, path + [name])
+        visiting.discard(name)
+        visited.add(name)
+        ordered.append(command)
+
+    for command in selection:
+        visit(command, [])
+
+    conflicts = find_conflicts(ordered)
+    if conflicts:
+        raise SchedulerError("Conflicting commands selected: " + "; ".join("'%s' and '%s'" % pair for pair in conflicts))
+    return ordered
+
+def dependency_map(commands):
+    """Maps each command name to the names of the commands in the plan it has to wait for."""
+    names = {command["name"] for command in commands}
+    return {command["name"]: {name for name in command.get("requires", []) if name in names} for command in commands}
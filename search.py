@@ -0,0 +1,109 @@
+import re
+import bisect
+import threading
+
+# Command fields that can be searched
+SEARCH_FIELDS = ("name", "desc", "cmd")
+
+# Fields also searched in the interface language when the index is given a translate function
+TRANSLATED_FIELDS = ("name", "desc")
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+class SearchIndex:
+    """Inverted index over the words of the commands' name, description and command text.
+
+    A query matches a command when every word of the query is the prefix of a word of the command.
+    Tokens are kept sorted so all the words starting with a prefix are found with a binary search.
+    With translate, the translated name and description are indexed next to the original ones.
+    """
+    def __init__(self, commands=(), key=lambda command: command.get("id", id(command)), translate=None):
+        self.key = key
+        self.translate = translate
+        self.postings = {}
+        self.tokens = []
+        self.command_tokens = {}
+        self.lock = threading.Lock()
+        # Built in one pass and sorted once; inserting each new token into the sorted list is quadratic
+        for command in commands:
+            key = self.key(command)
+            # A repeated key keeps its last command, as with add
+            for token in self.command_tokens.get(key, ()):
+                self.postings[token].discard(key)
+            tokens = self.command_tokens[key] = self._tokens_of(command)
+            for token in tokens:
+                self.postings.setdefault(token, set()).add(key)
+        for token in [token for token, keys in self.postings.items() if not keys]:
+            del self.postings[token]
+        self.tokens = sorted(self.postings)
+
+    def _tokens_of(self, command):
+        tokens = set()
+        for field in SEARCH_FIELDS:
+            text = command.get(field, "")
+            tokens.update(tokenize(text))
+            if self.translate is not None and text and field in TRANSLATED_FIELDS:
+                tokens.update(tokenize(self.translate(text)))
+        return tokens
+
+    def add(self, command):
+        key = self.key(command)
+        tokens = self._tokens_of(command)
+        with self.lock:
+            self._remove_key(key)
+            self.command_tokens[key] = tokens
+            for token in tokens:
+                keys = self.postings.get(token)
+                if keys is None:
+                    keys = self.postings[token] = set()
+                    bisect.insort(self.tokens, token)
+                keys.add(key)
+
+    # Editing a command replaces all of its tokens
+    update = add
+
+    def remove(self, command):
+        with self.lock:
+            self._remove_key(self.key(command))
+
+    def _remove_key(self, key):
+        for token in self.command_tokens.pop(key, ()):
+            keys = self.postings[token]
+            keys.discard(key)
+            if not keys:
+                del self.postings[token]
+                del self.tokens[bisect.bisect_left(self.tokens, token)]
+
+    def _prefix_matches(self, prefix):
+        start = bisect.bisect_left(self.tokens, prefix)
+        end = bisect.bisect_left(self.tokens, prefix + "\uffff", start)
+        if end - start == 1:
+            return set(self.postings[self.tokens[start]])
+        keys = set()
+        for token in self.tokens[start:end]:
+            keys.update(self.postings[token])
+        return keys
+
+    def search(self, query):
+        """Returns the keys of the commands matching the query, or None when the query is empty."""
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return None
+        with self.lock:
+            # Longer terms usually match fewer commands, start with them to keep the sets small
+            matches = self._prefix_matches(terms[0])
+            for term in terms[1:]:
+                if not matches:
+                    break
+                matches &= self._prefix_matches(term)
+        return matches
+
+    def filter(self, commands, query):
+        """Returns the given commands that match the query, keeping their order."""
+        matches = self.search(query)
+        if matches is None:
+            return commands
+        return [command for command in commands if self.key(command) in matches]
@@ -0,0 +1,247 @@
+import subprocess
+import threading
+import logging
+import base64
+import queue
+import shutil
+import re
+import uuid
+import atexit
+import time
+import streaming
+
+# Number of warm shells kept per command type
+DEFAULT_POOL_SIZE = 2
+
+class ShellDialect:
+    """Describes how to start a long-lived shell and how to feed it one command at a time.
+
+    wrap(script, marker) returns the text written to the shell's stdin. It has to run the script,
+    merge its error output into stdout and finally print the marker followed by the exit code.
+    """
+    def __init__(self, name, argv, wrap, init=""):
+        self.name = name
+        self.argv = argv
+        self.wrap = wrap
+        self.init = init
+
+def _encode(script):
+    return base64.b64encode(script.encode("utf-8")).decode("ascii")
+
+# Scripts that end the shell or read stdin, which is the command pipe of a warm host; they get a process of their own
+_OWN_PROCESS = re.compile(r"(?im)(^|[;{}(\s])(exit|pause)(?=$|[;}\s])|\bRead-Host\b|\[Console\]::Read|\$host\.UI\.Read")
+
+def needs_own_process(script):
+    """Tells whether a PowerShell script has to run in a new process instead of a warm host."""
+    return bool(_OWN_PROCESS.search(script))
+
+def _wrap_powershell(script, marker):
+    # The script is sent base64 encoded so quotes and line breaks survive the trip through stdin.
+    # It runs in a child scope; its location and environment are put back afterwards, so nothing
+    # leaks into the next command. Like powershell -Command, the exit code comes from $? of the
+    # script's last statement, with $LASTEXITCODE when that was a failed program.
+    return ("& { $aurora_text = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('%s')); "
+            "$aurora_env = @{}; foreach ($aurora_item in Get-ChildItem Env:) { $aurora_env[$aurora_item.Name] = $aurora_item.Value }; "
+            "$aurora_cwd = [Environment]::CurrentDirectory; Push-Location; "
+            "$global:LASTEXITCODE = 0; $global:AuroraSucceeded = $null; "
+            "try { & ([ScriptBlock]::Create($aurora_text + \"`n\" + '$global:AuroraSucceeded = $?')) 2>&1 | Out-String -Stream -Width 4096 } "
+            "catch { $_ | Out-String -Stream; $global:AuroraSucceeded = $false } "
+            "finally { Pop-Location; [Environment]::CurrentDirectory = $aurora_cwd; "
+            "foreach ($aurora_item in @(Get-ChildItem Env:)) { if (-not $aurora_env.ContainsKey($aurora_item.Name)) { Remove-Item -LiteralPath ('Env:' + $aurora_item.Name) } }; "
+            "foreach ($aurora_name in $aurora_env.Keys) { [Environment]::SetEnvironmentVariable($aurora_name, $aurora_env[$aurora_name]) } }; "
+            "$code = if ($global:AuroraSucceeded -ne $false) { 0 } elseif ($LASTEXITCODE) { $LASTEXITCODE } else { 1 }; "
+            "[Console]::Out.WriteLine('%s ' + $code); [Console]::Out.Flush() }\n" % (_encode(script), marker))
+
+def _wrap_bash(script, marker):
+    # A subshell keeps `exit` and variables of the script away from the warm shell
+    return "( eval \"$(printf '%%s' '%s' | base64 -d)\" ) 2>&1 < /dev/null; printf '%s %%s\\n' \"$?\"\n" % (_encode(script), marker)
+
+def powershell_dialect():
+    # Windows PowerShell, or PowerShell 7 where only pwsh is installed
+    executable = "powershell" if shutil.which("powershell") or not shutil.which("pwsh") else "pwsh"
+    return ShellDialect("powershell", [executable, "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"], _wrap_powershell,
+                        init="[Console]::OutputEncoding = [Text.Encoding]::UTF8\n")
+
+def bash_dialect():
+    return ShellDialect("bash", ["bash", "--noprofile", "--norc"], _wrap_bash)
+
+class ShellSession:
+    """A single long-lived shell process that runs commands one after another."""
+    def __init__(self, dialect):
+        self.dialect = dialect
+        self.process = None
+        self.lines = None
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        logging.info("Starting warm %s host", self.dialect.name)
+        self.process = subprocess.Popen(self.dialect.argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                        encoding="utf-8", errors="replace", bufsize=1, **streaming.process_group_kwargs())
+        self.lines = queue.Queue()
+        threading.Thread(target=self._reader, args=(self.process, self.lines), daemon=True).start()
+        if self.dialect.init:
+            self.process.stdin.write(self.dialect.init)
+            self.process.stdin.flush()
+
+    def _reader(self, process, lines):
+        with process.stdout:
+            for line in process.stdout:
+                lines.put(line)
+        # None tells run() that the shell is gone
+        lines.put(None)
+
+    def run(self, command, on_output=None, max_lines=streaming.DEFAULT_MAX_LINES, flush_interval=streaming.FLUSH_INTERVAL, on_start=None,
+            cancel_event=None, timeout=None):
+        """Runs a command in the shell and returns (returncode, output), like streaming.stream_process.
+
+        on_start receives the process id of the shell, which is shared by all commands run in it.
+        A cancelled or timed out command kills the shell with everything it started; the next
+        command starts a new one.
+        """
+        if not self.alive():
+            self.start()
+        if on_start:
+            on_start(self.process.pid)
+        marker = "__AURORA_DONE_%s__" % uuid.uuid4().hex
+        deadline = time.monotonic() + timeout if timeout else None
+        buffer = streaming.OutputBuffer(max_lines)
+        pending = []
+
+        def flush():
+            if pending and on_output:
+                on_output("".join(pending))
+            pending.clear()
+
+        try:
+            self.process.stdin.write(self.dialect.wrap(command, marker))
+            self.process.stdin.flush()
+        except OSError as e:
+            logging.error("Warm %s host is not accepting commands: %s", self.dialect.name, e)
+            self.close()
+            return 1, "The %s host stopped unexpectedly" % self.dialect.name
+
+        while True:
+            stopped = streaming.stop_reason(cancel_event, deadline, time.monotonic)
+            if stopped is not None:
+                flush()
+                logging.info("Killing warm %s host: %s", self.dialect.name, stopped)
+                streaming.kill_process_tree(self.process)
+                self.close()
+                stopped.output = buffer.text()
+                raise stopped
+            try:
+                line = self.lines.get(timeout=flush_interval)
+            except queue.Empty:
+                flush()
+                continue
+            if line is None:
+                flush()
+                logging.error("Warm %s host exited while running a command", self.dialect.name)
+                self.close()
+                buffer.append("The %s host stopped unexpectedly\n" % self.dialect.name)
+                return 1, buffer.text()
+            position = line.find(marker)
+            if position < 0:
+                buffer.append(line)
+                pending.append(line)
+                continue
+            if position > 0:
+                buffer.append(line[:position] + "\n")
+                pending.append(line[:position] + "\n")
+            flush()
+            try:
+                returncode = int(line[position + len(marker):].strip() or 0)
+            except ValueError:
+                returncode = 1
+            return returncode, buffer.text()
+
+    def close(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        self.process = None
+
+class ShellPool:
+    """Hands out up to size warm sessions, at least one; callers block while all of them are busy."""
+    def __init__(self, dialect, size=DEFAULT_POOL_SIZE):
+        self.dialect = dialect
+        self.size = max(1, int(size))
+        self.idle = queue.Queue()
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if self.created < self.size:
+                self.created += 1
+                return ShellSession(self.dialect)
+        return self.idle.get()
+
+    def release(self, session):
+        self.idle.put(session)
+
+    def run(self, command, **kwargs):
+        session = self.acquire()
+        try:
+            return session.run(command, **kwargs)
+        finally:
+            self.release(session)
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+_pools = {}
+_pools_lock = threading.Lock()
+_pool_size = DEFAULT_POOL_SIZE
+
+def set_pool_size(size):
+    """Changes the number of warm shells; existing pools are closed and recreated on next use.
+
+    0 turns the warm hosts off, see enabled().
+    """
+    global _pool_size
+    size = max(0, int(size))
+    if size == _pool_size:
+        return
+    _pool_size = size
+    close_all()
+
+def enabled():
+    return _pool_size > 0
+
+def get_pool(dialect_factory=powershell_dialect):
+    with _pools_lock:
+        pool = _pools.get(dialect_factory)
+        if pool is None:
+            pool = _pools[dialect_factory] = ShellPool(dialect_factory(), _pool_size)
+        return pool
+
+def run_powershell(command, **kwargs):
+    """Runs a PowerShell command in a warm host and returns (returncode, output)."""
+    return get_pool(powershell_dialect).run(command, **kwargs)
+
+def close_all():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+atexit.register(close_all)
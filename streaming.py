@@ -0,0 +1,130 @@
+import os
+import signal
+import time
+import logging
+import subprocess
+import threading
+from collections import deque
+
+# Lines of output kept for a single command, older lines are dropped
+DEFAULT_MAX_LINES = 5000
+
+# Seconds between two batches of output handed to the GUI
+FLUSH_INTERVAL = 0.2
+
+# Seconds to wait for the output of a killed process to be read to the end
+KILL_GRACE = 2
+
+class CommandCancelled(Exception):
+    """Raised when a running command is cancelled; output holds what it printed until then."""
+    def __init__(self, message, output=""):
+        super(CommandCancelled, self).__init__(message)
+        self.output = output
+
+class CommandTimedOut(CommandCancelled):
+    pass
+
+def process_group_kwargs():
+    """Popen arguments that start a process in its own group, so its whole tree can be killed."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def kill_process_tree(process):
+    """Kills a process started with process_group_kwargs and every process it started."""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/PID", str(process.pid), "/T", "/F"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.error("Error killing process tree of %d: %s", process.pid, e)
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+def stop_reason(cancel_event, deadline, clock):
+    """Returns the CommandCancelled to raise for a running command, or None while it may continue."""
+    if cancel_event is not None and cancel_event.is_set():
+        return CommandCancelled("Cancelled")
+    if deadline is not None and clock() >= deadline:
+        return CommandTimedOut("Stopped after the time limit")
+    return None
+
+class OutputBuffer:
+    """Ring buffer holding the last max_lines lines written by a command."""
+    def __init__(self, max_lines=DEFAULT_MAX_LINES):
+        self.lines = deque(maxlen=max_lines)
+        self.dropped = 0
+        self.lock = threading.Lock()
+
+    def append(self, line):
+        with self.lock:
+            if len(self.lines) == self.lines.maxlen:
+                self.dropped += 1
+            self.lines.append(line)
+
+    def text(self):
+        with self.lock:
+            text = "".join(self.lines)
+            if self.dropped:
+                text = "[%d earlier lines not shown]\n%s" % (self.dropped, text)
+            return text
+
+def stream_process(args, on_output=None, max_lines=DEFAULT_MAX_LINES, flush_interval=FLUSH_INTERVAL, on_start=None,
+                   cancel_event=None, timeout=None, **popen_kwargs):
+    """Starts a process and reads its stdout and stderr line by line while it runs.
+
+    on_output is called from the calling thread with all the lines read since the last call,
+    at most once every flush_interval seconds, so a chatty process doesn't flood the GUI.
+    on_start is called with the process id once the process is running.
+    When cancel_event is set or timeout seconds have passed, the process and all its children
+    are killed and CommandCancelled (or CommandTimedOut) is raised.
+    Returns (returncode, output) where output holds at most max_lines lines.
+    """
+    group_kwargs = process_group_kwargs()
+    if "creationflags" in popen_kwargs and "creationflags" in group_kwargs:
+        popen_kwargs["creationflags"] |= group_kwargs.pop("creationflags")
+    popen_kwargs = dict(group_kwargs, **popen_kwargs)
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                               text=True, errors="replace", bufsize=1, **popen_kwargs)
+    deadline = time.monotonic() + timeout if timeout else None
+    if on_start:
+        on_start(process.pid)
+    buffer = OutputBuffer(max_lines)
+    pending = []
+    lock = threading.Lock()
+
+    def reader():
+        with process.stdout:
+            for line in process.stdout:
+                buffer.append(line)
+                with lock:
+                    pending.append(line)
+
+    def flush():
+        with lock:
+            chunk = "".join(pending)
+            pending.clear()
+        if chunk and on_output:
+            on_output(chunk)
+
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    reader_thread.start()
+    stopped = None
+    while reader_thread.is_alive():
+        reader_thread.join(flush_interval)
+        flush()
+        stopped = stop_reason(cancel_event, deadline, time.monotonic)
+        if stopped is not None:
+            kill_process_tree(process)
+            # A grandchild outside the group could keep the pipe open, don't wait for it forever
+            reader_thread.join(KILL_GRACE)
+            break
+    flush()
+    returncode = process.wait()
+    if stopped is not None:
+        stopped.output = buffer.text()
+        raise stopped
+    return returncode, buffer.text()
@@ -0,0 +1,67 @@
+import json
+
+# Optimizer tweaks, one catalog entry each; aurora-otimizar.ps1 offers the same tweaks without Aurora
+TASKS_FILE = "optimizer_tasks.json"
+
+# Manifest format understood by this version
+FORMAT = 1
+
+# Task keys copied as they are to the catalog entry, see executor and scheduler
+ENTRY_KEYS = ("requires", "conflicts", "locks", "downloads", "timeout", "resources", "cacheable", "check")
+
+# Keys refreshed on catalog entries imported by an earlier manifest revision
+MANAGED_KEYS = ("locks", "check")
+
+class ManifestError(Exception):
+    """Raised for a task manifest that can't be used."""
+
+def load_manifest(path=TASKS_FILE):
+    """Reads a task manifest and checks its tasks.
+
+    Raises FileNotFoundError when there is no manifest and ManifestError when it is invalid.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        try:
+            manifest = json.load(file)
+        except ValueError as e:
+            raise ManifestError("%s is not valid JSON: %s" % (path, e))
+    if manifest.get("format") != FORMAT:
+        raise ManifestError("%s has format %s, this version reads format %d" % (path, manifest.get("format"), FORMAT))
+    seen = set()
+    for task in manifest.get("tasks", []):
+        for key in ("id", "name", "cmd"):
+            if not task.get(key):
+                raise ManifestError("A task of %s has no %s" % (path, key))
+        if task["id"] in seen:
+            raise ManifestError("Task %s is listed twice in %s" % (task["id"], path))
+        seen.add(task["id"])
+    return manifest
+
+def task_entry(task, defaults=None):
+    """Turns a manifest task into a catalog entry.
+
+    The entry is tagged with the manifest's default tags, the task group, and "recommended" for
+    tasks the script selects by default, so the CLI can run the same selection with --tag.
+    With ignore_errors the script runs like in the original optimizer: errors are silenced and
+    the entry succeeds, since most tweaks touch settings that only exist on some PCs.
+    """
+    settings = dict(defaults or {})
+    settings.update(task)
+    cmd = settings["cmd"]
+    if settings.get("ignore_errors") and "POWERSHELL" in settings.get("type", "Powershell").upper():
+        cmd = "$ErrorActionPreference = 'SilentlyContinue'\n%s\n$global:LASTEXITCODE = 0; $Error.Clear()" % cmd
+    tags = list(settings.get("tags", []))
+    if settings.get("group"):
+        tags.append(settings["group"])
+    if settings.get("recommended"):
+        tags.append("recommended")
+    entry = {"name": settings["name"], "desc": settings.get("desc", ""), "cmd": cmd, "type": settings.get("type", "Powershell"),
+             "tags": tags, "task": settings["id"]}
+    entry.update({key: settings[key] for key in ENTRY_KEYS if key in settings})
+    return entry
+
+def load_entries(path=TASKS_FILE):
+    """Returns (revision, entries) with a catalog entry for every task of the manifest."""
+    manifest = load_manifest(path)
+    defaults = manifest.get("defaults", {})
+    return manifest.get("revision", 0), [task_entry(task, defaults) for task in manifest.get("tasks", [])]
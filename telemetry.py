@@ -0,0 +1,155 @@
+import sqlite3
+import threading
+import logging
+import os
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# File holding one row per executed command
+TELEMETRY_FILE = "telemetry.db"
+
+# Seconds between two memory samples of a running command
+SAMPLE_INTERVAL = 0.25
+
+class TelemetryStore:
+    """Structured execution records of catalog commands, used for the latency statistics."""
+    def __init__(self, path=TELEMETRY_FILE):
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY, command_id INTEGER, name TEXT NOT NULL, type TEXT, "
+                                    "started REAL NOT NULL, finished REAL NOT NULL, exit_code INTEGER, output_bytes INTEGER, peak_rss INTEGER)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS runs_name ON runs (name)")
+
+    def record(self, command, started, finished, exit_code, output_bytes, peak_rss=None):
+        with self.lock, self.connection:
+            self.connection.execute("INSERT INTO runs (command_id, name, type, started, finished, exit_code, output_bytes, peak_rss) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                    (command.get("id"), command.get("name", command["cmd"]), command.get("type"), started, finished, exit_code, output_bytes, peak_rss))
+
+    def statistics(self):
+        """Returns one dict per command with run count, failures, p50/p95 duration and peak memory.
+
+        Runs are grouped by catalog id, so a renamed command keeps its history under its latest name;
+        commands without an id, e.g. from an imported profile, are grouped by name.
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT command_id, name, finished - started, exit_code, peak_rss FROM runs ORDER BY id").fetchall()
+        by_command = {}
+        for command_id, name, duration, exit_code, peak_rss in rows:
+            key = ("id", command_id) if command_id is not None else ("name", name)
+            entry = by_command.setdefault(key, {"command_id": command_id, "durations": [], "failures": 0, "peak_rss": None})
+            entry["name"] = name
+            entry["durations"].append(duration)
+            if exit_code != 0:
+                entry["failures"] += 1
+            if peak_rss is not None:
+                entry["peak_rss"] = max(peak_rss, entry["peak_rss"] or 0)
+        statistics = []
+        for entry in by_command.values():
+            durations = sorted(entry.pop("durations"))
+            entry["runs"] = len(durations)
+            entry["p50"] = percentile(durations, 50)
+            entry["p95"] = percentile(durations, 95)
+            statistics.append(entry)
+        return statistics
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+def process_tree_rss(pid, include_root=True):
+    """Resident memory in bytes of a process and its children, or None when it can't be measured.
+
+    Without include_root only the children are counted, and None is returned when there are none.
+    """
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            total = process.memory_info().rss if include_root else None
+            for child in process.children(recursive=True):
+                try:
+                    total = (total or 0) + child.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total
+        except psutil.Error:
+            return None
+    # Without psutil the process tree can only be measured where /proc exists
+    total = None
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open("/proc/%d/status" % current) as file:
+                for line in file:
+                    if line.startswith("VmRSS:") and (include_root or current != pid):
+                        total = (total or 0) + int(line.split()[1]) * 1024
+            for task in os.listdir("/proc/%d/task" % current):
+                with open("/proc/%d/task/%s/children" % (current, task)) as file:
+                    pending.extend(int(child) for child in file.read().split())
+        except (OSError, ValueError):
+            pass
+    return total
+
+class RssSampler:
+    """Samples the memory of a running command in the background and keeps the peak.
+
+    The peak stays None when nothing could be measured, which the statistics show as not measured.
+    """
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.peak = None
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self, pid, children_only=False):
+        """Starts sampling pid and its children; with children_only, e.g. for a shared shell, only the children."""
+        self.thread = threading.Thread(target=self._sample, args=(pid, not children_only), daemon=True)
+        self.thread.start()
+
+    def _sample(self, pid, include_root):
+        while True:
+            rss = process_tree_rss(pid, include_root)
+            if rss is not None:
+                self.peak = max(rss, self.peak or 0)
+            if self.stopped.wait(self.interval):
+                break
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+        return self.peak
+
+_store = None
+_store_lock = threading.Lock()
+
+# Set to False to stop recording, e.g. when the telemetry file can't be written
+enabled = True
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TelemetryStore()
+        return _store
+
+def record(command, started, finished, exit_code, output_bytes, peak_rss=None):
+    global enabled
+    if not enabled:
+        return
+    try:
+        get_store().record(command, started, finished, exit_code, output_bytes, peak_rss)
+    except Exception as e:
+        logging.error("Error recording telemetry, recording disabled: %s", e)
+        enabled = False
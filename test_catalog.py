@@ -0,0 +1,35 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+import catalog
+
+def write_manifest(path, revision, tasks):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"format": 1, "revision": revision, "tasks": tasks}, file)
+
+class ImportTasksTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.tasks_path = os.path.join(self.directory, "optimizer_tasks.json")
+        self.tasks = [{"id": "task-%d" % number, "name": "Task %d" % number, "cmd": "Write-Output %d" % number} for number in range(3)]
+        write_manifest(self.tasks_path, 1, self.tasks)
+        self.catalog = catalog.Catalog(os.path.join(self.directory, "commands.db"), legacy_path=None, tasks_path=self.tasks_path)
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.directory)
+
+    def task_ids(self):
+        return {command.get("task") for command in self.catalog.load()}
+
+    def test_removed_task_stays_removed_in_a_new_revision(self):
+        self.assertEqual(self.task_ids(), {"task-0", "task-1", "task-2"})
+        self.catalog.remove(self.catalog.find("Task 1"))
+        write_manifest(self.tasks_path, 2, self.tasks + [{"id": "task-3", "name": "Task 3", "cmd": "Write-Output 3"}])
+        self.catalog.import_tasks(self.tasks_path)
+        self.assertEqual(self.task_ids(), {"task-0", "task-2", "task-3"})
+
+if __name__ == "__main__":
+    unittest.main()
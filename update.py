@@ -2,21 +2,50 @@ import wx
 import requests
 import os
 import subprocess
+import logging
+import download
+import releases
+import json
+import threading
+import delta
 
 class AtualizadorApp(wx.App):
     def OnInit(self):
-        self.VerificarAtualizacao()
+        self.cliente = releases.ReleaseClient()
+        # The check runs in the background, the dialog keeps the main loop alive meanwhile
+        self.verificando = wx.ProgressDialog("Check Updates", "Checking for updates...", style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE)
+        self.verificando.Pulse()
+        releases.check_in_background(self.cliente, self.AoObterRelease)
         return True
 
-    def VerificarAtualizacao(self):
+    def AoObterRelease(self, indice, erro):
+        wx.CallAfter(self.VerificarAtualizacao, indice, erro)
+
+    def VerificarAtualizacao(self, indice, erro):
+        self.verificando.Destroy()
+        if erro is not None:
+            dlg = wx.MessageDialog(None, f"Could not check for updates.\n{erro}", "Update Error", wx.OK | wx.ICON_ERROR)
+            dlg.ShowModal()
+            dlg.Destroy()
+            return
+
+        # Versions are compared by number, never offering an older release
         versao_atual = self.ObterVersaoAtual()
-        ultima_versao_github = self.ObterUltimaVersaoGitHub()
+        self.release = indice.update_for(versao_atual, self.ObterCanal())
 
-        if versao_atual < ultima_versao_github:
-            self.MostrarDialogAtualizacao(ultima_versao_github)
+        if self.release is not None:
+            self.MostrarDialogAtualizacao(self.release["tag_name"])
         else:
             self.MostrarDialogAppAtualizado()
 
+    def ObterCanal(self):
+        try:
+            with open("settings.json", "r") as file:
+                canal = json.load(file).get("update_channel", releases.STABLE)
+        except (FileNotFoundError, ValueError):
+            canal = releases.STABLE
+        return canal if canal in releases.CHANNELS else releases.STABLE
+
     def ObterVersaoAtual(self):
         try:
             with open("version", "r") as file:
@@ -24,14 +53,6 @@ class AtualizadorApp(wx.App):
         except FileNotFoundError:
             return "aurora0"
 
-    def ObterUltimaVersaoGitHub(self):
-        url = "https://api.github.com/repos/azurejoga/Aurora-Windows-Optimizer/releases/latest"
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("tag_name", "aurora0")
-        return "aurora0"
-
     def MostrarDialogAtualizacao(self, ultima_versao_github):
         dlg = wx.MessageDialog(None, f"New version available: {ultima_versao_github}\nDo you want to update?", "Update Available", wx.YES_NO | wx.ICON_INFORMATION)
         result = dlg.ShowModal()
@@ -46,18 +67,112 @@ class AtualizadorApp(wx.App):
         dlg.Destroy()
 
     def AtualizarApp(self, ultima_versao_github):
+        # The manifest, the local file hashes and the installer checksum are all read in the background
+        self.preparando = wx.ProgressDialog("Downloading Update", "Preparing the update...", style=wx.PD_APP_MODAL | wx.PD_AUTO_HIDE)
+        self.preparando.Pulse()
+        pasta = os.getcwd()
+
+        def preparar():
+            # Releases with a manifest are updated file by file, older ones with the full installer
+            try:
+                manifest = delta.fetch_manifest(self.release)
+                if manifest is not None:
+                    delta.cleanup_backups(pasta)
+                    arquivos = delta.changed_files(manifest, pasta)
+                    wx.CallAfter(self.AtualizarArquivos, ultima_versao_github, manifest, pasta, arquivos)
+                    return
+            except (requests.RequestException, ValueError, OSError, delta.UpdateError) as e:
+                logging.error("Error fetching the update manifest, using the installer: %s", e)
+            try:
+                sha256 = download.release_asset_sha256(self.release, "aurora-install.exe")
+            except requests.RequestException:
+                sha256 = None
+            wx.CallAfter(self.AtualizarInstalador, ultima_versao_github, sha256)
+
+        threading.Thread(target=preparar, daemon=True).start()
+
+    def FecharPreparacao(self):
+        if self.preparando:
+            self.preparando.Destroy()
+            self.preparando = None
+
+    def AtualizarArquivos(self, ultima_versao_github, manifest, pasta, arquivos):
+        self.FecharPreparacao()
+        if not arquivos:
+            self.MostrarDialogAppAtualizado()
+            return
+
+        self.progress = wx.ProgressDialog("Downloading Update", f"Downloading {len(arquivos)} changed files of {ultima_versao_github}...", maximum=100, style=wx.PD_APP_MODAL | wx.PD_CAN_ABORT | wx.PD_AUTO_HIDE)
+        self.cancelar = threading.Event()
+
+        def baixar():
+            try:
+                delta.apply_update(manifest, self.release, pasta, arquivos, self.AoProgredirDownload, self.cancelar)
+                erro = None
+            except Exception as e:
+                logging.error("Error applying update: %s", e)
+                erro = e
+            wx.CallAfter(self.FinalizarAtualizacaoArquivos, arquivos, erro)
+
+        threading.Thread(target=baixar, daemon=True).start()
+
+    def FinalizarAtualizacaoArquivos(self, arquivos, erro):
+        self.progress.Destroy()
+        self.progress = None
+        if isinstance(erro, download.DownloadCancelled):
+            return
+        if erro is not None:
+            dlg = wx.MessageDialog(None, f"Failed to update Aurora, no files were changed.\n{erro}", "Update Error", wx.OK | wx.ICON_ERROR)
+        else:
+            dlg = wx.MessageDialog(None, "Aurora was updated ({}). Restart Aurora to use the new version.".format(", ".join(arquivos)), "Update Complete", wx.OK | wx.ICON_INFORMATION)
+        dlg.ShowModal()
+        dlg.Destroy()
+
+    def AtualizarInstalador(self, ultima_versao_github, sha256):
+        self.FecharPreparacao()
         install_url = f"https://github.com/azurejoga/Aurora-Windows-Optimizer/releases/download/{ultima_versao_github}/aurora-install.exe"
         install_file = "aurora-install.exe"
 
-        response = requests.get(install_url)
-        if response.status_code == 200:
-            with open(install_file, "wb") as file:
-                file.write(response.content)
-            subprocess.run([install_file])
+        if sha256 is None:
+            dlg = wx.MessageDialog(None, "This release does not publish a checksum for the installer, so it cannot be verified.\nDo you want to continue?", "Update Warning", wx.YES_NO | wx.ICON_WARNING)
+            result = dlg.ShowModal()
+            dlg.Destroy()
+            if result != wx.ID_YES:
+                return
+
+        # The download runs in the background, the progress dialog keeps the main loop responsive
+        self.progress = wx.ProgressDialog("Downloading Update", f"Downloading {ultima_versao_github}...", maximum=100, style=wx.PD_APP_MODAL | wx.PD_CAN_ABORT | wx.PD_AUTO_HIDE)
+        self.download_thread = download.DownloadThread(install_url, install_file, sha256, on_progress=self.AoProgredirDownload, on_done=self.AoConcluirDownload)
+        self.cancelar = self.download_thread.cancel_event
+        self.download_thread.start()
+
+    def AoProgredirDownload(self, baixados, total):
+        wx.CallAfter(self.AtualizarProgresso, baixados, total)
+
+    def AtualizarProgresso(self, baixados, total):
+        if not self.progress:
+            return
+        if total:
+            continuar, _ = self.progress.Update(min(99, baixados * 100 // total), f"Downloaded {baixados // 1024} of {total // 1024} KB")
         else:
-            dlg = wx.MessageDialog(None, "Failed to download the installer.", "Update Error", wx.OK | wx.ICON_ERROR)
+            continuar, _ = self.progress.Pulse(f"Downloaded {baixados // 1024} KB")
+        if not continuar:
+            self.cancelar.set()
+
+    def AoConcluirDownload(self, install_file, erro):
+        wx.CallAfter(self.FinalizarAtualizacao, install_file, erro)
+
+    def FinalizarAtualizacao(self, install_file, erro):
+        self.progress.Destroy()
+        self.progress = None
+        if isinstance(erro, download.DownloadCancelled):
+            return
+        if erro is not None:
+            dlg = wx.MessageDialog(None, f"Failed to download the installer.\n{erro}", "Update Error", wx.OK | wx.ICON_ERROR)
             dlg.ShowModal()
             dlg.Destroy()
+            return
+        subprocess.Popen([install_file])
 
 if __name__ == '__main__':
     app = AtualizadorApp(False)